@@ -0,0 +1,87 @@
+# file: backend/build_lemma_table.py
+import argparse
+import os
+from collections import Counter
+from pathlib import Path
+from nltk import pos_tag
+from utils.preprocess import LEMMA_TABLE_PATH, Preprocessor, lemmatize, load_stop_words, to_wordnet_tag
+
+STOP_WORDS_PATH = Path(__file__).parent / "data/stop_words/java-keywords-bugs.txt"
+
+
+def count_tokens(texts, stop_words):
+    """
+    Counts the (token, WordNet tag) pairs normalize_text would lemmatize in a corpus of texts,
+    tagging each text in one pos_tag call like Preprocessor.lemmatize_tokens does.
+    """
+    counts = Counter()
+    for text in texts:
+        tokens = Preprocessor.tokenize_text(Preprocessor.remove_special_characters(text))
+        tokens = [token.lower() for token in tokens if token not in stop_words]
+        if tokens:
+            counts.update((token, to_wordnet_tag(tag)) for token, tag in pos_tag(tokens))
+    return counts
+
+
+def build_lemma_table(counts, min_count, max_entries):
+    """
+    Picks the lemmas of the most frequent tokens. Only tokens with the same lemma under every
+    tag they were given in the corpus are kept, so a lookup gives what NLTK would for them.
+    """
+    token_counts = Counter()
+    token_tags = {}
+    for (token, tag), count in counts.items():
+        token_counts[token] += count
+        token_tags.setdefault(token, set()).add(tag)
+
+    table = {}
+    for token, count in token_counts.most_common():
+        if count < min_count or len(table) >= max_entries:
+            break
+        lemmas = {lemmatize(token, tag) for tag in token_tags[token]}
+        if len(lemmas) == 1:
+            table[token] = lemmas.pop()
+    return table
+
+
+def read_repo_files(repo_dirs):
+    for repo_dir in repo_dirs:
+        for path in Path(repo_dir).rglob("*.java"):
+            yield path.read_text(errors="ignore")
+
+
+def read_stored_files():
+    from database.database import Database
+    for document in Database().get_files_collection().find({}, {"code content": 1}):
+        yield document.get("code content") or ""
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Build the lemma table Preprocessor looks tokens up in before falling back to NLTK."
+    )
+    parser.add_argument("repo_dirs", nargs="*", help="Directories of repositories to read .java files from.")
+    parser.add_argument("--from-db", action="store_true", help="Also read the source files stored in MongoDB.")
+    parser.add_argument("--output", default=LEMMA_TABLE_PATH, help="Table path. Defaults to LEMMA_TABLE_PATH.")
+    parser.add_argument("--min-count", type=int, default=5, help="Minimum occurrences of a token. Defaults to 5.")
+    parser.add_argument("--max-entries", type=int, default=50000, help="Maximum table size. Defaults to 50000.")
+    args = parser.parse_args()
+
+    if not args.repo_dirs and not args.from_db:
+        parser.error("Pass repository directories or --from-db")
+    texts = read_repo_files(args.repo_dirs)
+    counts = count_tokens(texts, load_stop_words(STOP_WORDS_PATH))
+    if args.from_db:
+        counts.update(count_tokens(read_stored_files(), load_stop_words(STOP_WORDS_PATH)))
+    table = build_lemma_table(counts, args.min_count, args.max_entries)
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w") as f:
+        f.write(f"# token\tlemma - built by build_lemma_table.py from {sum(counts.values())} tokens\n")
+        f.writelines(f"{token}\t{lemma}\n" for token, lemma in sorted(table.items()))
+    covered = sum(count for (token, _), count in counts.items() if token in table)
+    print(f"Wrote {len(table)} lemmas to {args.output}, covering {covered / max(1, sum(counts.values())):.1%} of tokens")
+
+
+if __name__ == '__main__':
+    main()
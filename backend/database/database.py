@@ -52,6 +52,14 @@ class Database:
         except ConnectionFailure as e:
             self.logger.error(f"Could not connect to MongoDB: {e}")
 
+    def ping(self):
+        """
+        Sends a ping to MongoDB, which opens the connection if it is not open yet.
+
+        :return: The server's reply.
+        """
+        return self.__client.admin.command('ping')
+
     def get_repo_collection(self):
         """
         Gets the reference to the repository collection on MongoDB.
@@ -90,6 +98,25 @@ class Database:
 
         return embeddings
 
+    def get_repo_files_ann_lists(self, repo_id):
+        """
+        Gets the IVF list of every chunk of the files in a repo.
+
+        :return: A dict of route to its list of IVF lists, for files that have them.
+        """
+        results = self.__embeddings.find({"repo_id": repo_id, "ann_lists": {"$exists": True}},
+                                         {"route": 1, "ann_lists": 1})
+        return {document.get("route"): document.get("ann_lists") for document in results}
+
+    def get_repo_files_terms(self, repo_id):
+        """
+        Gets the BM25 term counts of the files in a repo.
+
+        :return: A dict of route to its term counts, for files that have them.
+        """
+        results = self.__embeddings.find({"repo_id": repo_id, "terms": {"$exists": True}}, {"route": 1, "terms": 1})
+        return {document.get("route"): document.get("terms") for document in results}
+
     def get_corpus_files_embeddings(self, repo_id, corpus: list[str]):
         """
         Retrieves the embeddings for the specified files in a repository.
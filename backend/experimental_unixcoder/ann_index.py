@@ -0,0 +1,120 @@
+import os
+import numpy as np
+import torch
+
+try:
+    from experimental_unixcoder.embedding_codec import pack_embeddings, unpack_embeddings  # Try live version
+except ImportError:
+    from embedding_codec import pack_embeddings, unpack_embeddings  # Fallback to testing version
+
+ANN_INDEXES = ["none", "ivf"]
+ANN_INDEX = os.environ.get("ANN_INDEX") or "none"
+# Repositories with fewer chunks are always scored exactly
+ANN_MIN_CHUNKS = int(os.environ.get("ANN_MIN_CHUNKS") or 20000)
+# Number of IVF lists searched for every query chunk
+IVF_PROBES = int(os.environ.get("IVF_PROBES") or 8)
+IVF_ITERATIONS = 10
+IVF_SEED = 0
+ASSIGN_BLOCK_ROWS = 65536  # Bounds the [rows, lists] similarity matrix while assigning chunks
+
+
+def fit_ann_index(embeddings, method=ANN_INDEX, min_chunks=ANN_MIN_CHUNKS):
+    """
+    Fits the IVF centroids of one repository with spherical k-means over its normalized chunks,
+    using about sqrt(chunks) lists.
+
+    Parameters:
+
+    * `embeddings`- the [chunks, hidden] embedding arrays of the repository's files.
+    * `method`- one of ANN_INDEXES. "ivf" builds an inverted file index and "none" disables it.
+    * `min_chunks`- repositories with fewer chunks get no index, as a full scan is fast enough.
+
+    Returns the [lists, hidden] float32 centroids, or None if no index is used.
+    """
+    if method not in ANN_INDEXES:
+        raise ValueError(f"Unknown ANN index '{method}', expected one of {ANN_INDEXES}")
+    matrices = [np.asarray(e, dtype=np.float32) for e in embeddings if e is not None and len(e)]
+    if method == "none" or not matrices:
+        return None
+    chunks = torch.nn.functional.normalize(torch.from_numpy(np.concatenate(matrices)), dim=1)
+    if len(chunks) < max(min_chunks, 1):
+        return None
+
+    n_lists = max(1, round(len(chunks) ** 0.5))
+    generator = torch.Generator().manual_seed(IVF_SEED)
+    centroids = chunks[torch.randperm(len(chunks), generator=generator)[:n_lists]].clone()
+    for _ in range(IVF_ITERATIONS):
+        assignments = _nearest_lists(chunks, centroids)
+        sums = torch.zeros_like(centroids).index_add_(0, assignments, chunks)
+        counts = torch.bincount(assignments, minlength=n_lists)
+        # A list that lost all of its chunks keeps its previous centroid
+        centroids = torch.where((counts > 0).unsqueeze(1), torch.nn.functional.normalize(sums, dim=1), centroids)
+    return centroids.numpy()
+
+
+def assign_lists(embeddings, centroids):
+    """
+    Returns the IVF list of every chunk of a file's [chunks, hidden] embeddings as a list of ints,
+    or None if the repository has no index.
+    """
+    if centroids is None or embeddings is None:
+        return None
+    matrix = np.asarray(embeddings, dtype=np.float32)
+    if not len(matrix):
+        return []
+    return _nearest_lists(torch.from_numpy(matrix), torch.as_tensor(centroids)).tolist()
+
+
+def pack_ann_index(centroids, method=ANN_INDEX):
+    """ Packs the IVF centroids for storage in the repository document """
+    if centroids is None:
+        return None
+    return {"method": method, "lists": len(centroids), "centroids": pack_embeddings(centroids, "fp32")}
+
+
+def unpack_ann_index(document):
+    """ Unpacks the centroids stored with pack_ann_index, or returns None if there is no index """
+    if not document:
+        return None
+    return unpack_embeddings(document["centroids"]).numpy()
+
+
+class IVFIndex:
+    """
+    Inverted file index over the rows of a RankingMatrix. Rows are grouped by their nearest
+    centroid, and a query only scores the rows in the lists nearest to any of its chunks.
+
+    Parameters:
+
+    * `centroids`- the [lists, hidden] centroids from fit_ann_index.
+    * `row_lists`- the list of every row of the ranking matrix.
+    * `probes`- the number of lists searched for every query chunk.
+    """
+
+    def __init__(self, centroids, row_lists, probes=IVF_PROBES):
+        self.centroids = torch.as_tensor(centroids, dtype=torch.float32)
+        self.row_lists = torch.as_tensor(row_lists, dtype=torch.long)
+        self.probes = probes
+        # Rows sorted by list, with offsets[i]:offsets[i + 1] holding the rows of list i
+        self.order = torch.argsort(self.row_lists, stable=True)
+        counts = torch.bincount(self.row_lists, minlength=len(self.centroids))
+        self.offsets = torch.cat([torch.zeros(1, dtype=torch.long), counts.cumsum(0)]).tolist()
+
+    @property
+    def nbytes(self):
+        return (self.centroids.numel() * 4) + (self.row_lists.numel() + self.order.numel()) * 8
+
+    def candidate_rows(self, query_matrix):
+        """ Returns the sorted rows in the lists nearest to any chunk of a normalized query """
+        probes = min(self.probes, len(self.centroids))
+        lists = (query_matrix.float().cpu() @ self.centroids.T).topk(probes, dim=1).indices.unique().tolist()
+        rows = torch.cat([self.order[self.offsets[i]:self.offsets[i + 1]] for i in lists])
+        return rows.sort().values
+
+    def subset(self, rows):
+        """ Returns the index of the rows selected by a boolean mask """
+        return IVFIndex(self.centroids, self.row_lists[rows.cpu()], self.probes)
+
+
+def _nearest_lists(chunks, centroids):
+    return torch.cat([(block @ centroids.T).argmax(dim=1) for block in chunks.split(ASSIGN_BLOCK_ROWS)])
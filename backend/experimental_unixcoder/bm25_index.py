@@ -0,0 +1,185 @@
+import os
+from collections import Counter
+import torch
+
+# 1 stores the term counts of every file at /initialization and patches, so repos get a BM25 index
+BM25_INDEX = int(os.environ.get("BM25_INDEX") or 0)
+# Number of BM25 candidates the dense scores are restricted to; 0 scores every file densely
+BM25_CANDIDATES = int(os.environ.get("BM25_CANDIDATES") or 0)
+# Weight of the max-normalized BM25 score in the fused score; 0 ranks by the dense score alone
+BM25_WEIGHT = float(os.environ.get("BM25_WEIGHT") or 0)
+# Encoder queue length from which /report ranks by BM25 alone instead of waiting for the encoder; 0 never does
+BM25_FALLBACK_QUEUE = int(os.environ.get("BM25_FALLBACK_QUEUE") or 0)
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+
+def term_counts(normalized_text):
+    """
+    Counts the terms of a text normalized by Preprocessor.normalize_text. Terms that MongoDB
+    does not accept as keys are dropped. Returns None for missing texts.
+    """
+    if normalized_text is None:
+        return None
+    return dict(Counter(term for term in normalized_text.split() if "." not in term and not term.startswith("$")))
+
+
+class BM25Index:
+    """
+    Okapi BM25 index over the files of a RankingMatrix, with the postings of every term stored
+    contiguously so a query is scored with one index_add over the postings of its terms.
+
+    Parameters:
+
+    * `vocabulary`- the terms, in the order of their postings.
+    * `term_offsets`- a [terms + 1] tensor; the postings of term i are term_offsets[i]:term_offsets[i + 1].
+    * `posting_files`- the position of the file of every posting.
+    * `posting_counts`- how often the term of every posting occurs in its file.
+    * `doc_lengths`- the number of terms of every file.
+    * `idf`- the inverse document frequency of every term.
+    * `avg_length`- the average number of terms per indexed file.
+    """
+
+    def __init__(self, vocabulary, term_offsets, posting_files, posting_counts, doc_lengths, idf, avg_length,
+                 k1=BM25_K1, b=BM25_B):
+        self.vocabulary = vocabulary
+        self.term_ids = {term: i for i, term in enumerate(vocabulary)}
+        self.term_offsets = term_offsets
+        self.posting_files = posting_files
+        self.posting_counts = posting_counts
+        self.doc_lengths = doc_lengths
+        self.idf = idf
+        self.avg_length = avg_length
+        self.k1 = k1
+        self.b = b
+
+    @classmethod
+    def from_term_counts(cls, file_terms):
+        """
+        Builds the index of a list with the term counts of every file, as term_counts returns
+        them, or None for files whose terms were not stored.
+        """
+        postings = {}
+        for position, terms in enumerate(file_terms):
+            for term, count in (terms or {}).items():
+                postings.setdefault(term, []).append((position, count))
+        doc_lengths = torch.tensor([sum((terms or {}).values()) for terms in file_terms], dtype=torch.float32)
+
+        vocabulary = sorted(postings)
+        lengths = [len(postings[term]) for term in vocabulary]
+        term_offsets = torch.tensor([0] + lengths, dtype=torch.long).cumsum(0)
+        flat = [posting for term in vocabulary for posting in postings[term]]
+        posting_files = torch.tensor([position for position, _ in flat], dtype=torch.long)
+        posting_counts = torch.tensor([count for _, count in flat], dtype=torch.float32)
+
+        idf, avg_length = _term_statistics(torch.tensor(lengths, dtype=torch.float32), doc_lengths)
+        return cls(vocabulary, term_offsets, posting_files, posting_counts, doc_lengths, idf, avg_length)
+
+    @property
+    def nbytes(self):
+        tensors = [self.term_offsets, self.posting_files, self.posting_counts, self.doc_lengths, self.idf]
+        return sum(t.numel() * t.element_size() for t in tensors) + sum(len(term) + 64 for term in self.vocabulary)
+
+    def scores(self, query_terms):
+        """
+        Scores every file for the term counts of a query. Returns a float32 [files] tensor that is
+        0 for files without any query term.
+        """
+        scores = torch.zeros(len(self.doc_lengths))
+        term_ids = [self.term_ids[term] for term in (query_terms or {}) if term in self.term_ids]
+        if not term_ids:
+            return scores
+
+        # Gather the postings of all query terms, weighting each by its term's idf and query count
+        slices = [torch.arange(self.term_offsets[i], self.term_offsets[i + 1]) for i in term_ids]
+        weights = torch.cat([torch.full((len(s),), self.idf[i].item() * query_terms[self.vocabulary[i]])
+                             for i, s in zip(term_ids, slices)])
+        postings = torch.cat(slices)
+        files = self.posting_files[postings]
+        counts = self.posting_counts[postings]
+
+        norm = self.k1 * (1 - self.b + self.b * self.doc_lengths[files] / max(self.avg_length, 1e-6))
+        return scores.index_add_(0, files, weights * counts * (self.k1 + 1) / (counts + norm))
+
+    def patch(self, new_index, n_files, file_terms):
+        """
+        Returns the index after some files were changed, with the postings of the changed files
+        replaced and the term statistics of the repository updated.
+
+        * `new_index`- maps the position of every indexed file to its new position, or -1 for
+          removed and changed files, whose postings are dropped.
+        * `n_files`- the number of files after the change.
+        * `file_terms`- a dict of the new position of every changed file to its term counts.
+        """
+        new_index = new_index.cpu()
+        kept = new_index[self.posting_files] >= 0
+        posting_terms = torch.repeat_interleave(torch.arange(len(self.vocabulary)), self.term_offsets.diff())[kept]
+        posting_files = new_index[self.posting_files[kept]]
+        posting_counts = self.posting_counts[kept]
+        doc_lengths = torch.zeros(n_files)
+        doc_lengths[new_index[new_index >= 0]] = self.doc_lengths[new_index >= 0]
+
+        # New terms are appended to the vocabulary, and the postings regrouped by term
+        vocabulary = list(self.vocabulary)
+        term_ids = dict(self.term_ids)
+        added = [(term_ids.setdefault(term, len(term_ids)), position, count)
+                 for position, terms in file_terms.items() for term, count in (terms or {}).items()]
+        vocabulary.extend(list(term_ids)[len(vocabulary):])
+        for position, terms in file_terms.items():
+            doc_lengths[position] = sum((terms or {}).values())
+        if added:
+            posting_terms = torch.cat([posting_terms, torch.tensor([term for term, _, _ in added])])
+            posting_files = torch.cat([posting_files, torch.tensor([position for _, position, _ in added])])
+            posting_counts = torch.cat([posting_counts, torch.tensor([count for _, _, count in added],
+                                                                     dtype=torch.float32)])
+        order = torch.argsort(posting_terms, stable=True)
+        counts = torch.bincount(posting_terms, minlength=len(vocabulary))
+        term_offsets = torch.cat([torch.zeros(1, dtype=torch.long), counts.cumsum(0)])
+
+        idf, avg_length = _term_statistics(counts.float(), doc_lengths)
+        return BM25Index(vocabulary, term_offsets, posting_files[order], posting_counts[order], doc_lengths, idf,
+                         avg_length, self.k1, self.b)
+
+    def subset(self, new_index):
+        """
+        Returns the index of a subset of the files. new_index maps the position of every file to
+        its position in the subset, or -1 for files left out. Term statistics stay those of the
+        whole repository, so subset scores equal the full scores.
+        """
+        new_index = new_index.cpu()
+        kept = new_index[self.posting_files] >= 0
+        posting_terms = torch.repeat_interleave(torch.arange(len(self.vocabulary)), self.term_offsets.diff())
+        counts = torch.bincount(posting_terms[kept], minlength=len(self.vocabulary))
+        positions = new_index >= 0
+        return BM25Index(self.vocabulary, torch.cat([torch.zeros(1, dtype=torch.long), counts.cumsum(0)]),
+                         new_index[self.posting_files[kept]], self.posting_counts[kept], self.doc_lengths[positions],
+                         self.idf, self.avg_length, self.k1, self.b)
+
+
+def _term_statistics(document_frequency, doc_lengths):
+    # Files without terms do not count as documents of the repository
+    indexed = int((doc_lengths > 0).sum())
+    idf = torch.log(1 + (indexed - document_frequency + 0.5) / (document_frequency + 0.5))
+    return idf, doc_lengths.sum().item() / max(1, indexed)
+
+
+def fuse_scores(dense, lexical, weight=BM25_WEIGHT):
+    """
+    Fuses [queries, files] dense scores with BM25 scores normalized by their per-query maximum.
+    Files that were not scored densely (-inf) stay -inf.
+    """
+    if weight <= 0:
+        return dense
+    lexical = (lexical / lexical.max(dim=1, keepdim=True).values.clamp(min=1e-6)).to(dense.device)
+    return torch.where(dense == float('-inf'), dense, (1 - weight) * dense + weight * lexical)
+
+
+def lexical_candidates(lexical, candidates=BM25_CANDIDATES):
+    """
+    Returns a [queries, files] mask of the top candidates BM25 files of every query, or None if
+    every file is a candidate.
+    """
+    if candidates <= 0 or candidates >= lexical.shape[1]:
+        return None
+    mask = torch.zeros(lexical.shape, dtype=torch.bool)
+    return mask.scatter_(1, torch.topk(lexical, candidates, dim=1).indices, True)
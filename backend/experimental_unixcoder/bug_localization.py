@@ -1,87 +1,225 @@
+import os
+import threading
+import numpy as np
 import torch
 
 try:
-    from experimental_unixcoder.unixcoder import UniXcoder  # Try live version
+    from experimental_unixcoder.unixcoder import UniXcoderEncoder  # Try live version
+    from experimental_unixcoder.encoder_backends import ENCODER_BACKEND, create_backend
+    from experimental_unixcoder.embedding_cache import EMBEDDING_CACHE_MB, EMBEDDING_CACHE_PATH, EmbeddingCache
+    from experimental_unixcoder.embedding_codec import EMBEDDING_PRECISION
+    from experimental_unixcoder.ranking import RankingMatrix
 except ImportError:
-    from unixcoder import UniXcoder  # Fallback to testing version
+    from unixcoder import UniXcoderEncoder  # Fallback to testing version
+    from encoder_backends import ENCODER_BACKEND, create_backend
+    from embedding_cache import EMBEDDING_CACHE_MB, EMBEDDING_CACHE_PATH, EmbeddingCache
+    from embedding_codec import EMBEDDING_PRECISION
+    from ranking import RankingMatrix
+
+MODEL_NAME = "microsoft/unixcoder-base"
+MAX_TOKENS = 512  # UniXcoder input limit, including the special tokens
+ENCODE_BATCH_SIZE = int(os.environ.get("ENCODE_BATCH_SIZE") or 16)
+INFERENCE_MODES = ["fp32", "int8"]
+INFERENCE_MODE = os.environ.get("INFERENCE_MODE") or "fp32"
 
 
 class BugLocalization:
-    def __init__(self):
+    def __init__(self, batch_size=ENCODE_BATCH_SIZE, inference_mode=INFERENCE_MODE, backend=ENCODER_BACKEND,
+                 cache_path=EMBEDDING_CACHE_PATH, cache_mb=EMBEDDING_CACHE_MB):
+        if inference_mode not in INFERENCE_MODES:
+            raise ValueError(f"Unknown inference mode '{inference_mode}', expected one of {INFERENCE_MODES}")
+        if inference_mode == "int8" and backend == "export":
+            raise ValueError("The export backend does not support int8 quantized models")
+
         # Set up device and initialize the UniXcoder model
-        self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+        # int8 dynamic quantization only has CPU kernels, so it always runs on the CPU
+        use_cuda = torch.cuda.is_available() and inference_mode == "fp32"
+        self.device = torch.device("cuda" if use_cuda else "cpu")
         # print("CUDA is available" if torch.cuda.is_available() else "CUDA is not available")
-        self.model = UniXcoder("microsoft/unixcoder-base")
+        self.model = UniXcoderEncoder(MODEL_NAME)
         self.model.to(self.device)
+        self.batch_size = batch_size
+        self.inference_mode = inference_mode
+
+        if inference_mode == "int8":
+            self.quantize()
+
+        # The backend decides how forward passes run: eager, torch.compile or exported graphs.
+        # The compiled and exported backends and the Rust tokenizer are not safe to call from
+        # several threads at once, so the encoder service's worker and direct callers share this lock
+        self.encode_lock = threading.RLock()
+        self.backend = create_backend(backend, self.model, self.device, batch_size=batch_size,
+                                      fingerprint=self.fingerprint())
+
+        # Embeddings of previously seen texts are looked up instead of encoded again
+        self.cache = EmbeddingCache(cache_path, cache_mb, self.fingerprint()) if cache_mb > 0 else None
 
-        # Encoding for Long Texts
+    def fingerprint(self):
+        """
+        Identifies everything that changes the embeddings of a text: the model, the inference
+        mode and the chunking. The encoder backend is left out, as all backends produce the same
+        embeddings.
+        """
+        return f"{MODEL_NAME}|{self.inference_mode}|windows-{MAX_TOKENS}"
+
+    def quantize(self):
+        """
+        Applies dynamic int8 quantization to the linear layers of the RoBERTa encoder.
+        Weights are stored as int8 and activations are quantized on the fly, which speeds
+        up CPU inference at a small cost in accuracy.
+        """
+        self.model.model = torch.ao.quantization.quantize_dynamic(
+            self.model.model, {torch.nn.Linear}, dtype=torch.qint8
+        )
+
+    # Encoding for Long Texts
     def encode_text(self, text, verbose=False):
         """
-        Encodes long text by splitting it into chunks of roughly 500 characters
-        (before tokenization). Each chunk is tokenized and encoded individually.
-        Returns a list of embeddings (as lists), one for each chunk.
+        Encodes long text by tokenizing it once and splitting the tokens into windows
+        that fill the model's 512-token limit. Each window is encoded as one chunk.
+        Returns a float32 array of shape [chunks, hidden] with one embedding per chunk.
         """
-        chunk_size = 500  # Split by 500 characters as an example
-        embeddings = []
+        return self.encode_texts([text], verbose=verbose)[0]
 
-        # Split text into roughly 500-character chunks
-        for i in range(0, len(text), chunk_size):
-            text_chunk = text[i:i + chunk_size]
-            if verbose:
-                print(f"Processing text chunk {i // chunk_size + 1}")  # Debug print
+    def encode_texts(self, texts, verbose=False, batch_size=None):
+        """
+        Encodes many long texts at once. The token windows (chunks) of every text are
+        sorted by length, so each batch only holds chunks of similar length, padded to the
+        longest chunk of the batch and encoded in a single forward pass. Texts found in the
+        embedding cache are not encoded again.
+
+        Parameters:
+        - texts: A list of strings to encode.
+        - batch_size: The number of chunks per forward pass. Defaults to ENCODE_BATCH_SIZE.
+
+        Returns:
+        - A list with one entry per text, each a float32 array of shape [chunks, hidden] with
+          one normalized embedding per chunk. The embeddings match the ones produced by encoding
+          each chunk on its own.
+        """
+        if self.cache is None:
+            return self._encode_uncached(texts, verbose, batch_size)[0]
+
+        # Only encode the texts that are not in the embedding cache
+        embeddings = self.cache.get_many(texts)
+        missing = [i for i, text_embeddings in enumerate(embeddings) if text_embeddings is None]
+        if verbose:
+            print(f"Embedding cache: {len(texts) - len(missing)} hits, {len(missing)} misses")  # Debug print
+        if not missing:
+            return embeddings
+
+        encoded, incomplete = self._encode_uncached([texts[i] for i in missing], verbose, batch_size)
+        for i, text_embeddings in zip(missing, encoded):
+            embeddings[i] = text_embeddings
+
+        # Texts with chunks that failed to encode are retried next time instead of being cached
+        complete = [j for j in range(len(missing)) if j not in incomplete]
+        self.cache.put_many([texts[missing[j]] for j in complete], [encoded[j] for j in complete])
+        return embeddings
 
-            # Tokenize the chunk
-            tokens = self.model.tokenize([text_chunk], mode="<encoder-only>")[0]
-            source_ids = torch.tensor([tokens]).to(self.device)
-            
-            # Get model output
+    def _encode_uncached(self, texts, verbose=False, batch_size=None):
+        """
+        Encodes texts with the model. Returns the per-text embeddings and the set of text
+        indices where at least one chunk failed to encode.
+        """
+        batch_size = batch_size or self.batch_size
+
+        # Tokenize every text once and split it into token windows
+        chunk_tokens = []
+        with self.encode_lock:
+            text_windows = self.model.tokenize_windows(texts, mode="<encoder-only>", max_length=MAX_TOKENS)
+        for windows in text_windows:
+            chunk_tokens.extend(windows)
+
+        # Sort chunks by token length so that padding within a batch stays minimal
+        order = sorted(range(len(chunk_tokens)), key=lambda i: len(chunk_tokens[i]))
+        chunk_embeddings = np.empty((len(chunk_tokens), self.model.config.hidden_size), dtype=np.float32)
+        failed = np.zeros(len(chunk_tokens), dtype=bool)
+
+        for start in range(0, len(order), batch_size):
+            batch = order[start:start + batch_size]
+            if verbose:
+                print(f"Processing chunk batch {start // batch_size + 1} "
+                      f"({len(batch)} chunks, {len(chunk_tokens[batch[-1]])} tokens)")  # Debug print
             try:
-                _, embedding = self.model(source_ids)
-                norm_embedding = torch.nn.functional.normalize(embedding, p=2, dim=1)
-                embeddings.append(norm_embedding.tolist())  # Store normalized embedding as list
+                chunk_embeddings[batch] = self._encode_batch([chunk_tokens[i] for i in batch])
             except Exception as e:
-                print(f"Error processing chunk {i // chunk_size + 1}: {e}")
-                continue
-        print(embeddings)
-        return embeddings
+                print(f"Error processing chunk batch {start // batch_size + 1}: {e}")
+                # Retry chunk by chunk so that a single bad chunk does not drop the whole batch
+                for i in batch:
+                    try:
+                        chunk_embeddings[i] = self._encode_batch([chunk_tokens[i]])[0]
+                    except Exception as e:
+                        print(f"Error processing chunk {i + 1}: {e}")
+                        failed[i] = True
+
+        # Split the chunk matrix per text; the chunks of each text are consecutive rows
+        embeddings = []
+        incomplete = set()
+        ends = np.cumsum([len(windows) for windows in text_windows])
+        for text_index, end in enumerate(ends):
+            start = end - len(text_windows[text_index])
+            if failed[start:end].any():
+                incomplete.add(text_index)
+                embeddings.append(chunk_embeddings[start:end][~failed[start:end]])
+            else:
+                embeddings.append(chunk_embeddings[start:end])
+        return embeddings, incomplete
+
+    def _encode_batch(self, token_batch):
+        """
+        Encodes a batch of token id lists of varying length in one forward pass of the backend.
+        Padding tokens are masked out by UniXcoder, so each row matches its unpadded encoding.
+        Forward passes of concurrent callers run one at a time.
+        Returns a float32 array of shape [batch, hidden].
+        """
+        with self.encode_lock:
+            return self.backend.encode_ids(token_batch).float().cpu().numpy()
 
 
     # File Ranking for Bug Localization
-    def rank_files(self, query_embeddings, db_embeddings):
+    def rank_files(self, query_embeddings, db_embeddings, precision=EMBEDDING_PRECISION, top_k=None, query_terms=None):
         """
         Ranks files based on similarity to the query embeddings.
+        All file chunks are stacked into one matrix and scored with a single matrix product,
+        then each file gets the best score of its chunks.
 
         Parameters:
-        - query_embeddings: A list of embeddings (as lists) for the query (bug report).
+        - query_embeddings: A [chunks, hidden] array of embeddings for the query (bug report).
         - db_embeddings: A list of tuples, where each tuple contains (file_id, embeddings)
-                         where embeddings is a list of embeddings (as lists) for that file.
+                         where embeddings is a [chunks, hidden] array of embeddings for that file,
+                         or its packed document as stored in the database. A RankingMatrix that
+                         was built before, e.g. a cached one, is ranked as is.
+        - precision: The precision the similarities are computed in: fp32, fp16 or bf16.
+        - top_k: If set, only the top_k most similar files are selected and returned.
+        - query_terms: The term counts of the query, used if the RankingMatrix has a BM25 index.
 
         Returns:
         - A sorted list of (file_id, max_similarity_score) tuples in descending order of similarity.
         """
-        similarities = []
-
-        for file_id, file_embeddings in db_embeddings:
-            max_similarity = float('-inf')
-
-            # Convert query embeddings and file embeddings from lists back to tensors
-            for query_embedding in query_embeddings:
-                query_tensor = torch.tensor(query_embedding, device=self.device)
-                for file_embedding in file_embeddings:
-                    file_tensor = torch.tensor(file_embedding, device=self.device)
-
-                    # Compute similarity
-                    similarity = torch.nn.functional.cosine_similarity(
-                        query_tensor, file_tensor, dim=1
-                    ).item()
+        if isinstance(db_embeddings, RankingMatrix):
+            return db_embeddings.rank(query_embeddings, top_k, query_terms)
+        ranking_matrix = RankingMatrix.from_embeddings(db_embeddings, precision, self.device)
+        return ranking_matrix.rank(query_embeddings, top_k)
 
-                    if similarity > max_similarity:
-                        max_similarity = similarity
+    def rank_files_many(self, queries, db_embeddings, precision=EMBEDDING_PRECISION, top_k=None, query_terms=None):
+        """
+        Ranks files for many queries at once, scoring the stacked chunks of all queries with one
+        matrix product instead of one per query.
 
-            similarities.append((file_id, max_similarity))
+        Parameters:
+        - queries: A list of [chunks, hidden] arrays of embeddings, one per query (bug report).
+        - db_embeddings: The files' embeddings or a RankingMatrix, as rank_files accepts them.
+        - precision: The precision the similarities are computed in: fp32, fp16 or bf16.
+        - top_k: If set, only the top_k most similar files are selected and returned per query.
+        - query_terms: The term counts of every query, used if the RankingMatrix has a BM25 index.
 
-        similarities.sort(key=lambda x: x[1], reverse=True)
-        return similarities
+        Returns:
+        - One sorted list of (file_id, max_similarity_score) tuples per query.
+        """
+        if not isinstance(db_embeddings, RankingMatrix):
+            db_embeddings = RankingMatrix.from_embeddings(db_embeddings, precision, self.device)
+        return db_embeddings.rank_many(queries, top_k, query_terms)
 
 if __name__ == "__main__":
     # Create an instance of the BugLocalization class
@@ -0,0 +1,140 @@
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_CACHE_PATH = os.environ.get("EMBEDDING_CACHE_PATH") or "embedding_cache.sqlite3"
+EMBEDDING_CACHE_MB = int(os.environ.get("EMBEDDING_CACHE_MB") or 512)  # 0 disables the cache
+
+
+class EmbeddingCache:
+    """
+    Persistent cache of chunk embeddings keyed by a hash of the preprocessed text and a
+    fingerprint of the model configuration. Entries live in a SQLite file, so they survive
+    restarts and are shared by every process on the host. When the cache grows beyond
+    max_mb, the least recently used entries are evicted.
+
+    :param path: Path of the SQLite file.
+    :param max_mb: Maximum size of the stored embeddings in megabytes.
+    :param fingerprint: Identifies the model and settings that produced the embeddings.
+    """
+
+    def __init__(self, path, max_mb, fingerprint):
+        self.path = path
+        self.max_bytes = max_mb * 1024 * 1024
+        self.fingerprint = fingerprint
+        self.hits = 0
+        self.misses = 0
+        self.__lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.__connection = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self.__connection.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            "key TEXT PRIMARY KEY, dim INTEGER, value BLOB, size INTEGER, last_used REAL)"
+        )
+        self.__connection.execute("CREATE INDEX IF NOT EXISTS embeddings_last_used ON embeddings (last_used)")
+        self.__connection.commit()
+
+    def key(self, text):
+        """
+        Gets the cache key of a preprocessed text.
+
+        :param text: The preprocessed text.
+        :return: A hex digest of the model fingerprint and the text.
+        """
+        return hashlib.sha256(f"{self.fingerprint}\0{text}".encode("utf-8")).hexdigest()
+
+    def get_many(self, texts):
+        """
+        Looks up the embeddings of many preprocessed texts.
+
+        :param texts: The preprocessed texts.
+        :return: A list with, for each text, its [chunks, hidden] embeddings array or None on a miss.
+        """
+        keys = [self.key(text) for text in texts]
+        found = {}
+        with self.__lock:
+            # Stay well below SQLite's limit on query parameters
+            for start in range(0, len(keys), 500):
+                batch = keys[start:start + 500]
+                rows = self.__connection.execute(
+                    f"SELECT key, dim, value FROM embeddings WHERE key IN ({','.join('?' * len(batch))})", batch
+                ).fetchall()
+                for key, dim, value in rows:
+                    found[key] = (dim, value)
+            if found:
+                now = time.time()
+                self.__connection.executemany(
+                    "UPDATE embeddings SET last_used = ? WHERE key = ?", [(now, key) for key in found]
+                )
+                self.__connection.commit()
+
+        results = []
+        for key in keys:
+            if key in found:
+                dim, value = found[key]
+                results.append(_unpack(dim, value))
+            else:
+                results.append(None)
+        self.hits += len([result for result in results if result is not None])
+        self.misses += len([result for result in results if result is None])
+        return results
+
+    def put_many(self, texts, embeddings):
+        """
+        Stores the embeddings of many preprocessed texts and evicts the least recently used
+        entries if the cache exceeds its size.
+
+        :param texts: The preprocessed texts.
+        :param embeddings: For each text, its [chunks, hidden] embeddings array.
+        """
+        now = time.time()
+        rows = []
+        for text, text_embeddings in zip(texts, embeddings):
+            dim, value = _pack(text_embeddings)
+            rows.append((self.key(text), dim, value, len(value), now))
+
+        with self.__lock:
+            self.__connection.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, dim, value, size, last_used) VALUES (?, ?, ?, ?, ?)", rows
+            )
+            self.__evict()
+            self.__connection.commit()
+
+    def __evict(self):
+        total_bytes = self.__connection.execute("SELECT COALESCE(SUM(size), 0) FROM embeddings").fetchone()[0]
+        if total_bytes <= self.max_bytes:
+            return
+
+        # Evict down to 90% of the size so that every insert does not trigger another eviction
+        excess = total_bytes - int(self.max_bytes * 0.9)
+        evicted = 0
+        for key, size in self.__connection.execute("SELECT key, size FROM embeddings ORDER BY last_used").fetchall():
+            if excess <= 0:
+                break
+            self.__connection.execute("DELETE FROM embeddings WHERE key = ?", (key,))
+            excess -= size
+            evicted += 1
+        logger.info(f"Evicted {evicted} embeddings from the embedding cache.")
+
+
+def _pack(text_embeddings):
+    """ Packs a [chunks, hidden] array of embeddings into (hidden, float32 bytes) """
+    array = np.ascontiguousarray(text_embeddings, dtype=np.float32)
+    dim = array.shape[-1] if array.ndim == 2 else 0
+    return dim, array.tobytes()
+
+
+def _unpack(dim, value):
+    """ Unpacks float32 bytes into a [chunks, hidden] array of embeddings """
+    if not dim:
+        return np.empty((0, 0), dtype=np.float32)
+    return np.frombuffer(bytearray(value), dtype=np.float32).reshape(-1, dim)
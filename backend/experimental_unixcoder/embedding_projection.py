@@ -0,0 +1,78 @@
+import os
+import numpy as np
+import torch
+
+try:
+    from experimental_unixcoder.embedding_codec import pack_embeddings, unpack_embeddings  # Try live version
+except ImportError:
+    from embedding_codec import pack_embeddings, unpack_embeddings  # Fallback to testing version
+
+PROJECTION_METHODS = ["none", "pca", "random"]
+EMBEDDING_PROJECTION = os.environ.get("EMBEDDING_PROJECTION") or "none"
+PROJECTION_DIM = int(os.environ.get("PROJECTION_DIM") or 128)
+PROJECTION_SEED = 0
+
+
+def fit_projection(embeddings, method=EMBEDDING_PROJECTION, dim=PROJECTION_DIM):
+    """
+    Fits a projection from the embedding dimension down to dim for one repository.
+
+    Parameters:
+
+    * `embeddings`- the [chunks, hidden] embedding arrays of the repository's files.
+    * `method`- one of PROJECTION_METHODS. "pca" keeps the top principal directions of the
+      repository's chunks, "random" is a seeded Gaussian projection and "none" disables it.
+    * `dim`- the target dimension.
+
+    Returns the [hidden, dim] float32 projection matrix, or None if no projection is used.
+    """
+    if method not in PROJECTION_METHODS:
+        raise ValueError(f"Unknown embedding projection '{method}', expected one of {PROJECTION_METHODS}")
+    matrices = [np.asarray(e, dtype=np.float32) for e in embeddings if e is not None and len(e)]
+    if method == "none" or not matrices:
+        return None
+
+    hidden = matrices[0].shape[1]
+    dim = min(dim, hidden)
+
+    if method == "random":
+        generator = torch.Generator().manual_seed(PROJECTION_SEED)
+        return (torch.randn(hidden, dim, generator=generator) / dim ** 0.5).numpy()
+
+    # The top eigenvectors of the uncentered second moment matrix best preserve the dot
+    # products between chunks, which is what cosine ranking compares
+    second_moment = torch.zeros(hidden, hidden, dtype=torch.float64)
+    for matrix in matrices:
+        matrix = torch.from_numpy(matrix).double()
+        second_moment += matrix.T @ matrix
+    _, eigenvectors = torch.linalg.eigh(second_moment)
+    return eigenvectors[:, -dim:].flip(1).float().numpy()
+
+
+def project_embeddings(embeddings, projection):
+    """
+    Projects a [chunks, hidden] embedding array with a projection from fit_projection and
+    normalizes the result again. Returns the embeddings unchanged if projection is None.
+    """
+    if projection is None or embeddings is None:
+        return embeddings
+    matrix = np.asarray(embeddings, dtype=np.float32)
+    if not len(matrix):
+        return np.empty((0, projection.shape[1]), dtype=np.float32)
+    projected = matrix @ projection
+    projected /= np.maximum(np.linalg.norm(projected, axis=1, keepdims=True), 1e-12)
+    return projected
+
+
+def pack_projection(projection, method=EMBEDDING_PROJECTION):
+    """ Packs a projection matrix for storage in the repository document """
+    if projection is None:
+        return None
+    return {"method": method, "dim": projection.shape[1], "matrix": pack_embeddings(projection, "fp32")}
+
+
+def unpack_projection(document):
+    """ Unpacks a projection stored with pack_projection, or returns None if there is none """
+    if not document:
+        return None
+    return unpack_embeddings(document["matrix"]).numpy()
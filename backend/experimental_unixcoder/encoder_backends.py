@@ -0,0 +1,204 @@
+import hashlib
+import inspect
+import logging
+import os
+import threading
+import torch
+
+try:
+    from experimental_unixcoder.model_store import MODEL_DIR  # Try live version
+except ImportError:
+    from model_store import MODEL_DIR  # Fallback to testing version
+
+logger = logging.getLogger(__name__)
+
+ENCODER_BACKENDS = ["eager", "compile", "export"]
+ENCODER_BACKEND = os.environ.get("ENCODER_BACKEND") or "eager"
+EXPORT_DIR = os.environ.get("EXPORT_DIR") or "exported_models"
+SHAPE_BUCKETS = [64, 128, 256, 512]  # Sequence lengths the exported graphs are built for
+
+
+class EncoderBackend:
+    """
+    Runs UniXcoder on batches of token ids and returns L2-normalized sentence embeddings.
+    Subclasses only change how the forward pass is executed.
+
+    Parameters:
+
+    * `model`- the UniXcoder model.
+    * `device`- the torch device the model lives on.
+    """
+    name = None
+
+    def __init__(self, model, device):
+        self.model = model
+        self.device = device
+
+    def encode_ids(self, token_batch):
+        """
+        Encodes a batch of token id lists of varying length.
+
+        Returns a [batch, hidden] tensor of normalized embeddings, one row per token id list.
+        """
+        source_ids = self.pad(token_batch, max(len(tokens) for tokens in token_batch))
+        with torch.no_grad():
+            _, embedding = self.forward(source_ids)
+            return torch.nn.functional.normalize(embedding, p=2, dim=1)
+
+    def encode_texts(self, texts, max_length=512):
+        """
+        Encodes a list of strings, truncating each one to max_length tokens.
+
+        Returns a [len(texts), hidden] tensor of normalized embeddings.
+        """
+        return self.encode_ids(self.model.tokenize(texts, mode="<encoder-only>", max_length=max_length))
+
+    def pad(self, token_batch, length):
+        """ Pads every token id list with the pad token up to length """
+        pad_id = self.model.config.pad_token_id
+        padded = [tokens + [pad_id] * (length - len(tokens)) for tokens in token_batch]
+        return torch.tensor(padded).to(self.device)
+
+    def forward(self, source_ids):
+        return self.model(source_ids)
+
+
+class EagerBackend(EncoderBackend):
+    """ Plain PyTorch execution of UniXcoder.forward """
+    name = "eager"
+
+
+class CompiledBackend(EncoderBackend):
+    """ UniXcoder.forward compiled with torch.compile, allowing dynamic batch and sequence sizes """
+    name = "compile"
+
+    def __init__(self, model, device):
+        super().__init__(model, device)
+        self.compiled_model = torch.compile(model, dynamic=True)
+
+    def forward(self, source_ids):
+        return self.compiled_model(source_ids)
+
+
+class ExportedBackend(EncoderBackend):
+    """
+    UniXcoder exported with torch.export into static graphs, one per shape bucket.
+    Batches are padded up to the batch size and the next bucket length, so only a
+    few graphs are ever needed. Graphs are serialized to EXPORT_DIR and reloaded
+    on the next start instead of being exported again, as long as the model's
+    fingerprint, source code, config, weights and MODEL_DIR are unchanged.
+    """
+    name = "export"
+
+    def __init__(self, model, device, batch_size=16, export_dir=EXPORT_DIR, fingerprint=""):
+        super().__init__(model, device)
+        self.batch_size = batch_size
+        self.export_dir = export_dir
+        self.fingerprint = fingerprint
+        self.graphs = {}
+        self.__lock = threading.Lock()
+
+    def model_hash(self):
+        """ Hashes everything a saved graph depends on besides its shape and the torch version """
+        model_class = type(self.model)
+        try:
+            source = inspect.getsource(model_class)
+        except (OSError, TypeError):
+            source = model_class.forward.__code__.co_code.hex()
+        config = self.model.config.to_json_string() if hasattr(self.model.config, "to_json_string") else \
+            repr(self.model.config)
+        key = "|".join([self.fingerprint, model_class.__qualname__, source, config, MODEL_DIR,
+                        self.weights_digest()])
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+
+    def weights_digest(self):
+        """
+        Identifies the weights a graph is exported with, without reading all of them: the size and
+        modification time of the snapshot's model.safetensors, the hub revision, and the shape, dtype
+        and a strided sample of the values of every tensor of the model.
+        """
+        digest = hashlib.sha256()
+        config = self.model.config
+        weights_path = os.path.join(getattr(config, "_name_or_path", "") or "", "model.safetensors")
+        if os.path.isfile(weights_path):
+            stat = os.stat(weights_path)
+            digest.update(f"{os.path.abspath(weights_path)}|{stat.st_size}|{stat.st_mtime_ns}".encode("utf-8"))
+        digest.update(str(getattr(config, "_commit_hash", None)).encode("utf-8"))
+        for name, tensor in self.model.state_dict().items():
+            if not isinstance(tensor, torch.Tensor):
+                continue
+            digest.update(f"{name}|{tuple(tensor.shape)}|{tensor.dtype}".encode("utf-8"))
+            values = tensor.detach().flatten()
+            if values.numel():
+                sample = values[::max(1, values.numel() // 16)][:16]
+                digest.update(sample.float().cpu().numpy().tobytes())
+        return digest.hexdigest()
+
+    def encode_ids(self, token_batch):
+        # Split oversized batches so that each piece fits the fixed batch dimension
+        if len(token_batch) > self.batch_size:
+            return torch.cat([self.encode_ids(token_batch[i:i + self.batch_size])
+                              for i in range(0, len(token_batch), self.batch_size)])
+
+        max_length = max(len(tokens) for tokens in token_batch)
+        bucket = next((length for length in SHAPE_BUCKETS if length >= max_length), None)
+        if bucket is None:
+            raise ValueError(f"Sequence of {max_length} tokens exceeds the largest shape bucket {SHAPE_BUCKETS[-1]}")
+
+        # Fill the remaining batch rows with copies of the last sequence and drop them afterwards
+        filled_batch = token_batch + [token_batch[-1]] * (self.batch_size - len(token_batch))
+        source_ids = self.pad(filled_batch, bucket)
+        with torch.no_grad():
+            _, embedding = self.graph(bucket)(source_ids)
+            return torch.nn.functional.normalize(embedding[:len(token_batch)], p=2, dim=1)
+
+    def graph(self, bucket):
+        """
+        Returns the exported graph for a bucket, loading or exporting it on first use. Concurrent
+        callers wait for the first one, and graphs are saved under a temporary name and moved into
+        place, so other processes never load a partially written file.
+        """
+        if bucket in self.graphs:
+            return self.graphs[bucket]
+        with self.__lock:
+            if bucket in self.graphs:
+                return self.graphs[bucket]
+            path = os.path.join(
+                self.export_dir,
+                f"unixcoder_{self.model_hash()}_{self.device.type}_torch{torch.__version__}"
+                f"_b{self.batch_size}_l{bucket}.pt2"
+            )
+            if os.path.exists(path):
+                exported = torch.export.load(path)
+            else:
+                logger.info(f"Exporting UniXcoder graph for batch {self.batch_size} x {bucket} tokens.")
+                example = self.pad([[self.model.config.pad_token_id]] * self.batch_size, bucket)
+                with torch.no_grad():
+                    exported = torch.export.export(self.model, (example,))
+                os.makedirs(self.export_dir, exist_ok=True)
+                staging_path = f"{path}.partial-{os.getpid()}-{threading.get_ident()}"
+                torch.export.save(exported, staging_path)
+                os.replace(staging_path, path)
+            self.graphs[bucket] = exported.module()
+            return self.graphs[bucket]
+
+
+def create_backend(name, model, device, batch_size=16, fingerprint=""):
+    """
+    Builds the encoder backend with the given name.
+
+    Parameters:
+
+    * `name`- one of ENCODER_BACKENDS: eager, compile or export.
+    * `model`- the UniXcoder model.
+    * `device`- the torch device the model lives on.
+    * `batch_size`- the fixed batch dimension of exported graphs.
+    * `fingerprint`- identifies the model's weights and inference mode in the file names of exported graphs.
+    """
+    if name == "eager":
+        return EagerBackend(model, device)
+    if name == "compile":
+        return CompiledBackend(model, device)
+    if name == "export":
+        return ExportedBackend(model, device, batch_size=batch_size, fingerprint=fingerprint)
+    raise ValueError(f"Unknown encoder backend '{name}', expected one of {ENCODER_BACKENDS}")
@@ -0,0 +1,110 @@
+import logging
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+logger = logging.getLogger(__name__)
+
+# How long the encoder waits for more texts before running a micro-batch; 0 encodes every text on its own
+ENCODE_BATCH_WINDOW_MS = float(os.environ.get("ENCODE_BATCH_WINDOW_MS") or 10)
+# Maximum number of texts per micro-batch; a full micro-batch runs without waiting for the window
+ENCODE_BATCH_MAX_TEXTS = int(os.environ.get("ENCODE_BATCH_MAX_TEXTS") or 32)
+
+
+class EncoderService:
+    """
+    Queues encode requests from every thread of the process and encodes them together in
+    micro-batches, so concurrent requests share forward passes instead of each running their own.
+    A micro-batch is started once the first queued text has waited window_ms or max_texts are queued.
+
+    Parameters:
+
+    * `bug_localizer`- the shared BugLocalization whose encode_texts runs the micro-batches.
+    * `window_ms`- how long to wait for more texts before encoding a micro-batch.
+    * `max_texts`- the maximum number of texts per micro-batch.
+    """
+
+    def __init__(self, bug_localizer, window_ms=ENCODE_BATCH_WINDOW_MS, max_texts=ENCODE_BATCH_MAX_TEXTS):
+        self.bug_localizer = bug_localizer
+        self.window_seconds = window_ms / 1000
+        self.max_texts = max(1, max_texts)
+        self.batches = 0
+        self.texts = 0
+        self.__queue = queue.Queue()
+        self.__lock = threading.Lock()
+        self.__worker = None
+
+    def submit(self, text):
+        """
+        Queues a text for encoding.
+
+        Returns a Future that resolves to the text's [chunks, hidden] embeddings array.
+        """
+        future = Future()
+        if self.window_seconds <= 0:
+            # Batching is disabled, so encode right away in the calling thread
+            try:
+                future.set_result(self.bug_localizer.encode_texts([text])[0])
+            except Exception as e:
+                future.set_exception(e)
+            return future
+
+        self.__start_worker()
+        self.__queue.put((text, future))
+        return future
+
+    def encode_text(self, text):
+        """ Encodes a text through the micro-batching queue and waits for its embeddings """
+        return self.submit(text).result()
+
+    @property
+    def pending(self):
+        """ Number of texts queued and not yet picked up by a micro-batch """
+        return self.__queue.qsize()
+
+    def __start_worker(self):
+        if self.__worker is not None:
+            return
+        with self.__lock:
+            if self.__worker is None:
+                self.__worker = threading.Thread(target=self.__run, name="encoder-service", daemon=True)
+                self.__worker.start()
+
+    def __run(self):
+        while True:
+            # Block until a request arrives, then collect more until the window closes or the batch is full
+            requests = [self.__queue.get()]
+            try:
+                deadline = time.monotonic() + self.window_seconds
+                while len(requests) < self.max_texts:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    try:
+                        requests.append(self.__queue.get(timeout=remaining))
+                    except queue.Empty:
+                        break
+                self.__encode(requests)
+            except Exception as e:
+                # Any failure only fails this micro-batch, the worker keeps serving later requests
+                logger.error(f"Failed to encode micro-batch of {len(requests)} texts: {e}")
+                for _, future in requests:
+                    if not future.done():
+                        future.set_exception(e)
+
+    def __encode(self, requests):
+        # Futures cancelled by their caller are dropped before encoding
+        requests = [(text, future) for text, future in requests if future.set_running_or_notify_cancel()]
+        if not requests:
+            return
+
+        embeddings = self.bug_localizer.encode_texts([text for text, _ in requests])
+        if len(embeddings) != len(requests):
+            raise ValueError(f"Encoded {len(embeddings)} texts for a micro-batch of {len(requests)}")
+
+        self.batches += 1
+        self.texts += len(requests)
+        for (_, future), text_embeddings in zip(requests, embeddings):
+            future.set_result(text_embeddings)
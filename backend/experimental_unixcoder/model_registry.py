@@ -0,0 +1,128 @@
+import logging
+import threading
+import time
+import torch
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+try:
+    from experimental_unixcoder.bug_localization import BugLocalization, INFERENCE_MODE  # Try live version
+    from experimental_unixcoder.encoder_backends import ENCODER_BACKEND
+    from experimental_unixcoder.encoder_service import EncoderService
+except ImportError:
+    from bug_localization import BugLocalization, INFERENCE_MODE  # Fallback to testing version
+    from encoder_backends import ENCODER_BACKEND
+    from encoder_service import EncoderService
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_bug_localizers = {}
+_load_stats = {}
+_encoder_services = {}
+
+
+def get_bug_localizer(inference_mode=INFERENCE_MODE, backend=ENCODER_BACKEND):
+    """
+    Returns the process-wide BugLocalization instance, loading UniXcoder on the first call.
+    Later calls, from any thread, receive the same instance instead of loading the model again.
+
+    Args:
+        inference_mode (string): "fp32" or "int8"
+        backend (string): the encoder backend, "eager", "compile" or "export"
+
+    Returns:
+        BugLocalization: the shared bug localizer; each (inference_mode, backend) pair is loaded
+                         at most once per process
+    """
+    key = (inference_mode, backend)
+
+    # Fast path once the model has been loaded
+    bug_localizer = _bug_localizers.get(key)
+    if bug_localizer is not None:
+        return bug_localizer
+
+    with _lock:
+        # Another thread may have loaded the model while we waited for the lock
+        if key not in _bug_localizers:
+            rss_before = _max_rss_mb()
+            start = time.perf_counter()
+
+            bug_localizer = BugLocalization(inference_mode=inference_mode, backend=backend)
+
+            _load_stats[key] = {
+                'load_seconds': time.perf_counter() - start,
+                'model_mb': _model_size_mb(bug_localizer.model),
+                'rss_increase_mb': _max_rss_mb() - rss_before if rss_before is not None else None,
+                'device': str(bug_localizer.device),
+            }
+            logger.info(f"Loaded shared {inference_mode}/{backend} UniXcoder model: {_load_stats[key]}")
+            _bug_localizers[key] = bug_localizer
+
+    return _bug_localizers[key]
+
+
+def get_encoder_service(inference_mode=INFERENCE_MODE, backend=ENCODER_BACKEND):
+    """
+    Returns the process-wide EncoderService of the shared bug localizer. Texts submitted to it
+    from concurrent requests are encoded together in micro-batches.
+
+    Args:
+        inference_mode (string): "fp32" or "int8"
+        backend (string): the encoder backend, "eager", "compile" or "export"
+
+    Returns:
+        EncoderService: the shared encoder service of the (inference_mode, backend) pair
+    """
+    key = (inference_mode, backend)
+
+    encoder_service = _encoder_services.get(key)
+    if encoder_service is not None:
+        return encoder_service
+
+    bug_localizer = get_bug_localizer(inference_mode, backend)
+    with _lock:
+        if key not in _encoder_services:
+            _encoder_services[key] = EncoderService(bug_localizer)
+
+    return _encoder_services[key]
+
+
+def get_load_stats(inference_mode=INFERENCE_MODE, backend=ENCODER_BACKEND):
+    """
+    Gets the load time and memory use of the shared model.
+
+    Args:
+        inference_mode (string): "fp32" or "int8"
+        backend (string): the encoder backend, "eager", "compile" or "export"
+
+    Returns:
+        dict: load_seconds, model_mb, rss_increase_mb (None where unsupported) and device,
+              or an empty dict if the model has not been loaded yet
+    """
+    return dict(_load_stats.get((inference_mode, backend), {}))
+
+
+def _model_size_mb(model):
+    """ Size of the model's parameters, buffers and packed int8 weights in megabytes """
+    tensors = list(model.parameters()) + list(model.buffers())
+    size = sum(t.numel() * t.element_size() for t in tensors)
+
+    # Dynamically quantized linear layers keep their weights outside of parameters()
+    for module in model.modules():
+        if isinstance(module, torch.ao.nn.quantized.dynamic.Linear):
+            weight, bias = module.weight(), module.bias()
+            size += weight.numel() * weight.element_size()
+            size += bias.numel() * bias.element_size() if bias is not None else 0
+    return size / (1024 * 1024)
+
+
+def _max_rss_mb():
+    """ Peak resident set size of the process in megabytes, or None if unsupported """
+    if resource is None:
+        return None
+    # ru_maxrss is reported in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
@@ -0,0 +1,122 @@
+import json
+import os
+import shutil
+import torch
+from transformers import RobertaConfig, RobertaModel, RobertaTokenizer, RobertaTokenizerFast
+from transformers.modeling_utils import no_init_weights
+
+# Directory of local model snapshots written by prefetch_model.py; empty downloads models from the Hugging Face hub
+MODEL_DIR = os.environ.get("MODEL_DIR") or ""
+SNAPSHOT_FILES = ["config.json", "vocab.json", "merges.txt", "tokenizer.json", "model.safetensors"]
+SAFETENSORS_DTYPES = {
+    "F64": torch.float64,
+    "F32": torch.float32,
+    "F16": torch.float16,
+    "BF16": torch.bfloat16,
+    "I64": torch.int64,
+    "I32": torch.int32,
+    "I16": torch.int16,
+    "I8": torch.int8,
+    "U8": torch.uint8,
+    "BOOL": torch.bool,
+}
+
+
+def snapshot_path(model_name, model_dir=MODEL_DIR):
+    """
+    Returns the directory of the local snapshot of a model, or None if models are loaded from the hub.
+    """
+    if not model_dir:
+        return None
+    return os.path.join(model_dir, model_name.replace("/", "--"))
+
+
+def check_snapshot(path):
+    """
+    Raises a FileNotFoundError naming the missing files if the snapshot at path is incomplete,
+    so a missing snapshot stops startup instead of the first request that needs the model.
+    """
+    missing = [file for file in SNAPSHOT_FILES if not os.path.isfile(os.path.join(path, file))]
+    if missing:
+        raise FileNotFoundError(
+            f"Model snapshot at {path} is missing {', '.join(missing)}. "
+            f"Run `python prefetch_model.py` to download it."
+        )
+
+
+def load_safetensors_mmap(path):
+    """
+    Loads a safetensors file as a state dict whose tensors are views into a private memory map of
+    the file. Nothing is read until a tensor is used, and the pages stay shared with the page cache
+    and with every other process mapping the same file, unless a tensor is written to.
+    """
+    with open(path, "rb") as file:
+        header_size = int.from_bytes(file.read(8), "little")
+        header = json.loads(file.read(header_size))
+    data_start = 8 + header_size
+
+    storage = torch.UntypedStorage.from_file(path, shared=False, nbytes=os.path.getsize(path))
+    data = torch.empty(0, dtype=torch.uint8).set_(storage)
+
+    state_dict = {}
+    for name, entry in header.items():
+        if name == "__metadata__":
+            continue
+        begin, end = entry["data_offsets"]
+        tensor = data[data_start + begin:data_start + end].view(SAFETENSORS_DTYPES[entry["dtype"]])
+        state_dict[name] = tensor.view(entry["shape"])
+    return state_dict
+
+
+def load_roberta(model_name, config, model_dir=MODEL_DIR):
+    """
+    Loads the RoBERTa encoder of a model without its pooling layer.
+
+    Parameters:
+
+    * `model_name`- huggingface model card name. e.g. microsoft/unixcoder-base
+    * `config`- the RobertaConfig to build the model with.
+    * `model_dir`- the directory of local snapshots. If set, the weights are memory-mapped from the
+      snapshot's model.safetensors instead of being read into fresh memory, and the hub is never contacted.
+    """
+    path = snapshot_path(model_name, model_dir)
+    if path is None:
+        return RobertaModel.from_pretrained(model_name, config=config, add_pooling_layer=False)
+
+    check_snapshot(path)
+    # The parameters are replaced by the memory-mapped tensors, so skip initializing them first
+    with no_init_weights():
+        model = RobertaModel(config, add_pooling_layer=False)
+    model.load_state_dict(load_safetensors_mmap(os.path.join(path, "model.safetensors")), assign=True)
+    return model.eval()
+
+
+def prefetch_model(model_name, model_dir=MODEL_DIR):
+    """
+    Downloads a model from the hub into a local snapshot under model_dir: the tokenizer files, the
+    config and the encoder weights converted to safetensors. The snapshot is written next to its
+    final location and moved into place once complete, so an interrupted prefetch never leaves a
+    snapshot that passes check_snapshot.
+
+    Returns the path of the snapshot.
+    """
+    path = snapshot_path(model_name, model_dir)
+    if path is None:
+        raise ValueError("MODEL_DIR is not set")
+    try:
+        check_snapshot(path)
+        return path
+    except FileNotFoundError:
+        pass
+
+    staging_path = path + ".partial"
+    shutil.rmtree(staging_path, ignore_errors=True)
+    RobertaTokenizer.from_pretrained(model_name).save_pretrained(staging_path)
+    RobertaTokenizerFast.from_pretrained(model_name).save_pretrained(staging_path)
+    config = RobertaConfig.from_pretrained(model_name)
+    model = RobertaModel.from_pretrained(model_name, config=config, add_pooling_layer=False)
+    model.save_pretrained(staging_path, safe_serialization=True)
+
+    shutil.rmtree(path, ignore_errors=True)
+    os.replace(staging_path, path)
+    return path
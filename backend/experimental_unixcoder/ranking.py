@@ -0,0 +1,300 @@
+import logging
+import torch
+
+try:
+    from experimental_unixcoder.embedding_codec import EMBEDDING_PRECISION, precision_dtype, to_embedding_matrix  # Try live version
+    from experimental_unixcoder.ann_index import IVFIndex
+    from experimental_unixcoder.bm25_index import BM25_CANDIDATES, BM25_WEIGHT, BM25Index, fuse_scores, \
+        lexical_candidates
+except ImportError:
+    from embedding_codec import EMBEDDING_PRECISION, precision_dtype, to_embedding_matrix  # Fallback to testing version
+    from ann_index import IVFIndex
+    from bm25_index import BM25_CANDIDATES, BM25_WEIGHT, BM25Index, fuse_scores, lexical_candidates
+
+logger = logging.getLogger(__name__)
+
+QUERY_BLOCK_CHUNKS = 256  # Bounds the [query chunks, rows] similarity matrix when scoring many queries
+
+
+class RankingMatrix:
+    """
+    The chunk embeddings of a set of files, stacked into one normalized [chunks, hidden] matrix so
+    a query is scored against every chunk with a single matrix product. file_index maps each row
+    to the position of its file in file_ids; files without embeddings have no rows and score -inf.
+
+    Parameters:
+
+    * `file_ids`- the ids (routes) of the files, in their original order.
+    * `matrix`- the normalized [chunks, hidden] chunk embeddings of all files.
+    * `file_index`- a [chunks] tensor with the position in file_ids of each chunk's file.
+    * `precision`- the precision of matrix, which queries are converted to: fp32, fp16 or bf16.
+    * `index`- an optional IVFIndex over the rows. If set, queries only score the rows of the
+      lists nearest to them, and files without such rows score -inf.
+    * `bm25`- an optional BM25Index over the files. If set, queries with term counts can be
+      restricted to their BM25 candidates, fused with their BM25 scores, or ranked by BM25 alone.
+    """
+
+    def __init__(self, file_ids, matrix, file_index, precision=EMBEDDING_PRECISION, index=None, bm25=None):
+        self.file_ids = file_ids
+        self.matrix = matrix
+        self.file_index = file_index
+        self.precision = precision
+        self.index = index
+        self.bm25 = bm25
+
+    @classmethod
+    def from_embeddings(cls, db_embeddings, precision=EMBEDDING_PRECISION, device=None, centroids=None,
+                        ann_lists=None, file_terms=None):
+        """
+        Builds the ranking matrix of a list of (file_id, embeddings) tuples, where embeddings are
+        anything to_embedding_matrix accepts: arrays, tensors or packed documents.
+
+        If the repository has IVF centroids, ann_lists holds the IVF list of every chunk of each
+        file, in the order of db_embeddings, and the matrix gets an IVFIndex. If any file's lists
+        are missing, e.g. for files stored before the index was built, it is scored exactly.
+        If file_terms holds the term counts of the files, the matrix gets a BM25Index.
+        """
+        bm25 = None
+        if file_terms is not None and any(terms is not None for terms in file_terms):
+            bm25 = BM25Index.from_term_counts(file_terms)
+
+        file_ids = []
+        matrices = []
+        file_index = []
+        row_lists = [] if centroids is not None else None
+        for position, (file_id, file_embeddings) in enumerate(db_embeddings):
+            file_ids.append(file_id)
+            file_matrix = to_embedding_matrix(file_embeddings, precision)
+            if file_matrix.numel():
+                matrices.append(file_matrix)
+                file_index.append(torch.full((len(file_matrix),), position, dtype=torch.long))
+                if row_lists is not None:
+                    lists = ann_lists[position] if ann_lists is not None else None
+                    if lists is None or len(lists) != len(file_matrix):
+                        logger.warning(f"No IVF lists stored for {file_id}, scoring every chunk instead.")
+                        row_lists = None
+                    else:
+                        row_lists.extend(lists)
+
+        if not matrices:
+            empty = torch.empty(0, 0, dtype=precision_dtype(precision), device=device)
+            return cls(file_ids, empty, torch.empty(0, dtype=torch.long, device=device), precision, bm25=bm25)
+
+        matrix = torch.nn.functional.normalize(torch.cat(matrices).to(device), p=2, dim=1)
+        index = IVFIndex(centroids, row_lists) if row_lists is not None else None
+        return cls(file_ids, matrix, torch.cat(file_index).to(device), precision, index, bm25)
+
+    def subset(self, file_ids):
+        """
+        Returns the ranking matrix of only the given files, e.g. a GUI-filtered corpus.
+        Files keep their order in this matrix; ids without embeddings here are left out.
+        """
+        wanted = set(file_ids)
+        positions = [position for position, file_id in enumerate(self.file_ids) if file_id in wanted]
+
+        # Renumber the kept files and drop the rows of every other file
+        new_index = torch.full((len(self.file_ids),), -1, dtype=torch.long, device=self.file_index.device)
+        new_index[positions] = torch.arange(len(positions), device=self.file_index.device)
+        file_index = new_index[self.file_index]
+        rows = file_index >= 0
+        index = self.index.subset(rows) if self.index is not None else None
+        bm25 = self.bm25.subset(new_index) if self.bm25 is not None else None
+        return RankingMatrix([self.file_ids[position] for position in positions], self.matrix[rows],
+                             file_index[rows], self.precision, index, bm25)
+
+    def patch(self, db_embeddings, removed=(), ann_lists=None, file_terms=None):
+        """
+        Returns the ranking matrix after a commit added, modified and removed files, without
+        rebuilding it from every file's embeddings. This matrix is left unchanged, so reports
+        being ranked with it are not affected.
+
+        Changed files keep their position, added files are appended and removed files are left
+        out, the order a matrix rebuilt from MongoDB has. db_embeddings, ann_lists and file_terms
+        hold the (file_id, embeddings), IVF lists and term counts of the added and modified files,
+        as from_embeddings takes them. If a changed file's IVF lists are missing, the matrix loses
+        its index and is scored exactly.
+        """
+        removed = set(removed)
+        changed = removed | {file_id for file_id, _ in db_embeddings}
+        device = self.file_index.device
+
+        # Renumber the kept files and append the added ones
+        file_ids = [file_id for file_id in self.file_ids if file_id not in removed]
+        positions = {file_id: position for position, file_id in enumerate(file_ids)}
+        new_index = torch.tensor([positions.get(file_id, -1) for file_id in self.file_ids], dtype=torch.long)
+        for file_id, _ in db_embeddings:
+            if file_id not in positions:
+                positions[file_id] = len(file_ids)
+                file_ids.append(file_id)
+
+        # Drop the rows of removed and changed files, then add the rows of the changed files
+        dropped = torch.tensor([file_id in changed for file_id in self.file_ids], dtype=torch.bool)
+        kept_rows = ~dropped.to(device)[self.file_index]
+        matrices = [self.matrix[kept_rows]] if kept_rows.any() else []
+        file_index = [new_index.to(device)[self.file_index[kept_rows]]]
+        row_lists = [self.index.row_lists[kept_rows.cpu()]] if self.index is not None else None
+        for position, (file_id, file_embeddings) in enumerate(db_embeddings):
+            file_matrix = to_embedding_matrix(file_embeddings, self.precision)
+            if not file_matrix.numel():
+                continue
+            matrices.append(torch.nn.functional.normalize(file_matrix.to(device), p=2, dim=1))
+            file_index.append(torch.full((len(file_matrix),), positions[file_id], dtype=torch.long, device=device))
+            if row_lists is not None:
+                lists = ann_lists[position] if ann_lists is not None else None
+                if lists is None or len(lists) != len(file_matrix):
+                    logger.warning(f"No IVF lists stored for {file_id}, scoring every chunk instead.")
+                    row_lists = None
+                else:
+                    row_lists.append(torch.as_tensor(lists, dtype=torch.long))
+
+        bm25 = None
+        if self.bm25 is not None:
+            terms = file_terms if file_terms is not None else [None] * len(db_embeddings)
+            bm25 = self.bm25.patch(new_index.masked_fill(dropped, -1), len(file_ids),
+                                   {positions[file_id]: file_terms for (file_id, _), file_terms
+                                    in zip(db_embeddings, terms)})
+
+        if not matrices:
+            empty = torch.empty(0, 0, dtype=precision_dtype(self.precision), device=device)
+            return RankingMatrix(file_ids, empty, torch.empty(0, dtype=torch.long, device=device), self.precision,
+                                 bm25=bm25)
+
+        # Rows stay grouped by file in file order, as the snapshot route table expects
+        file_index = torch.cat(file_index)
+        order = torch.argsort(file_index, stable=True)
+        index = None
+        if row_lists is not None:
+            index = IVFIndex(self.index.centroids, torch.cat(row_lists)[order.cpu()], self.index.probes)
+        return RankingMatrix(file_ids, torch.cat(matrices)[order], file_index[order], self.precision, index, bm25)
+
+    @property
+    def nbytes(self):
+        """ Memory held by the matrix, its row to file mapping and its indexes """
+        index_bytes = self.index.nbytes if self.index is not None else 0
+        index_bytes += self.bm25.nbytes if self.bm25 is not None else 0
+        return self.matrix.numel() * self.matrix.element_size() + self.file_index.numel() * 8 + index_bytes
+
+    def scores(self, query_embeddings, query_terms=None):
+        """
+        Scores every file by the highest cosine similarity between any query chunk and any of its
+        chunks. Returns a float32 [files] tensor in the order of file_ids, -inf for files without
+        embeddings or if the query has none. With an index, only the candidate rows are scored.
+        With a BM25 index and the query's term counts, see scores_many.
+        """
+        return self.scores_many([query_embeddings], [query_terms] if query_terms is not None else None)[0]
+
+    def scores_many(self, queries, query_terms=None, candidates=BM25_CANDIDATES, weight=BM25_WEIGHT):
+        """
+        Scores every file against many queries, e.g. a batch of bug reports. The chunks of all
+        queries are stacked and scored with a single matrix product per block of QUERY_BLOCK_CHUNKS
+        query chunks, which bounds the [query chunks, rows] similarity matrix. With an index, every
+        query of a block scores the candidate rows of the whole block.
+
+        If the matrix has a BM25 index and query_terms holds the term counts of every query:
+
+        * `candidates`- if set, each query is only scored densely against its top BM25 files, and
+          every other file scores -inf.
+        * `weight`- if set, the dense scores are fused with the max-normalized BM25 scores.
+        * Queries without embeddings are ranked by their BM25 scores alone.
+
+        Returns a float32 [queries, files] tensor, with the rows as scores() returns them.
+        """
+        scores = torch.full((len(queries), len(self.file_ids)), float('-inf'), device=self.matrix.device)
+        query_matrices = [to_embedding_matrix(query, self.precision).to(self.matrix.device) for query in queries]
+
+        lexical = None
+        file_mask = None
+        if self.bm25 is not None and query_terms is not None and queries:
+            lexical = torch.stack([self.bm25.scores(terms) for terms in query_terms])
+            file_mask = lexical_candidates(lexical, candidates)
+        if self.matrix.numel():
+            scores = self._score_queries(scores, query_matrices, file_mask)
+        if lexical is None:
+            return scores
+
+        if file_mask is not None:
+            scores = scores.masked_fill(~file_mask.to(scores.device), float('-inf'))
+        scores = fuse_scores(scores, lexical, weight)
+        # Queries without embeddings, e.g. if the encoder was too busy, are ranked lexically
+        lexical_only = torch.tensor([not query_matrix.numel() for query_matrix in query_matrices])
+        scores[lexical_only.to(scores.device)] = lexical[lexical_only].to(scores.device)
+        return scores
+
+    def _score_queries(self, scores, query_matrices, file_mask):
+        # Split the queries into blocks of at most QUERY_BLOCK_CHUNKS chunks; larger queries get their own block
+        blocks = [[]]
+        block_chunks = 0
+        for position, query_matrix in enumerate(query_matrices):
+            if not query_matrix.numel():
+                continue
+            if blocks[-1] and block_chunks + len(query_matrix) > QUERY_BLOCK_CHUNKS:
+                blocks.append([])
+                block_chunks = 0
+            blocks[-1].append(position)
+            block_chunks += len(query_matrix)
+
+        for block in blocks:
+            if block:
+                block_mask = file_mask[block] if file_mask is not None else None
+                scores[block] = self._score_block([query_matrices[position] for position in block], block_mask)
+        return scores
+
+    def _score_block(self, query_matrices, file_mask=None):
+        query_index = torch.cat([torch.full((len(query_matrix),), position, dtype=torch.long)
+                                 for position, query_matrix in enumerate(query_matrices)]).to(self.matrix.device)
+        query_matrix = torch.nn.functional.normalize(torch.cat(query_matrices), p=2, dim=1)
+
+        # Only the rows of the IVF lists nearest to the block and of its queries' BM25 candidates are scored
+        matrix, file_index = self.matrix, self.file_index
+        rows = None
+        if self.index is not None:
+            rows = self.index.candidate_rows(query_matrix).to(self.matrix.device)
+        if file_mask is not None:
+            row_mask = file_mask.any(dim=0).to(self.matrix.device)[self.file_index]
+            rows = row_mask.nonzero().squeeze(1) if rows is None else rows[row_mask[rows]]
+        if rows is not None:
+            matrix, file_index = matrix[rows], file_index[rows]
+
+        # One product for all (query chunk, file chunk) pairs, then the best chunk of each query per
+        # row and the best row per file
+        chunk_scores = (query_matrix @ matrix.T).float()
+        n_queries, n_rows = len(query_matrices), len(matrix)
+        if n_queries == 1:
+            row_scores = chunk_scores.max(dim=0, keepdim=True).values
+        else:
+            row_scores = torch.full((n_queries, n_rows), float('-inf'), device=chunk_scores.device).scatter_reduce(
+                0, query_index.unsqueeze(1).expand(-1, n_rows), chunk_scores, reduce="amax")
+        file_scores = torch.full((n_queries, len(self.file_ids)), float('-inf'), device=chunk_scores.device)
+        return file_scores.scatter_reduce(1, file_index.unsqueeze(0).expand(n_queries, -1), row_scores,
+                                          reduce="amax")
+
+    def rank(self, query_embeddings, top_k=None, query_terms=None):
+        """
+        Ranks the files by their scores.
+
+        Parameters:
+
+        * `query_embeddings`- the [chunks, hidden] embeddings of the query (bug report).
+        * `top_k`- if set, only the k best files are selected, without sorting the others.
+        * `query_terms`- the term counts of the query, used if the matrix has a BM25 index.
+
+        Returns a list of (file_id, score) tuples in descending order of score. Files with equal
+        scores keep their original order.
+        """
+        return self._rank_scores(self.scores(query_embeddings, query_terms).cpu(), top_k)
+
+    def rank_many(self, queries, top_k=None, query_terms=None):
+        """
+        Ranks the files for many queries at once, scoring them with scores_many.
+        Returns one list of (file_id, score) tuples per query, as rank() does.
+        """
+        return [self._rank_scores(scores, top_k) for scores in self.scores_many(queries, query_terms).cpu()]
+
+    def _rank_scores(self, scores, top_k):
+        if top_k is not None and top_k < len(scores):
+            # Partial selection of the k best, put back into file order so the sort below keeps ties stable
+            indices = torch.topk(scores, top_k).indices.sort().values
+        else:
+            indices = torch.arange(len(scores))
+        order = torch.sort(scores[indices], descending=True, stable=True).indices
+        return [(self.file_ids[i], scores[i].item()) for i in indices[order].tolist()]
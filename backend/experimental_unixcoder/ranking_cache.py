@@ -0,0 +1,113 @@
+import logging
+import os
+import threading
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+RANKING_CACHE_MB = int(os.environ.get("RANKING_CACHE_MB") or 256)  # 0 disables the cache
+
+
+class RankingCache:
+    """
+    In-memory cache of the ranking matrices of recently ranked repositories, keyed by
+    (owner, repo_name, commit_sha, generation, precision), where the generation changes with every
+    initialization of the repository (its stored_at). A repeat report against the same commit ranks
+    with the cached matrix instead of fetching and unpacking every embedding document again.
+    When the matrices grow beyond max_mb, the least recently used ones are evicted.
+
+    :param max_mb: Maximum size of the cached matrices in megabytes.
+    """
+
+    def __init__(self, max_mb=RANKING_CACHE_MB):
+        self.max_bytes = max_mb * 1024 * 1024
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.__entries = OrderedDict()
+        self.__bytes = 0
+        self.__lock = threading.Lock()
+
+    def get(self, key):
+        """
+        Looks up the ranking matrix of a repository at a commit.
+
+        :param key: (owner, repo_name, commit_sha, generation, precision)
+        :return: The RankingMatrix, or None on a miss.
+        """
+        with self.__lock:
+            ranking_matrix = self.__entries.get(key)
+            if ranking_matrix is None:
+                self.misses += 1
+                return None
+            self.__entries.move_to_end(key)
+            self.hits += 1
+            return ranking_matrix
+
+    def put(self, key, ranking_matrix):
+        """
+        Caches the ranking matrix of a repository at a commit and evicts the least recently used
+        matrices beyond the size cap. Matrices larger than the whole cap are not cached.
+
+        :param key: (owner, repo_name, commit_sha, generation, precision)
+        :param ranking_matrix: The RankingMatrix of the repository's embeddings.
+        """
+        if ranking_matrix.nbytes > self.max_bytes:
+            return
+        with self.__lock:
+            self.__insert(key, ranking_matrix)
+
+    def advance(self, key, ranking_matrix):
+        """
+        Replaces every cached matrix of a repository with its matrix at a new commit, in one step,
+        so no report sees the repository without a matrix or with both commits' matrices cached.
+
+        :param key: (owner, repo_name, commit_sha, generation, precision) of the new commit.
+        :param ranking_matrix: The RankingMatrix of the repository at the new commit.
+        """
+        with self.__lock:
+            for stale_key in [stale_key for stale_key in self.__entries if stale_key[:2] == key[:2]]:
+                self.__remove(stale_key)
+            if ranking_matrix.nbytes <= self.max_bytes:
+                self.__insert(key, ranking_matrix)
+
+    def invalidate(self, owner, repo_name):
+        """
+        Drops every cached matrix of a repository, e.g. after its embeddings were rewritten.
+
+        :param owner: The repository owner's username.
+        :param repo_name: The repository name.
+        """
+        with self.__lock:
+            for key in [key for key in self.__entries if key[:2] == (owner, repo_name)]:
+                self.__remove(key)
+
+    def stats(self):
+        """
+        Gets the cache counters.
+
+        :return: A dict with hits, misses, evictions, the number of cached matrices and their size in megabytes.
+        """
+        with self.__lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self.__entries),
+                'size_mb': self.__bytes / (1024 * 1024),
+            }
+
+    def __insert(self, key, ranking_matrix):
+        self.__remove(key)
+        self.__entries[key] = ranking_matrix
+        self.__bytes += ranking_matrix.nbytes
+        while self.__bytes > self.max_bytes:
+            evicted_key, evicted = self.__entries.popitem(last=False)
+            self.__bytes -= evicted.nbytes
+            self.evictions += 1
+            logger.info(f"Evicted ranking matrix of {evicted_key[0]}/{evicted_key[1]} at {evicted_key[2]}.")
+
+    def __remove(self, key):
+        ranking_matrix = self.__entries.pop(key, None)
+        if ranking_matrix is not None:
+            self.__bytes -= ranking_matrix.nbytes
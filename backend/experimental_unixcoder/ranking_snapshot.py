@@ -0,0 +1,148 @@
+import errno
+import json
+import logging
+import os
+import shutil
+import torch
+from safetensors.torch import save_file
+
+try:
+    from experimental_unixcoder.ann_index import IVFIndex  # Try live version
+    from experimental_unixcoder.bm25_index import BM25Index
+    from experimental_unixcoder.model_store import load_safetensors_mmap
+    from experimental_unixcoder.ranking import RankingMatrix
+except ImportError:
+    from ann_index import IVFIndex  # Fallback to testing version
+    from bm25_index import BM25Index
+    from model_store import load_safetensors_mmap
+    from ranking import RankingMatrix
+
+logger = logging.getLogger(__name__)
+
+# Directory of per-repo ranking snapshots shared by the workers of a host; empty builds every matrix from MongoDB
+RANKING_SNAPSHOT_DIR = os.environ.get("RANKING_SNAPSHOT_DIR") or ""
+VECTORS_FILE = "vectors.safetensors"
+ROUTES_FILE = "routes.json"
+META_FILE = "meta.json"
+TERMS_FILE = "terms.json"
+BM25_TENSORS = ["term_offsets", "posting_files", "posting_counts", "doc_lengths", "idf"]
+
+
+def ranking_snapshot_path(owner, repo_name, commit_sha, snapshot_dir=RANKING_SNAPSHOT_DIR):
+    """
+    Returns the directory of a repository's ranking snapshot at a commit, or None if snapshots are disabled.
+    """
+    if not snapshot_dir:
+        return None
+    return os.path.join(snapshot_dir, owner, repo_name, commit_sha)
+
+
+def save_ranking_snapshot(ranking_matrix, path, commit_sha, generation=None):
+    """
+    Writes a ranking matrix to a snapshot directory, which holds:
+
+    * `vectors.safetensors`- the normalized matrix, the file of each row and the IVF lists and
+      centroids if the matrix has an index, one contiguous tensor each.
+    * `routes.json`- the route of every file with its first and last row (exclusive) in the matrix.
+    * `meta.json`- the commit SHA, the generation of the stored embeddings (e.g. the repository's
+      stored_at), the precision and the shape of the matrix.
+    * `terms.json`- the vocabulary and parameters of the BM25 index, if the matrix has one. Its
+      postings are stored in vectors.safetensors with the bm25_ prefix.
+
+    The snapshot is written next to path and moved into place once complete, so readers never
+    see a partial snapshot. A snapshot already at path is replaced. Snapshots of the repository's
+    other commits are removed afterwards; processes that still map them keep reading the unlinked files.
+    """
+    counts = torch.bincount(ranking_matrix.file_index.cpu(), minlength=len(ranking_matrix.file_ids))
+    ends = counts.cumsum(0).tolist()
+    routes = [[file_id, end - count, end]
+              for file_id, count, end in zip(ranking_matrix.file_ids, counts.tolist(), ends)]
+
+    tensors = {
+        "matrix": ranking_matrix.matrix.cpu().contiguous(),
+        "file_index": ranking_matrix.file_index.cpu().contiguous(),
+    }
+    if ranking_matrix.index is not None:
+        tensors["centroids"] = ranking_matrix.index.centroids.contiguous()
+        tensors["row_lists"] = ranking_matrix.index.row_lists.contiguous()
+    bm25 = ranking_matrix.bm25
+    if bm25 is not None:
+        tensors.update({f"bm25_{name}": getattr(bm25, name).contiguous() for name in BM25_TENSORS})
+    meta = {
+        "commit_sha": commit_sha,
+        "generation": generation,
+        "precision": ranking_matrix.precision,
+        "rows": ranking_matrix.matrix.shape[0],
+        "hidden": ranking_matrix.matrix.shape[1] if ranking_matrix.matrix.dim() == 2 else 0,
+        "files": len(ranking_matrix.file_ids),
+    }
+
+    # Concurrent workers may write the same snapshot, so each stages its own copy
+    staging_path = f"{path}.partial-{os.getpid()}"
+    shutil.rmtree(staging_path, ignore_errors=True)
+    os.makedirs(staging_path)
+    save_file(tensors, os.path.join(staging_path, VECTORS_FILE), metadata={"commit_sha": commit_sha})
+    with open(os.path.join(staging_path, ROUTES_FILE), "w") as file:
+        json.dump(routes, file)
+    with open(os.path.join(staging_path, META_FILE), "w") as file:
+        json.dump(meta, file)
+    if bm25 is not None:
+        with open(os.path.join(staging_path, TERMS_FILE), "w") as file:
+            json.dump({"vocabulary": bm25.vocabulary, "avg_length": bm25.avg_length, "k1": bm25.k1, "b": bm25.b}, file)
+
+    # A snapshot already at path may hold other settings, e.g. after a re-initialization at the
+    # same commit, so it is moved aside first: os.replace cannot replace a non-empty directory
+    stale_path = f"{path}.stale-{os.getpid()}"
+    try:
+        os.replace(path, stale_path)
+    except FileNotFoundError:
+        pass
+    try:
+        os.replace(staging_path, path)
+    except OSError as error:
+        if error.errno not in (errno.EEXIST, errno.ENOTEMPTY):
+            raise
+        # Another worker moved its snapshot into place in between
+        shutil.rmtree(staging_path, ignore_errors=True)
+    shutil.rmtree(stale_path, ignore_errors=True)
+    remove_stale_snapshots(os.path.dirname(path), os.path.basename(path))
+    logger.info(f"Wrote ranking snapshot of {meta['files']} files and {meta['rows']} chunks to {path}.")
+
+
+def load_ranking_snapshot(path, precision, generation=None):
+    """
+    Loads a ranking matrix from a snapshot directory. The tensors are memory-mapped read-only, so
+    loading reads only the headers and every process on the host shares the same pages.
+
+    Returns the RankingMatrix, or None if there is no complete snapshot at path in the given precision
+    and, if one is given, of the given generation.
+    """
+    if path is None or not os.path.isfile(os.path.join(path, META_FILE)):
+        return None
+    with open(os.path.join(path, META_FILE)) as file:
+        meta = json.load(file)
+    if meta["precision"] != precision or (generation is not None and meta.get("generation") != generation):
+        return None
+    with open(os.path.join(path, ROUTES_FILE)) as file:
+        routes = json.load(file)
+
+    tensors = load_safetensors_mmap(os.path.join(path, VECTORS_FILE))
+    index = IVFIndex(tensors["centroids"], tensors["row_lists"]) if "centroids" in tensors else None
+    bm25 = None
+    if os.path.isfile(os.path.join(path, TERMS_FILE)):
+        with open(os.path.join(path, TERMS_FILE)) as file:
+            terms = json.load(file)
+        bm25 = BM25Index(terms["vocabulary"], *[tensors[f"bm25_{name}"] for name in BM25_TENSORS],
+                         terms["avg_length"], terms["k1"], terms["b"])
+    return RankingMatrix([route for route, _, _ in routes], tensors["matrix"], tensors["file_index"], precision,
+                         index, bm25)
+
+
+def remove_stale_snapshots(repo_path, keep):
+    """
+    Removes every complete snapshot in a repository's snapshot directory except keep. Directories
+    other workers are still staging or swapping out (.partial-PID and .stale-PID) are left alone.
+    """
+    for name in os.listdir(repo_path):
+        if name != keep and ".partial-" not in name and ".stale-" not in name:
+            shutil.rmtree(os.path.join(repo_path, name), ignore_errors=True)
@@ -0,0 +1,147 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+RESULT_CACHE_ENTRIES = int(os.environ.get("RESULT_CACHE_ENTRIES") or 1024)  # 0 disables the cache
+# Cosine similarity from which a report reuses the ranking of a near-duplicate report, e.g. 0.98; 0 (default)
+# only reuses exact matches, since a near-duplicate may be a different report that gets another report's ranking
+RESULT_CACHE_SIMILARITY = float(os.environ.get("RESULT_CACHE_SIMILARITY") or 0)
+
+
+def result_key(owner, repo_name, commit_sha, normalized_report, sc_terms, gs_terms, generation=None):
+    """
+    Builds the result cache key of a bug report.
+
+    :param owner: The repository owner's username.
+    :param repo_name: The repository name.
+    :param commit_sha: The commit the report is ranked at.
+    :param normalized_report: The preprocessed (normalized) bug report text.
+    :param sc_terms: The SC terms extracted from the report's trace.
+    :param gs_terms: The GS terms extracted from the report's trace.
+    :param generation: The generation of the repository's stored embeddings, e.g. its stored_at, so
+                       rankings cached by any process before a re-initialization are not reused.
+    :return: (owner, repo_name, commit_sha, generation, report hash, terms hash)
+    """
+    report_hash = hashlib.sha256(normalized_report.encode("utf-8")).hexdigest()
+    terms = json.dumps([sorted(sc_terms or []), sorted(gs_terms or [])])
+    return owner, repo_name, commit_sha, generation, report_hash, hashlib.sha256(terms.encode("utf-8")).hexdigest()
+
+
+def query_vector(query_embeddings):
+    """ Mean of the normalized chunk embeddings of a query, normalized again, or None without embeddings """
+    if query_embeddings is None or not len(query_embeddings):
+        return None
+    matrix = np.asarray(query_embeddings, dtype=np.float32).reshape(len(query_embeddings), -1)
+    vector = (matrix / np.maximum(np.linalg.norm(matrix, axis=1, keepdims=True), 1e-12)).mean(axis=0)
+    return vector / max(np.linalg.norm(vector), 1e-12)
+
+
+class ResultCache:
+    """
+    In-memory cache of the rankings of recent bug reports, keyed by result_key. Edited, re-opened
+    and duplicate issues reuse the ranking of the same preprocessed text instead of being encoded
+    and ranked again. Reports whose query embedding is at least similarity close to that of a
+    cached report with the same repository, commit, generation and terms reuse its ranking as well. Beyond
+    max_entries, the least recently used rankings are evicted.
+
+    :param max_entries: Maximum number of cached rankings.
+    :param similarity: Minimum cosine similarity of near-duplicate reports, 0 disables them.
+    """
+
+    def __init__(self, max_entries=RESULT_CACHE_ENTRIES, similarity=RESULT_CACHE_SIMILARITY):
+        self.max_entries = max_entries
+        self.similarity = similarity
+        self.hits = 0
+        self.near_hits = 0
+        self.misses = 0
+        self.__entries = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def get(self, key):
+        """
+        Looks up the ranking of a bug report.
+
+        :param key: The report's result_key.
+        :return: The ranked files, or None on a miss.
+        """
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.__entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def get_similar(self, key, query_embeddings):
+        """
+        Looks up the ranking of the most similar cached report with the same repository, commit,
+        generation and terms, once the report's own ranking was missed. The miss was already counted by get.
+
+        :param key: The report's result_key.
+        :param query_embeddings: The report's [chunks, hidden] query embeddings.
+        :return: The ranked files, or None if no cached report is similar enough.
+        """
+        vector = query_vector(query_embeddings) if self.similarity > 0 else None
+        with self.__lock:
+            best_key, best_similarity = None, self.similarity
+            if vector is not None:
+                for entry_key, (_, entry_vector) in self.__entries.items():
+                    if entry_vector is None or entry_key[:4] != key[:4] or entry_key[5] != key[5]:
+                        continue
+                    similarity = float(entry_vector @ vector)
+                    if similarity >= best_similarity:
+                        best_key, best_similarity = entry_key, similarity
+            if best_key is None:
+                return None
+            self.__entries.move_to_end(best_key)
+            self.near_hits += 1
+            return self.__entries[best_key][0]
+
+    def put(self, key, ranked_files, query_embeddings=None):
+        """
+        Caches the ranking of a bug report and evicts the least recently used rankings beyond the cap.
+
+        :param key: The report's result_key.
+        :param ranked_files: The report's ranked files.
+        :param query_embeddings: The report's query embeddings, which near-duplicate reports are matched by.
+        """
+        if self.max_entries <= 0:
+            return
+        with self.__lock:
+            self.__entries.pop(key, None)
+            self.__entries[key] = (ranked_files, query_vector(query_embeddings))
+            while len(self.__entries) > self.max_entries:
+                self.__entries.popitem(last=False)
+
+    def invalidate(self, owner, repo_name):
+        """
+        Drops every cached ranking of a repository, e.g. after its embeddings were rewritten.
+
+        :param owner: The repository owner's username.
+        :param repo_name: The repository name.
+        """
+        with self.__lock:
+            for key in [key for key in self.__entries if key[:2] == (owner, repo_name)]:
+                del self.__entries[key]
+
+    def stats(self):
+        """
+        Gets the cache counters.
+
+        :return: A dict with exact hits, near-duplicate hits, exact misses (including those a near-duplicate
+                 answered) and the number of cached rankings.
+        """
+        with self.__lock:
+            return {
+                'hits': self.hits,
+                'near_hits': self.near_hits,
+                'misses': self.misses,
+                'entries': len(self.__entries),
+            }
@@ -5,33 +5,46 @@ import torch
 import torch.nn as nn
 import random
 import numpy as np
-from transformers import RobertaTokenizer, RobertaModel, RobertaConfig
+from transformers import RobertaTokenizer, RobertaTokenizerFast, RobertaConfig
+
+try:
+    from experimental_unixcoder.model_store import check_snapshot, load_roberta, snapshot_path  # Try live version
+except ImportError:
+    from model_store import check_snapshot, load_roberta, snapshot_path  # Fallback to testing version
+
+class UniXcoderEncoder(nn.Module):
+    # Encoder-only models never need the causal mask or the key/value cache of the decoder modes
+    is_decoder = False
 
-class UniXcoder(nn.Module):
     def __init__(self, model_name):
         """
-            Build UniXcoder.
+            Build the encoder-only part of UniXcoder, which is all that embedding texts needs.
+            The causal mask buffer, the language modeling head and beam search of UniXcoder are
+            left out, as is the pooling layer that forward never uses.
 
             Parameters:
 
             * `model_name`- huggingface model card name. e.g. microsoft/unixcoder-base
-        """       
+              If MODEL_DIR is set, the model is loaded from its local snapshot there instead of the hub.
+        """
         self.set_seed(42)
         torch.set_default_dtype(torch.float32)
         torch.use_deterministic_algorithms(True)
-        super(UniXcoder, self).__init__()
-        self.tokenizer = RobertaTokenizer.from_pretrained(model_name)
-        self.config = RobertaConfig.from_pretrained(model_name)
-        self.config.is_decoder = True
-        self.model = RobertaModel.from_pretrained(model_name, config=self.config)
-        
-        self.register_buffer("bias", torch.tril(torch.ones((1024, 1024), dtype=torch.uint8)).view(1,1024, 1024))
-        self.lm_head = nn.Linear(self.config.hidden_size, self.config.vocab_size, bias=False)
-        self.lm_head.weight = self.model.embeddings.word_embeddings.weight
-        self.lsm = nn.LogSoftmax(dim=-1)
-        
+        super(UniXcoderEncoder, self).__init__()
+        path = snapshot_path(model_name)
+        if path is not None:
+            check_snapshot(path)
+        source = path or model_name
+        self.tokenizer = RobertaTokenizer.from_pretrained(source)
+        # Rust tokenizer with the same vocabulary, used to tokenize whole batches at once
+        self.fast_tokenizer = RobertaTokenizerFast.from_pretrained(source)
+        self.config = RobertaConfig.from_pretrained(source)
+        self.config.is_decoder = self.is_decoder
+        self.model = load_roberta(model_name, self.config)
+
         self.tokenizer.add_tokens(["<mask0>"],special_tokens=True)
-          
+        self.fast_tokenizer.add_tokens(["<mask0>"],special_tokens=True)
+
     def set_seed(self, seed):
         random.seed(seed)
         np.random.seed(seed)
@@ -54,26 +67,70 @@ class UniXcoder(nn.Module):
         assert max_length < 1024
         
         tokenizer = self.tokenizer
+        prefix = tokenizer.convert_tokens_to_ids([tokenizer.cls_token,mode,tokenizer.sep_token])
+        sep = [tokenizer.sep_token_id]
         
         tokens_ids = []
-        for x in inputs:
-            tokens = tokenizer.tokenize(x)
+        for ids in self.batch_token_ids(inputs):
             if mode == "<encoder-only>":
-                tokens = tokens[:max_length-4]
-                tokens = [tokenizer.cls_token,mode,tokenizer.sep_token] + tokens + [tokenizer.sep_token]                
+                ids = ids[:max_length-4]
+                tokens_id = prefix + ids + sep
             elif mode == "<decoder-only>":
-                tokens = tokens[-(max_length-3):]
-                tokens = [tokenizer.cls_token,mode,tokenizer.sep_token] + tokens
+                ids = ids[-(max_length-3):]
+                tokens_id = prefix + ids
             else:
-                tokens = tokens[:max_length-5]
-                tokens = [tokenizer.cls_token,mode,tokenizer.sep_token] + tokens + [tokenizer.sep_token]
+                ids = ids[:max_length-5]
+                tokens_id = prefix + ids + sep
                 
-            tokens_id = tokenizer.convert_tokens_to_ids(tokens)
             if padding:
                 tokens_id = tokens_id + [self.config.pad_token_id] * (max_length-len(tokens_id))
             tokens_ids.append(tokens_id)
         return tokens_ids
+
+    def batch_token_ids(self, inputs):
+        """
+        Convert strings to token ids without special tokens, tokenizing the whole batch in one call
+        of the fast tokenizer. The ids are identical to tokenizer.tokenize followed by
+        convert_tokens_to_ids, including added tokens such as <mask0>.
+
+        Parameters:
+
+        * `inputs`- list of input strings.
+        """
+        if not inputs:
+            return []
+        # verbose=False silences the warning about texts longer than the model limit; callers truncate or split them
+        return self.fast_tokenizer(list(inputs), add_special_tokens=False, return_attention_mask=False,
+                                   verbose=False)["input_ids"]
             
+    def tokenize_windows(self, inputs, mode="<encoder-only>", max_length=512):
+        """ 
+        Convert each string to token id windows that together cover the whole string.
+        Every string is tokenized once and its tokens are split into consecutive windows
+        that fill max_length after the special tokens of the mode are added.
+
+        Parameters:
+
+        * `inputs`- list of input strings.
+        * `max_length`- The maximum total sequence length of a window after tokenization.
+        * `mode`- which mode the sequence will use. i.e. <encoder-only>, <decoder-only>, <encoder-decoder>
+
+        Returns a list with one list of windows (lists of token ids) per input string.
+        """
+        assert mode in ["<encoder-only>", "<decoder-only>", "<encoder-decoder>"]
+        assert max_length < 1024
+
+        tokenizer = self.tokenizer
+        prefix = tokenizer.convert_tokens_to_ids([tokenizer.cls_token,mode,tokenizer.sep_token])
+        suffix = [] if mode == "<decoder-only>" else [tokenizer.sep_token_id]
+        window_size = max_length - len(prefix) - len(suffix)
+
+        windows_ids = []
+        for ids in self.batch_token_ids(inputs):
+            windows = [prefix + ids[i:i + window_size] + suffix for i in range(0, len(ids), window_size)]
+            windows_ids.append(windows)
+        return windows_ids
+
     def decode(self, source_ids):   
         """ Convert token ids to string """      
         predictions = []
@@ -89,6 +146,37 @@ class UniXcoder(nn.Module):
             predictions.append(prediction)
         return predictions
     
+    def forward(self, source_ids):
+        """
+        Obtain token embeddings and sentence embeddings.
+        The padding mask is passed as [batch, 1, length], which RoBERTa broadcasts over the
+        query positions instead of materializing a [batch, length, length] mask. Real tokens
+        attend to exactly the same keys as with the dense mask.
+        """
+        mask = source_ids.ne(self.config.pad_token_id)
+        token_embeddings = self.model(source_ids,attention_mask = mask.unsqueeze(1))[0]
+        sentence_embeddings = (token_embeddings * mask.unsqueeze(-1)).sum(1) / mask.sum(-1).unsqueeze(-1)
+        return token_embeddings, sentence_embeddings
+
+
+class UniXcoder(UniXcoderEncoder):
+    is_decoder = True
+
+    def __init__(self, model_name):
+        """
+            Build UniXcoder.
+
+            Parameters:
+
+            * `model_name`- huggingface model card name. e.g. microsoft/unixcoder-base
+        """       
+        super(UniXcoder, self).__init__(model_name)
+        
+        self.register_buffer("bias", torch.tril(torch.ones((1024, 1024), dtype=torch.uint8)).view(1,1024, 1024))
+        self.lm_head = nn.Linear(self.config.hidden_size, self.config.vocab_size, bias=False)
+        self.lm_head.weight = self.model.embeddings.word_embeddings.weight
+        self.lsm = nn.LogSoftmax(dim=-1)
+
     def forward(self, source_ids):   
         """ Obtain token embeddings and sentence embeddings """
         mask = source_ids.ne(self.config.pad_token_id)
@@ -6,6 +6,9 @@ from dotenv import find_dotenv, load_dotenv
 
 from routes.routes import routes
 from database.database import Database
+from experimental_unixcoder.bug_localization import MODEL_NAME
+from experimental_unixcoder.model_store import check_snapshot, snapshot_path
+from services.warmup_service import WARM_UP, start_warm_up
 
 # Load environment variables
 load_dotenv(find_dotenv())
@@ -19,6 +22,12 @@ def create_app(test_config=None):
     logging.basicConfig(level=logging.INFO)
     logger = logging.getLogger(__name__)
 
+    # Fail at startup instead of on the first request if the configured model snapshot is missing
+    model_path = snapshot_path(MODEL_NAME)
+    if model_path is not None:
+        check_snapshot(model_path)
+        logger.info(f"Using model snapshot at {model_path}")
+
     @app.route("/", methods=["GET", "POST"])
     def index():
         return jsonify({"message": "Hello, world!"}), 200
@@ -27,6 +36,9 @@ def create_app(test_config=None):
     if test_config:
         app.config.update(test_config)
 
+    # Load the model, NLTK and the database connection before /ready lets traffic in
+    start_warm_up(app.config.get("WARM_UP", WARM_UP))
+
     return app
 
 if __name__ == "__main__":
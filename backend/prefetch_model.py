@@ -0,0 +1,21 @@
+# file: backend/prefetch_model.py
+import argparse
+from experimental_unixcoder.bug_localization import MODEL_NAME
+from experimental_unixcoder.model_store import MODEL_DIR, prefetch_model
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Download the UniXcoder snapshot into MODEL_DIR so the backend can start without the hub."
+    )
+    parser.add_argument("--model-dir", default=MODEL_DIR, help="Snapshot directory. Defaults to MODEL_DIR.")
+    parser.add_argument("--model", default=MODEL_NAME, help=f"Hugging Face model name. Defaults to {MODEL_NAME}.")
+    args = parser.parse_args()
+
+    if not args.model_dir:
+        parser.error("Set MODEL_DIR or pass --model-dir")
+    print(f"Model snapshot ready at {prefetch_model(args.model, args.model_dir)}")
+
+
+if __name__ == '__main__':
+    main()
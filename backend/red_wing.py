@@ -6,8 +6,13 @@ from rich.console import Console
 from rich.table import Table
 from concurrent.futures import ProcessPoolExecutor, as_completed
 from red_wing.localization import collect_repos
+from red_wing.benchmark import benchmark_encoder_backends, check_ann_recall, check_lemma_drift
+from experimental_unixcoder.embedding_codec import EMBEDDING_PRECISIONS
+from experimental_unixcoder.embedding_projection import PROJECTION_DIM, PROJECTION_METHODS
+from experimental_unixcoder.model_registry import get_bug_localizer
 from red_wing.cli_helpers import parse_cli_arguments, process_repos, output_metrics, output_metrics_with_improvement, \
-    output_big_metrics, output_big_metrics_with_improvement
+    output_big_metrics, output_big_metrics_with_improvement, output_quantization_drift, output_backend_benchmark, \
+    output_precision_drift, output_projection_tradeoff, output_ann_recall, output_lemma_drift
 
 console = Console()
 
@@ -37,10 +42,64 @@ o888o  o888o `Y8bod8P' `Y8bod88P"            `8'      `8'       o888o o888o o888
     print(banner)
 
 
+def embedding_dim():
+    # Dimension of unprojected embeddings, i.e. the hidden size of the encoder the runs used
+    return get_bug_localizer().model.config.hidden_size
+
+
+def run_quantization_drift(repo_paths, verbose):
+    # Rank with the fp32 baseline and the int8 quantized model, then compare the metrics
+    start = time.perf_counter()
+    fp32_results = process_repos(repo_paths, verbose, True, inference_mode="fp32")
+    fp32_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    int8_results = process_repos(repo_paths, verbose, True, inference_mode="int8")
+    int8_seconds = time.perf_counter() - start
+
+    output_quantization_drift(fp32_results, int8_results, fp32_seconds, int8_seconds)
+
+
+def run_precision_drift(repo_paths, verbose):
+    # Rank with every embedding precision; fp32 runs first and is the baseline. Later runs read
+    # the source code embeddings from the embedding cache, so they mostly time the ranking.
+    results = {}
+    seconds = {}
+    for precision in EMBEDDING_PRECISIONS:
+        start = time.perf_counter()
+        results[precision] = process_repos(repo_paths, verbose, True, precision=precision)
+        seconds[precision] = time.perf_counter() - start
+
+    output_precision_drift(results, seconds, embedding_dim())
+
+
+def run_projection_tradeoff(repo_paths, verbose):
+    # Rank with full-dimension embeddings first as the baseline, then with every projection
+    # to PROJECTION_DIM, timing only the rank_files calls
+    results = {}
+    rank_seconds = {}
+    dims = {}
+    for projection in PROJECTION_METHODS:
+        rank_seconds[projection] = []
+        results[projection] = process_repos(repo_paths, verbose, True, projection=projection,
+                                            rank_seconds=rank_seconds[projection])
+        # Projections never exceed the encoder's hidden size, like fit_projection
+        dims[projection] = embedding_dim() if projection == "none" else min(PROJECTION_DIM, embedding_dim())
+
+    output_projection_tradeoff(results, rank_seconds, dims)
+
+
 # New function to run a single loop iteration in parallel
-def run_loop(loop_number, repo_paths, verbose, improvement, base):
+def run_loop(loop_number, repo_paths, verbose, improvement, base, quantized=False, precision_drift=False,
+             projection_tradeoff=False):
     # This function runs one loop iteration
-    if improvement:
+    if quantized:
+        run_quantization_drift(repo_paths, verbose)
+    elif precision_drift:
+        run_precision_drift(repo_paths, verbose)
+    elif projection_tradeoff:
+        run_projection_tradeoff(repo_paths, verbose)
+    elif improvement:
         (all_buggy_file_rankings_gui, best_rankings_gui) = process_repos(repo_paths, verbose, True)  # with gui
         (all_buggy_file_rankings_base, best_rankings_base) = process_repos(repo_paths, verbose, False)  # without gui
         output_big_metrics_with_improvement(all_buggy_file_rankings_gui, best_rankings_gui, best_rankings_base,
@@ -63,6 +122,12 @@ def main():
     repo_home = args.path
     improvement = args.m
     base = args.b
+    quantized = args.q
+    precision_drift = args.p
+    projection_tradeoff = args.d
+    benchmark = args.e
+    ann_recall = args.n
+    lemma_drift = args.l
     loop_count = args.loop  # new flag
 
     if not os.path.isdir(repo_home):
@@ -87,18 +152,32 @@ def main():
     console.print(repo_table)
     console.print("\n")
 
+    # Backend benchmarks and the recall and lemma checks are deterministic, so they run once regardless of the loop count
+    if benchmark:
+        output_backend_benchmark(benchmark_encoder_backends(repo_paths))
+    elif ann_recall:
+        output_ann_recall(*check_ann_recall(repo_paths, verbose))
+    elif lemma_drift:
+        output_lemma_drift(*check_lemma_drift(repo_paths))
     # If looping, run the entire process in parallel with 3 workers
-    if loop_count > 1:
+    elif loop_count > 1:
         with ProcessPoolExecutor(max_workers=3) as executor:
             futures = []
             for i in range(1, loop_count + 1):
                 console.print(f"Submitting loop {i}")
-                futures.append(executor.submit(run_loop, i, repo_paths, verbose, improvement, base))
+                futures.append(executor.submit(run_loop, i, repo_paths, verbose, improvement, base, quantized,
+                                               precision_drift, projection_tradeoff))
             for future in as_completed(futures):
                 result = future.result()
                 console.print(result)
     else:
-        if (improvement):
+        if (quantized):
+            run_quantization_drift(repo_paths, verbose)
+        elif (precision_drift):
+            run_precision_drift(repo_paths, verbose)
+        elif (projection_tradeoff):
+            run_projection_tradeoff(repo_paths, verbose)
+        elif (improvement):
             (all_buggy_file_rankings_gui, best_rankings_gui) = process_repos(repo_paths, verbose, True)  # with gui
             (all_buggy_file_rankings_base, best_rankings_base) = process_repos(repo_paths, verbose,
                                                                                False)  # without gui
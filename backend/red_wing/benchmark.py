@@ -0,0 +1,183 @@
+import os
+import re
+import time
+import torch
+from pathlib import Path
+from experimental_unixcoder.ann_index import assign_lists, fit_ann_index
+from experimental_unixcoder.bug_localization import ENCODE_BATCH_SIZE, MAX_TOKENS
+from experimental_unixcoder.encoder_backends import ENCODER_BACKENDS, create_backend
+from experimental_unixcoder.ranking import RankingMatrix
+from experimental_unixcoder.unixcoder import UniXcoderEncoder
+from nltk import pos_tag
+from utils.preprocess import Preprocessor, lemmatize, load_lemma_table, load_stop_words, to_wordnet_tag
+from utils.preprocess_bug_report import preprocess_bug_report
+from utils.preprocess_source_code import preprocess_source_code
+from rich.console import Console
+
+console = Console()
+
+
+def collect_token_windows(repo_paths, model, max_chunks):
+    """
+    Preprocesses the source code of each repository and splits it into UniXcoder token windows.
+
+    Args:
+        repo_paths (list[str]): Repository paths containing a code/ directory
+        model (UniXcoderEncoder): Model whose tokenizer is used
+        max_chunks (int): Maximum number of windows to collect
+
+    Returns:
+        list[list[int]]: Token id windows
+    """
+    preprocessor = Preprocessor()
+    stop_words_path = Path(__file__).parent / "../data/stop_words/java-keywords-bugs.txt"
+
+    windows = []
+    for path in repo_paths:
+        for file_path in sorted(Path(path, "code").rglob("*.java")):
+            with open(file_path, "r", encoding="utf-8") as f:
+                text = preprocessor.normalize_text(f.read(), stop_words_path, verbose=False)
+            windows.extend(model.tokenize_windows([text], mode="<encoder-only>", max_length=MAX_TOKENS)[0])
+            if len(windows) >= max_chunks:
+                return windows[:max_chunks]
+    return windows
+
+
+def benchmark_encoder_backends(repo_paths, batch_size=ENCODE_BATCH_SIZE, max_chunks=512):
+    """
+    Encodes the same token windows with every encoder backend on the CPU.
+    Each backend runs twice over all batches: the first pass includes compiling or
+    exporting the graphs, the second pass gives the steady-state latency.
+
+    Args:
+        repo_paths (list[str]): Repository paths containing a code/ directory
+        batch_size (int): Number of windows per forward pass
+        max_chunks (int): Maximum number of windows to encode
+
+    Returns:
+        list[tuple]: (backend, warm-up seconds, per-chunk latency in ms, max difference to eager)
+    """
+    device = torch.device("cpu")
+    model = UniXcoderEncoder("microsoft/unixcoder-base")
+    model.to(device)
+
+    windows = collect_token_windows(repo_paths, model, max_chunks)
+    if not windows:
+        return []
+    windows.sort(key=len)
+    batches = [windows[i:i + batch_size] for i in range(0, len(windows), batch_size)]
+
+    results = []
+    eager_embeddings = None
+    for name in ENCODER_BACKENDS:
+        console.print(f"Benchmarking {name} backend on {len(windows)} chunks...")
+        backend = create_backend(name, model, device, batch_size=batch_size)
+
+        start = time.perf_counter()
+        for batch in batches:
+            backend.encode_ids(batch)
+        warm_up_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        embeddings = torch.cat([backend.encode_ids(batch) for batch in batches])
+        latency_ms = (time.perf_counter() - start) * 1000 / len(windows)
+
+        if eager_embeddings is None:
+            eager_embeddings = embeddings
+        max_difference = (embeddings - eager_embeddings).abs().max().item()
+        results.append((name, warm_up_seconds, latency_ms, max_difference))
+
+    return results
+
+
+def check_ann_recall(repo_paths, verbose=False, ks=(1, 5, 10)):
+    """
+    Ranks each bug report of the repositories exactly and with an IVF index, which is fitted
+    regardless of ANN_MIN_CHUNKS, and measures how many of the exact top k files the index finds.
+
+    Args:
+        repo_paths (list[str]): Bug paths containing a code/ directory and a bug_report_{bug-id}.txt
+        verbose (bool): Whether preprocessing prints its progress
+        ks (tuple[int]): The k values recall is measured at
+
+    Returns:
+        tuple: (dict of k -> mean recall@k, mean exact rank ms, mean IVF rank ms, mean share of chunks scored)
+    """
+    recalls = {k: [] for k in ks}
+    exact_seconds = []
+    ivf_seconds = []
+    scored = []
+    for path in repo_paths:
+        bug_id = int(re.search(r'bug-(\d+)', path).group(1))
+        preprocessed_files = preprocess_source_code(os.path.join(path, "code"), verbose=verbose)
+        query = preprocess_bug_report(os.path.join(path, f"bug_report_{bug_id}.txt"), [], verbose=verbose)
+        db_embeddings = [(file[0], file[2]) for file in preprocessed_files]
+
+        centroids = fit_ann_index([embeddings for _, embeddings in db_embeddings], method="ivf", min_chunks=0)
+        if centroids is None:
+            continue
+        exact = RankingMatrix.from_embeddings(db_embeddings)
+        ivf = RankingMatrix.from_embeddings(db_embeddings, centroids=centroids,
+                                            ann_lists=[assign_lists(e, centroids) for _, e in db_embeddings])
+
+        start = time.perf_counter()
+        exact_ranking = exact.rank(query)
+        exact_seconds.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        ivf_ranking = ivf.rank(query)
+        ivf_seconds.append(time.perf_counter() - start)
+
+        query_matrix = torch.nn.functional.normalize(torch.as_tensor(query, dtype=torch.float32), dim=1)
+        scored.append(len(ivf.index.candidate_rows(query_matrix)) / max(1, len(ivf.matrix)))
+        for k in ks:
+            exact_top = {file_id for file_id, _ in exact_ranking[:k]}
+            ivf_top = {file_id for file_id, score in ivf_ranking[:k] if score != float('-inf')}
+            recalls[k].append(len(exact_top & ivf_top) / max(1, len(exact_top)))
+
+    count = max(1, len(scored))
+    return ({k: sum(values) / count for k, values in recalls.items()},
+            sum(exact_seconds) * 1000 / count, sum(ivf_seconds) * 1000 / count, sum(scored) / count)
+
+
+def check_lemma_drift(repo_paths):
+    """
+    Lemmatizes the tokens of every source file of the repositories like normalize_text does, once
+    with the lemma table and the context tagging of Preprocessor.lemmatize_tokens and once with
+    NLTK alone, tagging each whole file, and measures how many lemmas differ.
+
+    Args:
+        repo_paths (list[str]): Repository paths containing a code/ directory
+
+    Returns:
+        tuple: (tokens compared, share of tokens in the table, share of table lemmas equal to NLTK's,
+                share of all lemmas equal to NLTK's, table ms per file, NLTK ms per file)
+    """
+    stop_words = load_stop_words(Path(__file__).parent / "../data/stop_words/java-keywords-bugs.txt")
+    lemma_table = load_lemma_table()
+    total = in_table = table_agreed = agreed = files = 0
+    table_seconds = nltk_seconds = 0.0
+    for path in repo_paths:
+        for file_path in sorted(Path(path, "code").rglob("*.java")):
+            text = Preprocessor.remove_special_characters(file_path.read_text(encoding="utf-8", errors="ignore"))
+            tokens = [token.lower() for token in Preprocessor.tokenize_text(text) if token not in stop_words]
+            if not tokens:
+                continue
+
+            # The table path runs first, so NLTK finds the lemmas of the pairs both tag the same memoized
+            start = time.perf_counter()
+            table_lemmas = Preprocessor.lemmatize_tokens(tokens)
+            table_seconds += time.perf_counter() - start
+            start = time.perf_counter()
+            nltk_lemmas = [lemmatize(token, to_wordnet_tag(tag)) for token, tag in pos_tag(tokens)]
+            nltk_seconds += time.perf_counter() - start
+
+            files += 1
+            for token, table_lemma, nltk_lemma in zip(tokens, table_lemmas, nltk_lemmas):
+                total += 1
+                agreed += table_lemma == nltk_lemma
+                if token in lemma_table:
+                    in_table += 1
+                    table_agreed += lemma_table[token] == nltk_lemma
+
+    return (total, in_table / max(1, total), table_agreed / max(1, in_table), agreed / max(1, total),
+            table_seconds * 1000 / max(1, files), nltk_seconds * 1000 / max(1, files))
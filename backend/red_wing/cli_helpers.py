@@ -7,6 +7,10 @@ from rich.table import Table
 from red_wing.localization import collect_repos, localize_buggy_files_with_GUI_data, \
     localize_buggy_files_without_GUI_data, hits_at_k, calculate_map, calculate_mrr, calculate_effectiveness, \
     calculate_improvement
+from experimental_unixcoder.bug_localization import INFERENCE_MODE
+from experimental_unixcoder.embedding_codec import EMBEDDING_PRECISION, pack_embeddings
+from experimental_unixcoder.embedding_projection import EMBEDDING_PROJECTION, PROJECTION_DIM
+import bson
 import inquirer
 import os
 from types import SimpleNamespace
@@ -37,7 +41,13 @@ def parse_cli_arguments():
         inquirer.List('mode', message="Select localization mode", choices=[
             ('Run enhanced localization (default)', 'default'),
             ('Calculate relative improvement between base and GUI-enhanced rankings', 'm'),
-            ('Run base localization', 'b')
+            ('Run base localization', 'b'),
+            ('Compare int8 quantized rankings against the fp32 baseline', 'q'),
+            ('Compare fp16/bf16 embedding precision against fp32', 'p'),
+            ('Compare PCA and random embedding projections against full dimensions', 'd'),
+            ('Benchmark encoder backends on CPU', 'e'),
+            ('Check ANN index recall@k against exact scoring', 'n'),
+            ('Compare lemma table lemmas against NLTK', 'l')
         ]),
         inquirer.List('iteration', message="Select iteration mode", choices=[
             ('Iterate over all repos', 'a'),
@@ -80,6 +90,12 @@ def parse_cli_arguments():
     # Process mode selection: set flags for improvement or base mode.
     m = (answers['mode'] == 'm')
     b = (answers['mode'] == 'b')
+    q = (answers['mode'] == 'q')
+    p = (answers['mode'] == 'p')
+    d = (answers['mode'] == 'd')
+    e = (answers['mode'] == 'e')
+    n = (answers['mode'] == 'n')
+    l = (answers['mode'] == 'l')
     loop = int(answers['loop'])
     repo_count = int(answers['repo_count']) if answers.get('repo_count') else None
     repo_ids = [int(x) for x in answers['repo_ids'].split()] if answers.get('repo_ids') else None
@@ -89,6 +105,12 @@ def parse_cli_arguments():
         v=answers['v'],
         m=m,
         b=b,
+        q=q,
+        p=p,
+        d=d,
+        e=e,
+        n=n,
+        l=l,
         a=(answers['iteration'] == 'a'),
         repo_count=repo_count,
         repo_ids=repo_ids,
@@ -96,7 +118,8 @@ def parse_cli_arguments():
     )
 
 
-def process_repos(repo_paths, verbose, enhanced: True):
+def process_repos(repo_paths, verbose, enhanced: True, inference_mode=INFERENCE_MODE, precision=EMBEDDING_PRECISION,
+                  projection=EMBEDDING_PROJECTION, projection_dim=PROJECTION_DIM, rank_seconds=None):
     all_buggy_file_rankings = []
     best_rankings_per_bug = []
     with Progress(
@@ -107,9 +130,14 @@ def process_repos(repo_paths, verbose, enhanced: True):
         task = progress.add_task("Processing repos...", total=len(repo_paths))
         for path in repo_paths:
             if (enhanced):
-                rankings = localize_buggy_files_with_GUI_data(path, verbose=verbose)
+                rankings = localize_buggy_files_with_GUI_data(path, verbose=verbose, inference_mode=inference_mode,
+                                                              precision=precision, projection=projection,
+                                                              projection_dim=projection_dim, rank_seconds=rank_seconds)
             else:
-                rankings = localize_buggy_files_without_GUI_data(path, verbose=verbose)
+                rankings = localize_buggy_files_without_GUI_data(path, verbose=verbose, inference_mode=inference_mode,
+                                                                 precision=precision, projection=projection,
+                                                                 projection_dim=projection_dim,
+                                                                 rank_seconds=rank_seconds)
             all_buggy_file_rankings.append(rankings)
             if rankings:
                 best_rank = min(r[2] for r in rankings)
@@ -120,6 +148,230 @@ def process_repos(repo_paths, verbose, enhanced: True):
     return all_buggy_file_rankings, best_rankings_per_bug
 
 
+def output_quantization_drift(fp32_results, int8_results, fp32_seconds, int8_seconds):
+    """
+    Outputs Hits@k, MAP and MRR of the int8 quantized model next to the fp32 baseline,
+    together with the drift between them and the time each run took.
+
+    Args:
+        fp32_results (tuple): (all_buggy_file_rankings, best_rankings_per_bug) of the fp32 run
+        int8_results (tuple): (all_buggy_file_rankings, best_rankings_per_bug) of the int8 run
+        fp32_seconds (float): Duration of the fp32 run
+        int8_seconds (float): Duration of the int8 run
+    """
+    fp32_rankings, fp32_best = fp32_results
+    int8_rankings, int8_best = int8_results
+    total_bugs = len(fp32_best)
+
+    metrics = []
+    for k in [50, 25, 10, 5, 1]:
+        fp32_ratio = hits_at_k(k, fp32_best) / total_bugs if total_bugs > 0 else 0
+        int8_ratio = hits_at_k(k, int8_best) / total_bugs if total_bugs > 0 else 0
+        metrics.append((f"Hits@{k}", fp32_ratio, int8_ratio))
+    metrics.append(("MAP", calculate_map(fp32_rankings), calculate_map(int8_rankings)))
+    metrics.append(("MRR", calculate_mrr(fp32_rankings), calculate_mrr(int8_rankings)))
+
+    current_time = datetime.datetime.now().strftime("%m%d%y%H%M")
+    csv_file_name = f"metrics/{current_time}_int8_drift.csv"
+    os.makedirs('metrics', exist_ok=True)
+    with open(csv_file_name, "w") as f:
+        f.write("metric, fp32, int8, drift\n")
+        for name, fp32_value, int8_value in metrics:
+            f.write(f"{name}, {fp32_value:.3f}, {int8_value:.3f}, {int8_value - fp32_value:+.3f}\n")
+        f.write("\n")
+        f.write(f"runtime, {fp32_seconds:.1f}, {int8_seconds:.1f}, {fp32_seconds / int8_seconds:.2f}x\n")
+
+    table = Table(title="int8 Quantization Drift")
+    table.add_column("Metric", justify="left", style="cyan")
+    table.add_column("fp32", justify="center", style="magenta")
+    table.add_column("int8", justify="center", style="magenta")
+    table.add_column("Drift", justify="center", style="green")
+    for name, fp32_value, int8_value in metrics:
+        table.add_row(name, f"{fp32_value:.3f}", f"{int8_value:.3f}", f"{int8_value - fp32_value:+.3f}")
+    table.add_row("Runtime (s)", f"{fp32_seconds:.1f}", f"{int8_seconds:.1f}", f"{fp32_seconds / int8_seconds:.2f}x")
+    console.print("\n")
+    console.print(table)
+    console.print(f"\nMetrics saved to {csv_file_name}")
+
+
+def output_precision_drift(results, seconds, dim):
+    """
+    Outputs Hits@k, MAP and MRR of every embedding precision next to the fp32 baseline,
+    together with the storage size of one chunk and the time each run took.
+
+    Args:
+        results (dict): precision -> (all_buggy_file_rankings, best_rankings_per_bug)
+        seconds (dict): precision -> duration of the run
+        dim (int): Embedding dimension of a chunk
+    """
+    precisions = list(results)
+    total_bugs = len(results["fp32"][1])
+
+    metrics = []
+    for k in [50, 25, 10, 5, 1]:
+        metrics.append((f"Hits@{k}", [hits_at_k(k, results[p][1]) / total_bugs if total_bugs > 0 else 0
+                                      for p in precisions]))
+    metrics.append(("MAP", [calculate_map(results[p][0]) for p in precisions]))
+    metrics.append(("MRR", [calculate_mrr(results[p][0]) for p in precisions]))
+
+    # Bytes of one chunk as stored in Mongo, compared to the BSON list of doubles used before
+    chunk = [[0.0] * dim]
+    list_bytes = len(bson.encode({"embedding": chunk}))
+    chunk_bytes = [len(bson.encode({"embedding": pack_embeddings(chunk, p)})) for p in precisions]
+
+    current_time = datetime.datetime.now().strftime("%m%d%y%H%M")
+    csv_file_name = f"metrics/{current_time}_precision_drift.csv"
+    os.makedirs('metrics', exist_ok=True)
+    with open(csv_file_name, "w") as f:
+        f.write(f"metric, {', '.join(precisions)}\n")
+        for name, values in metrics:
+            f.write(f"{name}, {', '.join(f'{value:.3f}' for value in values)}\n")
+        f.write("\n")
+        f.write(f"bytes per chunk (list: {list_bytes}), {', '.join(str(size) for size in chunk_bytes)}\n")
+        f.write(f"runtime, {', '.join(f'{seconds[p]:.1f}' for p in precisions)}\n")
+
+    table = Table(title="Embedding Precision Drift")
+    table.add_column("Metric", justify="left", style="cyan")
+    for precision in precisions:
+        table.add_column(precision, justify="center", style="magenta")
+    for name, values in metrics:
+        baseline = values[0]
+        table.add_row(name, f"{baseline:.3f}", *[f"{value:.3f} ({value - baseline:+.3f})" for value in values[1:]])
+    table.add_row("Bytes/Chunk", *[f"{size} ({list_bytes / size:.1f}x smaller)" for size in chunk_bytes])
+    table.add_row("Runtime (s)", *[f"{seconds[p]:.1f}" for p in precisions])
+    console.print("\n")
+    console.print(table)
+    console.print(f"\nMetrics saved to {csv_file_name}")
+
+
+def output_projection_tradeoff(results, rank_seconds, dims):
+    """
+    Outputs Hits@k, MAP and MRR of every embedding projection next to the full-dimension
+    baseline, together with the stored dimension and the mean time rank_files took per bug.
+
+    Args:
+        results (dict): projection -> (all_buggy_file_rankings, best_rankings_per_bug)
+        rank_seconds (dict): projection -> list of rank_files durations
+        dims (dict): projection -> embedding dimension
+    """
+    projections = list(results)
+    baseline = projections[0]
+    total_bugs = len(results[baseline][1])
+
+    metrics = []
+    for k in [50, 25, 10, 5, 1]:
+        metrics.append((f"Hits@{k}", [hits_at_k(k, results[p][1]) / total_bugs if total_bugs > 0 else 0
+                                      for p in projections]))
+    metrics.append(("MAP", [calculate_map(results[p][0]) for p in projections]))
+    metrics.append(("MRR", [calculate_mrr(results[p][0]) for p in projections]))
+    rank_ms = [sum(rank_seconds[p]) * 1000 / max(1, len(rank_seconds[p])) for p in projections]
+
+    current_time = datetime.datetime.now().strftime("%m%d%y%H%M")
+    csv_file_name = f"metrics/{current_time}_projection_tradeoff.csv"
+    os.makedirs('metrics', exist_ok=True)
+    with open(csv_file_name, "w") as f:
+        f.write(f"metric, {', '.join(projections)}\n")
+        for name, values in metrics:
+            f.write(f"{name}, {', '.join(f'{value:.3f}' for value in values)}\n")
+        f.write("\n")
+        f.write(f"dimensions, {', '.join(str(dims[p]) for p in projections)}\n")
+        f.write(f"rank ms per bug, {', '.join(f'{ms:.1f}' for ms in rank_ms)}\n")
+
+    table = Table(title="Embedding Projection Trade-off")
+    table.add_column("Metric", justify="left", style="cyan")
+    for projection in projections:
+        table.add_column(projection, justify="center", style="magenta")
+    for name, values in metrics:
+        table.add_row(name, f"{values[0]:.3f}", *[f"{value:.3f} ({value - values[0]:+.3f})" for value in values[1:]])
+    table.add_row("Dimensions", *[str(dims[p]) for p in projections])
+    table.add_row("Rank ms/Bug", f"{rank_ms[0]:.1f}",
+                  *[f"{ms:.1f} ({rank_ms[0] / ms:.1f}x faster)" if ms > 0 else f"{ms:.1f}" for ms in rank_ms[1:]])
+    console.print("\n")
+    console.print(table)
+    console.print(f"\nMetrics saved to {csv_file_name}")
+
+
+def output_backend_benchmark(results):
+    """
+    Outputs the per-chunk CPU latency of each encoder backend.
+
+    Args:
+        results (list[tuple]): (backend, warm-up seconds, per-chunk latency in ms, max difference to eager)
+    """
+    table = Table(title="Encoder Backend Benchmark (CPU)")
+    table.add_column("Backend", justify="left", style="cyan")
+    table.add_column("Warm-up (s)", justify="center", style="magenta")
+    table.add_column("Per-Chunk Latency (ms)", justify="center", style="green")
+    table.add_column("Max Diff vs Eager", justify="center", style="yellow")
+    for name, warm_up_seconds, latency_ms, max_difference in results:
+        table.add_row(name, f"{warm_up_seconds:.1f}", f"{latency_ms:.2f}", f"{max_difference:.2e}")
+    console.print("\n")
+    console.print(table)
+
+
+def output_ann_recall(recalls, exact_ms, ivf_ms, scored):
+    """
+    Outputs the recall@k of the IVF index against exact scoring, the mean time ranking took with
+    both and the share of chunks the index scored.
+
+    Args:
+        recalls (dict): k -> mean recall@k
+        exact_ms (float): Mean exact rank time per bug in milliseconds
+        ivf_ms (float): Mean IVF rank time per bug in milliseconds
+        scored (float): Mean share of the chunks scored with the index
+    """
+    table = Table(title="ANN Index Recall vs Exact Scoring")
+    table.add_column("Metric", justify="left", style="cyan")
+    table.add_column("Value", justify="center", style="magenta")
+    for k, recall in recalls.items():
+        table.add_row(f"Recall@{k}", f"{recall:.3f}")
+    table.add_row("Exact Rank ms/Bug", f"{exact_ms:.1f}")
+    table.add_row("IVF Rank ms/Bug", f"{ivf_ms:.1f}")
+    table.add_row("Chunks Scored", f"{scored:.1%}")
+    console.print("\n")
+    console.print(table)
+
+
+def output_lemma_drift(total, in_table, table_agreement, agreement, table_ms, nltk_ms):
+    """
+    Outputs how many lemmas of the lemma table and context tagging differ from NLTK's whole-file
+    tagging, and the mean time both took per file.
+
+    Args:
+        total (int): Number of tokens compared
+        in_table (float): Share of the tokens found in the lemma table
+        table_agreement (float): Share of the table lemmas equal to NLTK's
+        agreement (float): Share of all lemmas equal to NLTK's
+        table_ms (float): Mean lemmatization time per file with the table in milliseconds
+        nltk_ms (float): Mean lemmatization time per file with NLTK alone in milliseconds
+    """
+    current_time = datetime.datetime.now().strftime("%m%d%y%H%M")
+    csv_file_name = f"metrics/{current_time}_lemma_drift.csv"
+    os.makedirs('metrics', exist_ok=True)
+    with open(csv_file_name, "w") as f:
+        f.write("metric, value\n")
+        f.write(f"tokens, {total}\n")
+        f.write(f"table hit rate, {in_table:.4f}\n")
+        f.write(f"table agreement, {table_agreement:.4f}\n")
+        f.write(f"overall agreement, {agreement:.4f}\n")
+        f.write(f"table ms per file, {table_ms:.2f}\n")
+        f.write(f"nltk ms per file, {nltk_ms:.2f}\n")
+
+    table = Table(title="Lemma Table Drift vs NLTK")
+    table.add_column("Metric", justify="left", style="cyan")
+    table.add_column("Value", justify="center", style="magenta")
+    table.add_row("Tokens", str(total))
+    table.add_row("Table Hit Rate", f"{in_table:.1%}")
+    table.add_row("Table Lemmas Equal to NLTK", f"{table_agreement:.2%}")
+    table.add_row("All Lemmas Equal to NLTK", f"{agreement:.2%}")
+    table.add_row("NLTK ms/File", f"{nltk_ms:.2f}")
+    table.add_row("Table ms/File", f"{table_ms:.2f} ({nltk_ms / table_ms:.1f}x faster)" if table_ms > 0 else
+                  f"{table_ms:.2f}")
+    console.print("\n")
+    console.print(table)
+    console.print(f"\nMetrics saved to {csv_file_name}")
+
+
 def output_metrics_with_improvement(all_buggy_file_rankings_gui, best_rankings_gui, best_rankings_base):
     # Compute Hits@10 for both GUI and baseline
     gui_hits_at_10 = hits_at_k(10, best_rankings_gui)
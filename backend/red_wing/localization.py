@@ -3,8 +3,13 @@ import glob
 import json
 import re
 import random
+import time
 from pathlib import Path
-from experimental_unixcoder.bug_localization import BugLocalization
+from experimental_unixcoder.bug_localization import INFERENCE_MODE
+from experimental_unixcoder.embedding_codec import EMBEDDING_PRECISION
+from experimental_unixcoder.embedding_projection import EMBEDDING_PROJECTION, PROJECTION_DIM, fit_projection, \
+    project_embeddings
+from experimental_unixcoder.model_registry import get_bug_localizer
 from utils.preprocess_bug_report import preprocess_bug_report
 from utils.extract_gui_data import build_corpus, extract_gs_terms, extract_sc_terms, get_boosted_files
 from utils.preprocess_source_code import preprocess_source_code
@@ -30,7 +35,9 @@ def reorder_rankings(ranked_files: list[tuple], gs_files: list[str]):
     return gs_ranked + non_gs_ranked
 
 
-def localize_buggy_files_with_GUI_data(project_path, verbose=False):
+def localize_buggy_files_with_GUI_data(project_path, verbose=False, inference_mode=INFERENCE_MODE,
+                                       precision=EMBEDDING_PRECISION, projection=EMBEDDING_PROJECTION,
+                                       projection_dim=PROJECTION_DIM, rank_seconds=None):
     """
     Process a repository that contains GUI data.
     Expects the following in project_path:
@@ -38,6 +45,8 @@ def localize_buggy_files_with_GUI_data(project_path, verbose=False):
       - code/ (source code directory)
       - bug_report_{bug-id}.txt
       - {bug-id}.json (ground truth)
+    The embeddings are projected to projection_dim with the given projection method, and the
+    time spent in rank_files is appended to rank_seconds when a list is passed.
     """
     bug_id = int(re.search(r'bug-(\d+)', project_path).group(1))
     trace_path = os.path.join(project_path, "Execution-1.json")
@@ -63,16 +72,22 @@ def localize_buggy_files_with_GUI_data(project_path, verbose=False):
     gs_terms = extract_gs_terms(json.dumps(trace))
 
     filtered_files = filter_files(source_code_path)
-    preprocessed_files = preprocess_source_code(source_code_path, verbose=verbose)
-    preprocessed_bug_report = preprocess_bug_report(bug_report_path, sc_terms, verbose=verbose)
+    preprocessed_files = preprocess_source_code(source_code_path, verbose=verbose, inference_mode=inference_mode)
+    preprocessed_bug_report = preprocess_bug_report(bug_report_path, sc_terms, verbose=verbose,
+                                                    inference_mode=inference_mode)
+    preprocessed_files, preprocessed_bug_report = project_repo(preprocessed_files, preprocessed_bug_report,
+                                                               projection, projection_dim)
 
     repo_files = to_repo_files(source_code_path)
     corpus = build_corpus(repo_files, sc_terms, None)
     corpus_embeddings = to_corpus_embeddings(preprocessed_files, corpus)
     boosted_files = get_boosted_files(repo_files, gs_terms)
 
-    bug_localizer = BugLocalization()
-    ranked_files = bug_localizer.rank_files(preprocessed_bug_report, corpus_embeddings)
+    bug_localizer = get_bug_localizer(inference_mode)
+    start = time.perf_counter()
+    ranked_files = bug_localizer.rank_files(preprocessed_bug_report, corpus_embeddings, precision=precision)
+    if rank_seconds is not None:
+        rank_seconds.append(time.perf_counter() - start)
     reranked_files = reorder_rankings(ranked_files, boosted_files)
     buggy_file_rankings = get_buggy_file_rankings(reranked_files, ground_truth_path, bug_id)
     
@@ -93,13 +108,17 @@ def localize_buggy_files_with_GUI_data(project_path, verbose=False):
     return buggy_file_rankings
 
 
-def localize_buggy_files_without_GUI_data(project_path, verbose=False):
+def localize_buggy_files_without_GUI_data(project_path, verbose=False, inference_mode=INFERENCE_MODE,
+                                          precision=EMBEDDING_PRECISION, projection=EMBEDDING_PROJECTION,
+                                          projection_dim=PROJECTION_DIM, rank_seconds=None):
     """
     Process a repository that doesn't contain GUI data.
     Expects the following in project_path:
       - code/ (source code directory)
       - bug_report_{bug-id}.txt
       - {bug-id}.json (ground truth)
+    The embeddings are projected to projection_dim with the given projection method, and the
+    time spent in rank_files is appended to rank_seconds when a list is passed.
     """
     bug_id = int(re.search(r'bug-(\d+)', project_path).group(1))
     source_code_path = os.path.join(project_path, "code")
@@ -110,13 +129,19 @@ def localize_buggy_files_without_GUI_data(project_path, verbose=False):
     sc_terms = []
     gs_terms = []
 
-    preprocessed_files = preprocess_source_code(source_code_path, verbose=verbose)
-    preprocessed_bug_report = preprocess_bug_report(bug_report_path, sc_terms, verbose=verbose)
+    preprocessed_files = preprocess_source_code(source_code_path, verbose=verbose, inference_mode=inference_mode)
+    preprocessed_bug_report = preprocess_bug_report(bug_report_path, sc_terms, verbose=verbose,
+                                                    inference_mode=inference_mode)
+    preprocessed_files, preprocessed_bug_report = project_repo(preprocessed_files, preprocessed_bug_report,
+                                                               projection, projection_dim)
 
     corpus_embeddings = to_corpus_embeddings(preprocessed_files, None)
 
-    bug_localizer = BugLocalization()
-    ranked_files = bug_localizer.rank_files(preprocessed_bug_report, corpus_embeddings)
+    bug_localizer = get_bug_localizer(inference_mode)
+    start = time.perf_counter()
+    ranked_files = bug_localizer.rank_files(preprocessed_bug_report, corpus_embeddings, precision=precision)
+    if rank_seconds is not None:
+        rank_seconds.append(time.perf_counter() - start)
     buggy_file_rankings = get_buggy_file_rankings(ranked_files, ground_truth_path, bug_id)
     
     if buggy_file_rankings:
@@ -136,6 +161,19 @@ def localize_buggy_files_without_GUI_data(project_path, verbose=False):
     return buggy_file_rankings
 
 
+def project_repo(preprocessed_files, preprocessed_bug_report, projection, projection_dim):
+    """
+    Fits a projection on the repository's file embeddings, as /initialization does, and applies it
+    to the files and the bug report. Returns both unchanged if projection is "none".
+    """
+    projection_matrix = fit_projection([file[2] for file in preprocessed_files], projection, projection_dim)
+    if projection_matrix is None:
+        return preprocessed_files, preprocessed_bug_report
+    projected_files = [(file_path, file_name, project_embeddings(embeddings, projection_matrix))
+                       for file_path, file_name, embeddings in preprocessed_files]
+    return projected_files, project_embeddings(preprocessed_bug_report, projection_matrix)
+
+
 def to_corpus_embeddings(preprocessed_files, corpus=None):
     corpus_embeddings = []
     count = 0
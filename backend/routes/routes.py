@@ -1,9 +1,12 @@
 import logging
-from flask import Blueprint, abort, request
+from flask import Blueprint, abort, jsonify, request
 from dotenv import load_dotenv
 
 from services.initialization_service import initialize
-from services.report_service import process_report
+from services.db_service import get_ranking_cache_stats, get_result_cache_stats
+from services.report_service import process_report, process_report_batch
+from services.warmup_service import get_warm_up_status, is_ready
+from utils.preprocess import get_lemma_table_stats
 
 # Initialize Blueprint for Routes
 routes = Blueprint('routes', __name__)
@@ -21,6 +24,28 @@ load_dotenv()
 def index():
     return "Hello, World!"
 
+@routes.route('/ready')
+def ready():
+    """
+    Readiness Endpoint:
+    - Returns 200 once the startup warm-up has finished, or right away if WARM_UP is disabled.
+    - Returns 503 while the worker is still warming up or if the warm-up failed,
+      so the load balancer does not send traffic to a cold worker.
+    - The body reports the warm-up state, the seconds per step and any error.
+    """
+    return jsonify(get_warm_up_status()), 200 if is_ready() else 503
+
+@routes.route('/stats')
+def stats():
+    """
+    Stats Endpoint:
+    - Returns the hit, miss and eviction counters and the size of this worker's ranking cache.
+    - Returns the exact hit, near-duplicate hit and miss counters of this worker's result cache.
+    - Returns the hit rate of this worker's lemma table.
+    """
+    return jsonify({"ranking_cache": get_ranking_cache_stats(), "result_cache": get_result_cache_stats(),
+                    "lemma_table": get_lemma_table_stats()}), 200
+
 @routes.route("/initialization", methods=["POST"])
 def initialization():
     """
@@ -78,4 +103,36 @@ def report():
 
     result = process_report(data)
 
-    return result
\ No newline at end of file
+    return result
+
+
+@routes.route('/report/batch', methods=["POST"])
+def report_batch():
+    """
+    Batch Report Endpoint:
+    - Receives repository information with the latest_commit_sha and a list of reports.
+    - Patches the stored embeddings first if the SHAs do not match, as /report does.
+    - Preprocesses and encodes all reports together in shared batches.
+    - Scores all reports against the repository's embeddings with one matrix product.
+    - Returns the top_k files of every report, filtered and boosted with GUI data if its trace has any.
+
+    Post Batch Report Example:
+    POST localhost:5000/report/batch
+    RAW JSON:
+    {
+    "repository": { ...same as /report... },
+    "reports": [
+        {"id": 12, "issue": "App crashes if incorrect secret is entered", "trace": null},
+        {"id": 15, "issue": "Scrolling the entry list freezes", "trace": { ... }}
+    ],
+    "top_k": 10
+    }
+    """
+
+    data = request.get_json()
+    if not data:
+        abort(400, description="Invalid JSON data")
+
+    result = process_report_batch(data)
+
+    return result
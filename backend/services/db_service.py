@@ -3,43 +3,142 @@ import logging
 import os
 import chardet
 from flask import abort, jsonify
+from experimental_unixcoder.ann_index import assign_lists, unpack_ann_index
+from experimental_unixcoder.bm25_index import BM25_INDEX
+from experimental_unixcoder.embedding_codec import EMBEDDING_PRECISION, pack_embeddings
+from experimental_unixcoder.embedding_projection import project_embeddings, unpack_projection
+from experimental_unixcoder.ranking import RankingMatrix
+from experimental_unixcoder.ranking_cache import RankingCache
+from experimental_unixcoder.result_cache import ResultCache
+from experimental_unixcoder.ranking_snapshot import load_ranking_snapshot, ranking_snapshot_path, save_ranking_snapshot
 from services.messenger_service import ProbotMessenger
 from utils.preprocess_source_code import preprocess_source_code
 from utils.file_utils import clean_embedding_paths_for_db
 from database.database import Database
 
 db = Database()
+ranking_cache = RankingCache()
+result_cache = ResultCache()
 logger = logging.getLogger(__name__)
 
 
-def fetch_all_embeddings(repo_info, comment_id):
+def fetch_ranking_matrix(repo_info, comment_id, corpus=None, precision=EMBEDDING_PRECISION):
+    """
+    Gets the ranking matrix of a repository's embeddings at its latest commit. Matrices are kept in
+    the process-wide ranking cache, so repeat reports against the same commit skip fetching and
+    unpacking the embedding documents. On a cache miss, the matrix is memory-mapped from the
+    repository's ranking snapshot if there is one, and only built from MongoDB otherwise.
+    Cached matrices and snapshots are keyed on the repository's generation as well, so matrices
+    built by any process before the repository was initialized again are never reused.
+
+    :param repo_info: Dictionary containing repository information, with the commit the embeddings are at.
+    :param comment_id: The comment to send status updates to.
+    :param corpus: If given, only the files of this filtered corpus are kept.
+    :param precision: The precision the matrix is scored in.
+    :return: The RankingMatrix, or an error response if the repository was not found.
+    """
     messenger = ProbotMessenger(repo_info, comment_id)
-    try:
-        query = {"repo_name": repo_info['repo_name'], "owner": repo_info['owner']}
-        repo_collection = db.get_repo_collection()
-        query_repo = repo_collection.find_one(query)
-        repo_embeddings = db.get_repo_files_embeddings(query_repo["_id"])
-        messenger.send("repo_embeddings_fetched")
-        return repo_embeddings
-    except Exception as e:
-        logger.info('Failed to find repo.')
-        messenger.send("repo_embeddings_retrieval_failed")
-        return jsonify({"message": "Failed to find repo."}), 405
+    fetched, failed = ("repo_embeddings_fetched", "repo_embeddings_retrieval_failed") if corpus is None else \
+        ("corpus_embeddings_fetched", "corpus_embeddings_retrieval_failed")
+
+    generation = retrieve_repo_generation(repo_info['owner'], repo_info['repo_name'])
+    key = (repo_info['owner'], repo_info['repo_name'], repo_info['latest_commit_sha'], generation, precision)
+    snapshot_path = ranking_snapshot_path(*key[:3])
+    ranking_matrix = ranking_cache.get(key)
+    if ranking_matrix is None:
+        ranking_matrix = load_ranking_snapshot(snapshot_path, precision, generation)
+        if ranking_matrix is None:
+            try:
+                query = {"repo_name": repo_info['repo_name'], "owner": repo_info['owner']}
+                query_repo = db.get_repo_collection().find_one(query)
+                # The whole repository is cached, so reports with and without GUI data share the matrix
+                ranking_matrix = build_ranking_matrix(query_repo, precision)
+            except Exception as e:
+                logger.info('Failed to find repo.')
+                messenger.send(failed)
+                return jsonify({"message": "Failed to find repo."}), 405
+            # Repositories stored before snapshots were enabled get one on their first report
+            if snapshot_path is not None and precision == EMBEDDING_PRECISION:
+                write_ranking_snapshot(ranking_matrix, snapshot_path, key[2], generation)
+        ranking_cache.put(key, ranking_matrix)
+    logger.info(f"Ranking cache: {ranking_cache.stats()}")
+    messenger.send(fetched)
+    return ranking_matrix.subset(corpus) if corpus is not None else ranking_matrix
+
+
+def build_ranking_matrix(repo, precision=EMBEDDING_PRECISION):
+    """
+    Builds the ranking matrix of all embeddings of a repository from MongoDB, with its ANN index
+    if one was fitted at initialization and its BM25 index if BM25_INDEX is set.
+
+    :param repo: The repository document.
+    :param precision: The precision the matrix is scored in.
+    :return: The RankingMatrix.
+    """
+    repo_embeddings = db.get_repo_files_embeddings(repo["_id"])
+    centroids = unpack_ann_index(repo.get('ann_index'))
+    ann_lists = db.get_repo_files_ann_lists(repo["_id"]) if centroids is not None else {}
+    file_terms = db.get_repo_files_terms(repo["_id"]) if BM25_INDEX else {}
+    return RankingMatrix.from_embeddings(repo_embeddings, precision, centroids=centroids,
+                                         ann_lists=[ann_lists.get(route) for route, _ in repo_embeddings],
+                                         file_terms=[file_terms.get(route) for route, _ in repo_embeddings])
 
 
-def fetch_corpus_embeddings(repo_info, corpus, comment_id):
-    messenger = ProbotMessenger(repo_info, comment_id)
+def store_ranking_snapshot(owner, repo_name, commit_sha):
+    """
+    Writes the ranking snapshot of a repository at a commit after its embeddings were stored or
+    patched, so the workers serving its reports memory-map it instead of scanning MongoDB.
+    Does nothing if RANKING_SNAPSHOT_DIR is not set.
+
+    :param owner: The repository owner's username.
+    :param repo_name: The repository name.
+    :param commit_sha: The commit the stored embeddings are at.
+    """
+    snapshot_path = ranking_snapshot_path(owner, repo_name, commit_sha)
+    if snapshot_path is None:
+        return
+    repo = db.get_repo_collection().find_one({'repo_name': repo_name, 'owner': owner})
+    write_ranking_snapshot(build_ranking_matrix(repo), snapshot_path, commit_sha, repo.get('stored_at'))
+
+
+def write_ranking_snapshot(ranking_matrix, snapshot_path, commit_sha, generation):
+    # Reports are still ranked from MongoDB without a snapshot, so failing to write one is not fatal
     try:
-        query = {"repo_name": repo_info['repo_name'], "owner": repo_info['owner']}
-        repo_collection = db.get_repo_collection()
-        query_repo = repo_collection.find_one(query)
-        corpus_embeddings = db.get_corpus_files_embeddings(query_repo["_id"], corpus)
-        messenger.send("corpus_embeddings_fetched")
-        return corpus_embeddings
+        save_ranking_snapshot(ranking_matrix, snapshot_path, commit_sha, generation)
     except Exception as e:
-        logger.info('Failed to find repo.')
-        messenger.send("corpus_embeddings_retrieval_failed")
-        return jsonify({"message": "Failed to find repo."}), 405
+        logger.warning(f"Failed to write ranking snapshot to {snapshot_path}: {e}")
+
+
+def get_ranking_cache_stats():
+    """
+    Gets the hit, miss and eviction counters and the size of the process-wide ranking cache.
+
+    :return: A dict of the cache counters.
+    """
+    return ranking_cache.stats()
+
+
+def get_result_cache_stats():
+    """
+    Gets the exact hit, near-duplicate hit and miss counters of the process-wide result cache.
+
+    :return: A dict of the cache counters.
+    """
+    return result_cache.stats()
+
+
+def fetch_repo_projection(repo_info):
+    """
+    Retrieves the embedding projection fitted for a repository at initialization.
+
+    :param repo_info: Dictionary containing repository information.
+    :return: The [hidden, dim] projection matrix, or None if the repository's embeddings are not projected.
+    """
+    repo = db.get_repo_collection().find_one(
+        {'repo_name': repo_info['repo_name'], 'owner': repo_info['owner']},
+        {'projection': 1}
+    )
+    return unpack_projection(repo.get('projection')) if repo else None
 
 
 def update_sha(repo_info):
@@ -52,43 +151,69 @@ def update_sha(repo_info):
 
 
 def update_embeddings_in_db(changed_files, clean_files, repo_info):
-    repo_id = db.get_repo_collection().find_one(
+    """
+    Upserts the embeddings of added and modified files and removes those of removed files.
+    The repository's cached rankings are dropped; its ranking matrix is patched afterwards.
+
+    :param changed_files: The changed files dict from create_changed_files_dict.
+    :param clean_files: The preprocessed changed files from clean_embedding_paths_for_db.
+    :param repo_info: Dictionary containing repository information.
+    :return: A list of (route, packed embedding, IVF lists, term counts) tuples of the upserted files.
+    """
+    repo = db.get_repo_collection().find_one(
         {'repo_name': repo_info['repo_name'], 'owner': repo_info['owner']}
-    )['_id']
+    )
+    repo_id = repo['_id']
     logger.info(f"Retrieved repo id : {repo_id}")
+    result_cache.invalidate(repo_info['owner'], repo_info['repo_name'])
+    # Changed files are projected like the rest of the repo's embeddings, and assigned to the
+    # lists of the repo's ANN index if it has one
+    projection = unpack_projection(repo.get('projection'))
+    centroids = unpack_ann_index(repo.get('ann_index'))
     # Add and update embeddings
+    upserted_files = []
     for clean_file in clean_files:
         file_path = clean_file['path']
-        embedding = clean_file['embedding_text']
+        embedding = project_embeddings(clean_file['embedding_text'], projection)
+        update = {"embedding": pack_embeddings(embedding), "last_updated": datetime.utcnow().isoformat() + 'Z'}
+        if centroids is not None:
+            update["ann_lists"] = assign_lists(embedding, centroids)
+        if clean_file.get('terms') is not None:
+            update["terms"] = clean_file['terms']
 
         # Upsert the document in the embeddings collection
         db.get_embeddings_collection().update_one(
             {"repo_id": repo_id, "route": file_path},
-            {"$set": {"embedding": embedding, "last_updated": datetime.utcnow().isoformat() + 'Z'}},
+            {"$set": update},
             upsert=True
         )
         logger.info(f"Upserted embedding for file: {file_path}")
+        upserted_files.append((file_path, update["embedding"], update.get("ann_lists"), update.get("terms")))
     # Remove embeddings
     for file_path in changed_files.get("removed", []):
         db.get_embeddings_collection().delete_one({"repo_id": repo_id, "route": file_path})
         logger.info(f"Removed embedding for file: {file_path}")
     logger.info("Database updated with added, modified, and removed files.")
+    return upserted_files
 
 
 def send_initialized_data_to_db(repo_info, code_files, filtered_files):
     """
     Stores the repo document in the 'repos' collection and each code file document in the 'code_files' collection.
+    The repo document is written last; until then its commit SHA is cleared, so reports are refused
+    instead of ranking a mix of new and stale embeddings, also if encoding or storing fails partway.
 
     :param repo_info: Repository metadata to store in 'repos' collection.
-    :param code_files: List of code files with embeddings to store in 'code_files' collection.
+    :param code_files: Iterable of code files with embeddings to store in 'code_files' collection. Files are
+                       stored one by one as the iterable produces them.
     :raises: Exception if storage fails.
     """
     logger.debug("Storing repo information and embeddings in MongoDB.")
     try:
-        # Insert or update the repository information in 'repos' collection
-        repo = db.get_repo_collection().find_one_and_replace(
+        # Get or create the repository document the code files reference, without a commit SHA for now
+        repo = db.get_repo_collection().find_one_and_update(
             {'repo_name': repo_info['repo_name'], 'owner': repo_info['owner']},
-            repo_info,
+            {'$set': {'commit_sha': None}},
             upsert=True,
             return_document=True  # Retrieve the updated document
         )
@@ -109,7 +234,16 @@ def send_initialized_data_to_db(repo_info, code_files, filtered_files):
                 upsert=True
             )
             logger.info(f"Stored embedding for file: {file_info['route']}")
+
+        # Every file is stored, so the commit SHA, projection and ANN index of the new embeddings can go live
+        db.get_repo_collection().replace_one({'_id': repo_id}, repo_info)
         logger.info('Repo and code file embeddings stored in database successfully.')
+        # Reports ranked while the files were stored may have cached matrices and rankings of a mix of
+        # embeddings. Other processes' entries are not reachable from here, but the new stored_at
+        # changes the generation they are keyed on
+        ranking_cache.invalidate(repo_info['owner'], repo_info['repo_name'])
+        result_cache.invalidate(repo_info['owner'], repo_info['repo_name'])
+        store_ranking_snapshot(repo_info['owner'], repo_info['repo_name'], repo_info['commit_sha'])
     except Exception as e:
         logger.error(f"Failed to store embeddings in database: {e}")
         raise
@@ -136,6 +270,24 @@ def retrieve_stored_sha(owner, repo_name):
     return stored_commit_sha
 
 
+def retrieve_repo_generation(owner, repo_name):
+    """
+    Retrieves the generation of a repository's stored embeddings, i.e. the time it was last
+    initialized. Cached ranking matrices, ranking snapshots and cached rankings are keyed on it.
+
+    :param owner: The repository owner's username.
+    :param repo_name: The repository name.
+    :return: The repository's stored_at, or None if the repository is not stored.
+    :raises: Aborts the request with a 500 error if retrieval fails.
+    """
+    try:
+        repo = db.get_repo_collection().find_one({'repo_name': repo_name, 'owner': owner}, {'stored_at': 1})
+    except Exception as e:
+        logger.error(f"Database query failed: {e}")
+        abort(500, description="Failed to retrieve repository from database.")
+    return repo.get('stored_at') if repo else None
+
+
 def retrieve_sha_from_db(owner, repo_name):
     """
     Retrieves the stored commit SHA for the specified repository from MongoDB.
@@ -209,9 +361,10 @@ def process_and_patch_embeddings(changed_files, repo_info):
     repo_dir = os.path.join('repos', repo_info['owner'], repo_info['repo_name'])
 
     # Add updating to the files db here
-    repo_id = db.get_repo_collection().find_one(
+    repo = db.get_repo_collection().find_one(
         {'repo_name': repo_info['repo_name'], 'owner': repo_info['owner']}
-    )['_id']
+    )
+    repo_id = repo['_id']
     for change_type, files in changed_files.items():
         for file in files:
             route = str(file)
@@ -222,12 +375,58 @@ def process_and_patch_embeddings(changed_files, repo_info):
                 insert_to_code_db(route, repo_id)
 
     # Preprocess the changed source code files
-    preprocessed_files = preprocess_source_code(repo_dir)
+    preprocessed_files = preprocess_source_code(repo_dir, with_terms=bool(BM25_INDEX))
     for file in preprocessed_files:
         logger.info(f"Preprocessed changed file: {file}")
     clean_files = clean_embedding_paths_for_db(preprocessed_files, repo_dir)
-    update_embeddings_in_db(changed_files, clean_files, repo_info)
+    upserted_files = update_embeddings_in_db(changed_files, clean_files, repo_info)
     update_sha(repo_info)
+    patch_ranking_matrix(repo_info, repo.get('commit_sha'), repo.get('stored_at'), changed_files, upserted_files)
+
+
+def patch_ranking_matrix(repo_info, stored_commit_sha, generation, changed_files, upserted_files,
+                         precision=EMBEDDING_PRECISION):
+    """
+    Advances a repository's ranking matrix from the stored commit to the latest one by patching
+    the rows of the changed files, instead of rebuilding it from every embedding document. The
+    matrix at the stored commit is taken from the ranking cache or the ranking snapshot; the
+    patched matrix replaces it in the cache in one step and is written as the new snapshot.
+    Without a matrix at the stored commit, the snapshot is rebuilt from MongoDB.
+
+    :param repo_info: Dictionary containing repository information.
+    :param stored_commit_sha: The commit the ranking matrix was at before the patch.
+    :param generation: The repository's stored_at, which patches leave unchanged.
+    :param changed_files: The changed files dict from create_changed_files_dict.
+    :param upserted_files: The upserted files from update_embeddings_in_db.
+    :param precision: The precision of the cached matrix.
+    """
+    owner, repo_name, commit_sha = repo_info['owner'], repo_info['repo_name'], repo_info['latest_commit_sha']
+    ranking_matrix = None
+    if stored_commit_sha:
+        ranking_matrix = ranking_cache.get((owner, repo_name, stored_commit_sha, generation, precision))
+        if ranking_matrix is None:
+            snapshot_path = ranking_snapshot_path(owner, repo_name, stored_commit_sha)
+            ranking_matrix = load_ranking_snapshot(snapshot_path, precision, generation)
+    if ranking_matrix is not None:
+        # The embeddings are already stored, so a failed patch only means rebuilding the matrix
+        try:
+            ranking_matrix = ranking_matrix.patch([(route, embedding) for route, embedding, _, _ in upserted_files],
+                                                  changed_files.get("removed", []),
+                                                  ann_lists=[ann_lists for _, _, ann_lists, _ in upserted_files],
+                                                  file_terms=[terms for _, _, _, terms in upserted_files])
+        except Exception as e:
+            logger.warning(f"Failed to patch ranking matrix of {owner}/{repo_name}: {e}")
+            ranking_matrix = None
+    if ranking_matrix is None:
+        ranking_cache.invalidate(owner, repo_name)
+        store_ranking_snapshot(owner, repo_name, commit_sha)
+        return
+
+    ranking_cache.advance((owner, repo_name, commit_sha, generation, precision), ranking_matrix)
+    logger.info(f"Patched ranking matrix of {owner}/{repo_name} to {commit_sha}.")
+    snapshot_path = ranking_snapshot_path(owner, repo_name, commit_sha)
+    if snapshot_path is not None:
+        write_ranking_snapshot(ranking_matrix, snapshot_path, commit_sha, generation)
 
 
 def retrieve_repo_file_contents(query):
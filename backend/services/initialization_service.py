@@ -2,10 +2,19 @@ from datetime import datetime
 import logging
 import os
 from flask import abort, jsonify
+from experimental_unixcoder.ann_index import ANN_INDEX, assign_lists, fit_ann_index, pack_ann_index
+from experimental_unixcoder.bm25_index import BM25_INDEX
+from experimental_unixcoder.embedding_codec import pack_embeddings
+from experimental_unixcoder.embedding_projection import (
+    EMBEDDING_PROJECTION,
+    fit_projection,
+    pack_projection,
+    project_embeddings
+)
 from services.db_service import send_initialized_data_to_db
 from services.messenger_service import ProbotMessenger
-from utils.preprocess_source_code import preprocess_source_code
-from utils.file_utils import clean_embedding_paths_for_db, post_process_cleanup
+from utils.preprocess_source_code import iter_preprocess_source_code
+from utils.file_utils import clean_embedding_path_for_db, post_process_cleanup
 from utils.filter import filter_files
 from utils.git_utils import clone_repo, extract_and_validate_repo_info
 
@@ -49,31 +58,63 @@ def process_and_store_embeddings(repo_info, messenger):
         messenger.send("no_java_files")
         raise ValueError("No Java files found in repository.")
 
-    # Preprocess the source code files
-    preprocessed_files = preprocess_source_code(repo_dir)
-    messenger.send("embeddings_calculated")
-    for file in preprocessed_files:
-        logger.info(f"Preprocessed file: {file}")
+    # Preprocess the source code files in the encoder pool; files stream back in order while
+    # earlier ones are already being stored
+    preprocessed_files = iter_preprocess_source_code(repo_dir, with_terms=bool(BM25_INDEX))
 
-    # Clean data
-    clean_paths = clean_embedding_paths_for_db(preprocessed_files, repo_dir)
+    # Fitting a projection or an ANN index needs every embedding of the repo, so the files are collected first
+    projection = None
+    centroids = None
+    if EMBEDDING_PROJECTION != "none" or ANN_INDEX != "none":
+        preprocessed_files = list(preprocessed_files)
+    if EMBEDDING_PROJECTION != "none":
+        projection = fit_projection([preprocessed_file[2] for preprocessed_file in preprocessed_files])
+        logger.info(f"Fitted {EMBEDDING_PROJECTION} projection of the embeddings.")
+    if ANN_INDEX != "none":
+        # The index is fitted on the embeddings as they are stored, i.e. after the projection
+        centroids = fit_ann_index([project_embeddings(preprocessed_file[2], projection)
+                                   for preprocessed_file in preprocessed_files])
+        if centroids is not None:
+            logger.info(f"Fitted {ANN_INDEX} index with {len(centroids)} lists.")
 
     # Create repo document
     repo_document = {
         'repo_name': repo_info['repo_name'],
         'owner': repo_info['owner'],
         'commit_sha': repo_info['latest_commit_sha'],
-        'stored_at': datetime.utcnow().isoformat() + 'Z'
+        'stored_at': datetime.utcnow().isoformat() + 'Z',
+        'projection': pack_projection(projection),
+        'ann_index': pack_ann_index(centroids)
     }
 
-    # Create embedddings documents
-    code_file_documents = [
-        {
-            'route': file['path'],
-            'embedding': file['embedding_text'],
-            'last_updated': datetime.utcnow().isoformat() + 'Z'
-        }
-        for file in clean_paths
-    ]
+    # Create embedddings documents, cleaning the paths of each file as it arrives and packing
+    # its (projected) embeddings in the configured storage precision
+    code_file_documents = (
+        create_code_file_document(clean_embedding_path_for_db(preprocessed_file, repo_dir), projection, centroids)
+        for preprocessed_file in preprocessed_files
+    )
+    send_initialized_data_to_db(repo_document, notify_when_calculated(code_file_documents, messenger), filtered_files)
+
+
+def notify_when_calculated(code_file_documents, messenger):
+    """
+    Passes the code file documents through as they are encoded, and sends the calculated and
+    storing statuses once the last one was, before the repo document is stored.
+    """
+    yield from code_file_documents
+    messenger.send("embeddings_calculated")
     messenger.send("storing_embeddings")
-    send_initialized_data_to_db(repo_document, code_file_documents, filtered_files)
+
+
+def create_code_file_document(file, projection, centroids):
+    embedding = project_embeddings(file['embedding_text'], projection)
+    document = {
+        'route': file['path'],
+        'embedding': pack_embeddings(embedding),
+        'last_updated': datetime.utcnow().isoformat() + 'Z'
+    }
+    if centroids is not None:
+        document['ann_lists'] = assign_lists(embedding, centroids)
+    if file.get('terms') is not None:
+        document['terms'] = file['terms']
+    return document
@@ -1,21 +1,30 @@
 import logging
 from flask import abort, jsonify
-from experimental_unixcoder.bug_localization import BugLocalization
+from experimental_unixcoder.bm25_index import BM25_FALLBACK_QUEUE, BM25_INDEX, term_counts
+from experimental_unixcoder.embedding_projection import project_embeddings
+from experimental_unixcoder.model_registry import get_bug_localizer, get_encoder_service
+from experimental_unixcoder.ranking import RankingMatrix
+from experimental_unixcoder.result_cache import result_key
 from services.db_service import (
-    fetch_all_embeddings,
-    fetch_corpus_embeddings,
+    fetch_ranking_matrix,
+    fetch_repo_projection,
     process_and_patch_embeddings,
+    result_cache,
     retrieve_repo_file_contents,
+    retrieve_repo_generation,
     retrieve_stored_sha
 )
 from services.messenger_service import ProbotMessenger
-from utils.preprocess_bug_report import preprocess_bug_report
+from utils.preprocess_bug_report import preprocess_bug_report, preprocess_bug_reports
 from utils.file_utils import post_process_cleanup, write_file_for_report_processing
 from utils.git_utils import extract_and_validate_repo_info, partial_clone
 from utils.extract_gui_data import build_corpus, extract_gs_terms, extract_sc_terms, get_boosted_files
 
 logger = logging.getLogger(__name__)
 
+# Largest number of ranked files /report/batch returns per report
+MAX_BATCH_TOP_K = 1000
+
 
 def process_report(data):
     GUI_DATA = True
@@ -49,40 +58,43 @@ def process_report(data):
         messenger.send("report_writing_failed", error=str(e))
         abort(500, description="Failed to write issue to file")
 
-    # Preprocess bug report
+    # Preprocess bug report. Repeat reports reuse their cached ranking before encoding and near-duplicate
+    # reports right after it; if the encoder is saturated, the report is only normalized and ranked by BM25
+    lexical_fallback = encoder_saturated()
+    generation = retrieve_repo_generation(repo_info['owner'], repo_info['repo_name'])
     try:
-        preprocessed_bug_report = preprocess_bug_report(report_file_path, sc_terms)
+        normalized_bug_report, _ = preprocess_bug_report(report_file_path, sc_terms, return_normalized=True,
+                                                         encode=False)
+        cache_key = result_key(repo_info['owner'], repo_info['repo_name'], repo_info['latest_commit_sha'],
+                               normalized_bug_report, sc_terms, gs_terms, generation)
+        bug_report_embeddings = None
+        cached_files = result_cache.get(cache_key)
+        if cached_files is None and not lexical_fallback:
+            bug_report_embeddings = get_encoder_service().encode_text(normalized_bug_report)
+            cached_files = result_cache.get_similar(cache_key, bug_report_embeddings)
+        query_terms = term_counts(normalized_bug_report)
         messenger.send("bug_report_preprocessed")
     except Exception as e:
         logger.error(f"Failed to preprocess bug report: {e}")
         messenger.send("preprocessing_failed", error=str(e))
         abort(500, description="Failed to preprocess bug report")
 
-    # Retrieve the stored SHA
-    stored_commit_sha = retrieve_stored_sha(repo_info['owner'], repo_info['repo_name'])
-    if not stored_commit_sha:
-        logger.info("No stored commit SHA found.")
-        messenger.send("sha_retrieval_failed")
-        return jsonify({"message": "Failed because no stored commit SHA"}), 500
-    logger.info(f"Stored commit SHA: {stored_commit_sha}")
-    if stored_commit_sha == repo_info['latest_commit_sha']:
-        logger.info('Embeddings are up to date.')
-        messenger.send("embeddings_status")
-    else:
-        logger.info('Embeddings are outdated. Recomputing embeddings.')
-        messenger.send("embeddings_outdated")
-        try:
-            changed_files = partial_clone(stored_commit_sha, repo_info)
-            process_and_patch_embeddings(changed_files, repo_info)
-            post_process_cleanup(repo_info)
-            messenger.send("embeddings_updated")
-        except Exception as e:
-            logger.error(f"Failed to recompute embeddings: {e}")
-            messenger.send("init_failed", error=str(e))
-            abort(500, description=str(e))
+    if cached_files is not None:
+        logger.info(f"Reusing cached ranking. Result cache: {result_cache.stats()}")
+        messenger.send("bug_localization_completed")
+        return jsonify({"message": "Report processed successfully", "ranked_files": cached_files}), 200
+
+    # Check the stored SHA and patch the embeddings if they are outdated
+    error_response = update_outdated_embeddings(repo_info, messenger)
+    if error_response is not None:
+        return error_response
+
+    # Project the bug report like the repo's embeddings, if a projection was fitted at initialization
+    projection = fetch_repo_projection(repo_info)
+    preprocessed_bug_report = project_embeddings(bug_report_embeddings, projection)
 
     # Initialize Bug Localizer and ranked list
-    bug_localizer = BugLocalization()
+    bug_localizer = get_bug_localizer()
     top_ten_files = []
 
     # Ranking generation with GUI data
@@ -101,11 +113,16 @@ def process_report(data):
         corpus = build_corpus(repo_files, sc_terms, repo_info)
         boosted_files = get_boosted_files(repo_files, gs_terms)
 
-        # Fetch corpus embeddings from database
-        corpus_embeddings = fetch_corpus_embeddings(repo_info, corpus, comment_id)
+        # Fetch the corpus' ranking matrix from the ranking cache or the database
+        corpus_matrix = fetch_ranking_matrix(repo_info, comment_id, corpus)
+        if not isinstance(corpus_matrix, RankingMatrix):
+            return corpus_matrix
+        if lexical_fallback:
+            preprocessed_bug_report = encode_without_bm25(preprocessed_bug_report, normalized_bug_report,
+                                                          corpus_matrix, projection)
 
         # Apply boosting and create rankings
-        ranked_files = bug_localizer.rank_files(preprocessed_bug_report, corpus_embeddings)
+        ranked_files = bug_localizer.rank_files(preprocessed_bug_report, corpus_matrix, query_terms=query_terms)
         reranked_files = reorder_rankings(ranked_files, boosted_files)
 
         # Only return top ten files
@@ -114,18 +131,185 @@ def process_report(data):
 
     # Ranking generation without GUI data
     else:
-        # Fetch all embeddings from DB
-        repo_embeddings = fetch_all_embeddings(repo_info, comment_id)
-        ranked_files = bug_localizer.rank_files(preprocessed_bug_report, repo_embeddings)
+        # Fetch the repo's ranking matrix from the ranking cache or the database
+        repo_matrix = fetch_ranking_matrix(repo_info, comment_id)
+        if not isinstance(repo_matrix, RankingMatrix):
+            return repo_matrix
+        if lexical_fallback:
+            preprocessed_bug_report = encode_without_bm25(preprocessed_bug_report, normalized_bug_report,
+                                                          repo_matrix, projection)
+        # Nothing is boosted, so only the top ten need to be selected
+        ranked_files = bug_localizer.rank_files(preprocessed_bug_report, repo_matrix, top_k=10,
+                                                query_terms=query_terms)
 
         # Only return top ten files
         for i in range(min(10, len(ranked_files))):
             top_ten_files.append(ranked_files[i])
         messenger.send("no_gui_data_note")
+    # Lexical fallback rankings are not cached, so the report is ranked densely once the encoder has caught up
+    if not lexical_fallback:
+        result_cache.put(cache_key, top_ten_files, bug_report_embeddings)
     messenger.send("bug_localization_completed")
     return jsonify({"message": "Report processed successfully", "ranked_files": top_ten_files}), 200
 
 
+def process_report_batch(data):
+    """
+    Localizes many bug reports of one repository at once, e.g. to back-fill the open issues of a
+    newly initialized repository. The reports are encoded together in shared batches and scored
+    against the repository's ranking matrix with one matrix product, instead of one /report each.
+    Reports whose trace has GUI data are filtered to their corpus and boosted like in /report.
+
+    :param data: A dict with the repository, the reports as a list of dicts with an issue, an optional
+                 trace and an optional id, the optional comment_id and the optional top_k (1 to
+                 MAX_BATCH_TOP_K, default 10).
+    :return: A response with one dict of the id, ranked_files and gui_data per report, in request order.
+    :raises: aborts the request with a 400 error if validation fails.
+    """
+    repository = data.get('repository')
+    reports = data.get('reports')
+    comment_id = data.get('comment_id')
+    if comment_id is None:
+        comment_id = -1
+    top_k = data.get('top_k')
+    if top_k is None:
+        top_k = 10
+
+    if not repository or not reports or not isinstance(reports, list) or \
+            not all(isinstance(report, dict) and report.get('issue') for report in reports):
+        abort(400, description="Missing 'repository', 'reports' or an 'issue' in the data")
+    if isinstance(top_k, bool) or not isinstance(top_k, int) or not 1 <= top_k <= MAX_BATCH_TOP_K:
+        abort(400, description=f"'top_k' must be an integer from 1 to {MAX_BATCH_TOP_K}")
+    logger.info(f"Received {len(reports)} reports from /report/batch request.")
+
+    # Extract Screen Component / GUI Screen Terms of every report
+    sc_terms = [extract_sc_terms(report.get('trace')) for report in reports]
+    gs_terms = [extract_gs_terms(report.get('trace')) for report in reports]
+    gui_data = [bool(sc and gs) for sc, gs in zip(sc_terms, gs_terms)]
+
+    repo_info = extract_and_validate_repo_info(repository)
+    messenger = ProbotMessenger(repo_info, comment_id)
+    messenger.send("report_processing_started")
+
+    # Preprocess and encode all bug reports together
+    try:
+        normalized_bug_reports, preprocessed_bug_reports = preprocess_bug_reports(
+            [report['issue'] for report in reports], sc_terms, verbose=False, return_normalized=True)
+        messenger.send("bug_report_preprocessed")
+    except Exception as e:
+        logger.error(f"Failed to preprocess bug reports: {e}")
+        messenger.send("preprocessing_failed", error=str(e))
+        abort(500, description="Failed to preprocess bug reports")
+
+    # Check the stored SHA and patch the embeddings if they are outdated
+    error_response = update_outdated_embeddings(repo_info, messenger)
+    if error_response is not None:
+        return error_response
+
+    projection = fetch_repo_projection(repo_info)
+    preprocessed_bug_reports = [project_embeddings(report, projection) for report in preprocessed_bug_reports]
+
+    # Source code files are only needed to build the corpus and boosted files of reports with GUI data
+    repo_files = []
+    if any(gui_data):
+        try:
+            query = {"repo_name": repo_info['repo_name'], "owner": repo_info['owner']}
+            repo_files = retrieve_repo_file_contents(query)
+            messenger.send("source_code_files_fetched")
+        except Exception as e:
+            logger.info('Failed to find repo.')
+            messenger.send("source_code_retrieval_failed")
+            return jsonify({"message": "Failed to find repo."}), 405
+
+    repo_matrix = fetch_ranking_matrix(repo_info, comment_id)
+    if not isinstance(repo_matrix, RankingMatrix):
+        return repo_matrix
+    bug_localizer = get_bug_localizer()
+    query_terms = [term_counts(text) for text in normalized_bug_reports]
+
+    # Reports with GUI data are ranked against their corpus' matrix like in /report, since BM25
+    # candidates, score fusion and ANN lists depend on the files ranked. Reports with the same
+    # corpus are scored together, and the reports without GUI data against the whole repository
+    groups = {}
+    for i, (report_sc_terms, has_gui_data) in enumerate(zip(sc_terms, gui_data)):
+        corpus = tuple(build_corpus(repo_files, report_sc_terms, repo_info)) if has_gui_data else None
+        groups.setdefault(corpus, []).append(i)
+
+    rankings = [None] * len(reports)
+    for corpus, indices in groups.items():
+        ranking_matrix = repo_matrix if corpus is None else repo_matrix.subset(list(corpus))
+        group_rankings = bug_localizer.rank_files_many([preprocessed_bug_reports[i] for i in indices],
+                                                       ranking_matrix, top_k=top_k if corpus is None else None,
+                                                       query_terms=[query_terms[i] for i in indices])
+        for i, ranked_files in zip(indices, group_rankings):
+            rankings[i] = ranked_files
+
+    results = []
+    for report, ranked_files, report_gs_terms, has_gui_data in zip(reports, rankings, gs_terms, gui_data):
+        if has_gui_data:
+            ranked_files = reorder_rankings(ranked_files, get_boosted_files(repo_files, report_gs_terms))
+        results.append({"id": report.get('id'), "ranked_files": ranked_files[:top_k], "gui_data": has_gui_data})
+
+    messenger.send("bug_localization_completed")
+    return jsonify({"message": "Reports processed successfully", "results": results}), 200
+
+
+def encoder_saturated():
+    """
+    Checks whether reports should skip the encoder and be ranked by BM25 alone, because BM25
+    is enabled and at least BM25_FALLBACK_QUEUE texts are already waiting to be encoded.
+    """
+    return bool(BM25_INDEX and BM25_FALLBACK_QUEUE > 0 and get_encoder_service().pending >= BM25_FALLBACK_QUEUE)
+
+
+def encode_without_bm25(preprocessed_bug_report, normalized_bug_report, ranking_matrix, projection):
+    """
+    Encodes a bug report that skipped the encoder after all if its ranking matrix has no BM25
+    index to rank it by, e.g. for repositories initialized before BM25_INDEX was set.
+
+    :return: The (projected) embeddings of the bug report.
+    """
+    if preprocessed_bug_report is not None or not isinstance(ranking_matrix, RankingMatrix) or \
+            ranking_matrix.bm25 is not None:
+        return preprocessed_bug_report
+    logger.info("No BM25 index to rank the bug report by, encoding it instead.")
+    return project_embeddings(get_encoder_service().encode_text(normalized_bug_report), projection)
+
+
+def update_outdated_embeddings(repo_info, messenger):
+    """
+    Compares the stored commit SHA of a repository with its latest one, and patches the embeddings
+    of the changed files if they are outdated.
+
+    :param repo_info: Dictionary containing repository information.
+    :param messenger: The messenger status updates are sent with.
+    :return: None if the embeddings are up to date, or an error response if no SHA is stored.
+    """
+    # Retrieve the stored SHA
+    stored_commit_sha = retrieve_stored_sha(repo_info['owner'], repo_info['repo_name'])
+    if not stored_commit_sha:
+        logger.info("No stored commit SHA found.")
+        messenger.send("sha_retrieval_failed")
+        return jsonify({"message": "Failed because no stored commit SHA"}), 500
+    logger.info(f"Stored commit SHA: {stored_commit_sha}")
+    if stored_commit_sha == repo_info['latest_commit_sha']:
+        logger.info('Embeddings are up to date.')
+        messenger.send("embeddings_status")
+    else:
+        logger.info('Embeddings are outdated. Recomputing embeddings.')
+        messenger.send("embeddings_outdated")
+        try:
+            changed_files = partial_clone(stored_commit_sha, repo_info)
+            process_and_patch_embeddings(changed_files, repo_info)
+            post_process_cleanup(repo_info)
+            messenger.send("embeddings_updated")
+        except Exception as e:
+            logger.error(f"Failed to recompute embeddings: {e}")
+            messenger.send("init_failed", error=str(e))
+            abort(500, description=str(e))
+    return None
+
+
 def reorder_rankings(ranked_files: list[tuple], gs_files: list[str]):
     """
     Boosts GS files to the top of the ranking while preserving their relative order.
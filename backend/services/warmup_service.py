@@ -0,0 +1,101 @@
+import logging
+import os
+import threading
+import time
+from database.database import Database
+from experimental_unixcoder.model_registry import get_bug_localizer, get_encoder_service
+from utils.preprocess import Preprocessor
+
+logger = logging.getLogger(__name__)
+
+# 1 loads the model, NLTK and the database connection in the background at startup; /ready reports 503 until done
+WARM_UP = int(os.environ.get("WARM_UP") or 0)
+WARM_UP_TEXT = "public class WarmUpActivity extends Activity void onCreate saved instance state button clicked"
+
+_lock = threading.Lock()
+_ready = threading.Event()
+_status = {"state": "pending", "steps": {}, "error": None}
+_thread = None
+
+
+def start_warm_up(enabled=WARM_UP):
+    """
+    Starts the warm-up in a background thread, so the app can answer /ready while it runs.
+    If warm-up is disabled, the process is marked ready right away.
+
+    :param enabled: Whether to warm up before reporting ready.
+    """
+    global _thread
+    if not enabled:
+        _status["state"] = "ready"
+        _ready.set()
+        return
+
+    with _lock:
+        if _thread is None:
+            _thread = threading.Thread(target=warm_up, name="warm-up", daemon=True)
+            _thread.start()
+
+
+def warm_up():
+    """
+    Loads everything the first /report would otherwise load lazily: the shared model and encoder
+    service, a forward pass through the encoder backend, NLTK's POS tagger and WordNet, and the
+    MongoDB connection. The process is marked ready once every step succeeded; after a failure it
+    stays unready and the failed step is reported by /ready.
+    """
+    _status["state"] = "warming"
+    steps = [("model", _load_model), ("encode", _encode), ("nltk", _load_nltk), ("database", _ping_database)]
+    for name, step in steps:
+        start = time.perf_counter()
+        try:
+            step()
+        except Exception as e:
+            logger.error(f"Warm-up failed at {name}: {e}")
+            _status["state"] = "failed"
+            _status["error"] = f"{name}: {e}"
+            return
+        _status["steps"][name] = round(time.perf_counter() - start, 3)
+        logger.info(f"Warm-up step {name} finished in {_status['steps'][name]}s.")
+
+    _status["state"] = "ready"
+    _ready.set()
+
+
+def is_ready():
+    """
+    Whether the warm-up has finished, or was disabled.
+
+    :return: True if the process can take traffic.
+    """
+    return _ready.is_set()
+
+
+def get_warm_up_status():
+    """
+    Gets the state of the warm-up.
+
+    :return: A dict with the state (pending, warming, ready or failed), the seconds each finished
+             step took and the error of a failed step.
+    """
+    return {"state": _status["state"], "steps": dict(_status["steps"]), "error": _status["error"]}
+
+
+def _load_model():
+    get_encoder_service()
+
+
+def _encode():
+    # Run the backend directly, as the embedding cache would skip the forward pass on later starts,
+    # under the lock requests encode with
+    bug_localizer = get_bug_localizer()
+    with bug_localizer.encode_lock:
+        bug_localizer.backend.encode_texts([WARM_UP_TEXT])
+
+
+def _load_nltk():
+    Preprocessor.lemmatize_tokens(Preprocessor.tokenize_text(WARM_UP_TEXT))
+
+
+def _ping_database():
+    Database().ping()
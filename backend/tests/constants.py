@@ -1,6 +1,4 @@
 # constants.py
-EXPECTED_BUG_REPORT_EMBEDDING = [[[-0.005703053902834654, -0.002631109906360507, 0.004381421487778425, 0.03371685370802879, 0.06763222068548203, 0.00294874282553792, 0.001891865860670805, 0.0668475553393364, 0.024662261828780174, -0.02726382575929165, 0.002117029158398509, -0.025108877569437027, -0.06005474552512169, -0.0264302846044302, 0.09928760677576065, 0.08651252090930939, -0.00416572904214263, 0.0029613228980451822, -0.003068496473133564, 0.03785737231373787, -0.07011955976486206, -0.06457522511482239, 0.044457897543907166, 0.019648736342787743, 0.06925676763057709, 0.02591860294342041, 0.02483528107404709, 0.028441905975341797, 0.020152054727077484, 0.03568654507398605, 0.010609752498567104, -0.007569228298962116, 0.01742701791226864, -0.014898075722157955, -0.020122814923524857, -0.009085094556212425, 0.012290946207940578, 0.00978194922208786, -0.04560399428009987, -0.08640258759260178, -0.054215963929891586, -0.057265251874923706, 0.004646046087145805, -0.01686789095401764, 0.011544961482286453, -0.02736956626176834, -0.06453181058168411, 0.02301975153386593, -0.0134955495595932, 0.04739067703485489, 0.008808685466647148, 0.07278288155794144, 0.009868297725915909, 0.04664796218276024, -0.019850309938192368, -0.01662774570286274, -0.008896312676370144, 0.07132723927497864, 0.04360095039010048, 0.0303020142018795, -0.012135043740272522, 0.0026390019338577986, 0.002933561336249113, 0.02738121710717678, 0.01484038308262825, -0.010817055590450764, -0.011451825499534607, 0.0019874803256243467, -0.03047487884759903, -0.02937263809144497, -0.0197080560028553, -0.012846260331571102, 0.04397290199995041, 0.002379288896918297, 0.0238815750926733, 0.049346644431352615, -0.04333514720201492, 0.025728780776262283, -0.03497857600450516, 0.04698532819747925, -0.011652092449367046, 0.04635733366012573, 0.0035879085771739483, 0.03323791176080704, 0.0059756143018603325, 0.015053206123411655, -0.0003095954016316682, -0.0011107329046353698, 0.03814868628978729, 0.012610957957804203, 0.038983043283224106, -0.005728497169911861, 0.0005929297767579556, 0.054085273295640945, -0.0408179871737957, 0.079172782599926, 0.03651024028658867, 0.00904614757746458, 0.010658640414476395, 0.030518552288413048, 0.09096822887659073, -0.05648455768823624, -0.0013023550854995847, 0.01319828536361456, -0.03703377768397331, -0.039891354739665985, -0.021077534183859825, -0.014907737262547016, 0.0953509584069252, -0.02138499729335308, -0.0043050493113696575, -0.006139667704701424, 0.05203403905034065, -0.013801496475934982, -0.02803059294819832, -0.011300246231257915, 0.01380897592753172, 0.011053754948079586, 0.0002390854206169024, 0.0296540018171072, 0.022022997960448265, -0.005949196871370077, 0.0012240789365023375, -0.007802140899002552, 0.030355561524629593, -0.02754948101937771, 0.025711456313729286, 0.03153598681092262, -0.02907111681997776, -0.031656064093112946, -0.026854978874325752, 0.019671523943543434, -0.025670692324638367, 0.008564774878323078, 0.03899301961064339, 0.040401797741651535, -0.026213455945253372, -0.008549259044229984, -0.07834004610776901, 0.04997287690639496, 0.010097119957208633, 0.03349728509783745, 0.002735783578827977, 0.023281041532754898, -0.0110621377825737, 0.010647090151906013, 0.028034748509526253, 0.015769166871905327, 0.005490576382726431, 0.003659371519461274, -0.045150358229875565, -0.04621657729148865, 0.09020811319351196, -0.08998088538646698, 0.0013152932515367866, 0.023991068825125694, 0.026488566771149635, -0.01975707709789276, 0.005475102923810482, -0.05087835341691971, -0.010483683086931705, -0.013785295188426971, 0.020512960851192474, -0.1183902844786644, -0.021980896592140198, 0.024847837164998055, 0.042749371379613876, 0.07516290247440338, -0.025241268798708916, -0.008541904389858246, -0.033663537353277206, -0.027285760268568993, -0.010376137681305408, -0.047226984053850174, -0.05883738398551941, -0.06007402762770653, 0.004946970380842686, 0.015761857852339745, -0.01614348217844963, -0.04866943135857582, 0.0008647958748042583, 0.012328492477536201, -0.07353021204471588, 0.049354590475559235, 0.017067551612854004, 0.040313322097063065, 0.0030776038765907288, 0.05593932420015335, -0.03582173213362694, 0.03662632778286934, 0.015009923838078976, -0.024017497897148132, -0.014073064550757408, 0.06337804347276688, -0.0004944023676216602, 0.013921228237450123, 0.042451728135347366, -0.05306650698184967, 0.035441335290670395, -0.0032533181365579367, 0.05539502948522568, 0.05138111114501953, -0.0022957087494432926, -0.03841504454612732, -0.03854307904839516, 0.0011837417259812355, 0.028499078005552292, 0.00047530903248116374, 0.03251864016056061, 0.01727077178657055, 0.06889688968658447, -0.09018413722515106, 0.0024737142957746983, -0.02965010143816471, -0.04936251789331436, -0.014858185313642025, 0.04059929773211479, -0.024044429883360863, 0.041070356965065, 0.025575460866093636, 0.010385594330728054, 0.00797824002802372, -0.003301898716017604, 0.00840108934789896, -0.008272109553217888, -0.008162996731698513, -0.026392348110675812, -0.010296088643372059, 0.028505852445960045, -0.058914344757795334, 0.05044981837272644, 0.01900848001241684, 0.042894959449768066, -0.1016906276345253, 0.004759033676236868, 0.02102307789027691, -0.011858257465064526, -0.03723779320716858, 0.04924554377794266, 0.03912892937660217, 0.017709773033857346, -0.11099698394536972, 0.03233787789940834, -0.012497520074248314, -0.03741105645895004, -0.04537288099527359, 0.012301046401262283, 0.010065325535833836, 0.09282846748828888, -0.0654241293668747, 0.029165342450141907, -0.04712977632880211, 0.032371845096349716, -0.012861725874245167, -0.0015067023923620582, -0.0066946460865437984, -0.02532631903886795, 0.012192894704639912, -0.013429868966341019, -0.010201262310147285, 0.02509770542383194, 0.03614112734794617, 0.04852285236120224, -0.03367496281862259, -0.0269099660217762, 0.010889699682593346, 0.002399053890258074, -0.030743323266506195, -0.03358042612671852, 0.0012346655130386353, 0.02928328327834606, 0.026374220848083496, -0.03894108161330223, -0.011739948764443398, -0.028316425159573555, -0.0067153372801840305, 0.039315205067396164, 0.037702757865190506, 0.01144795585423708, 0.048606716096401215, -0.042383745312690735, -0.023431604728102684, -0.0029965736903250217, -0.01688273809850216, -0.0006962026236578822, -0.007974754087626934, 0.032257821410894394, 0.1280302107334137, -0.07103372365236282, -0.03163805231451988, 0.02232551947236061, 0.05898874253034592, 0.023800626397132874, 0.01920265518128872, 0.0323251448571682, -0.0213401410728693, 0.007780768442898989, -0.02496800757944584, 0.05857761949300766, -0.028205446898937225, -0.012202588841319084, -0.022252967581152916, 0.04060036316514015, 0.020641712471842766, 0.004529057536274195, -0.005091294180601835, -0.07053376734256744, 0.011783118359744549, -0.017049210146069527, 0.00234129442833364, -0.0010342082241550088, 0.04200835898518562, -0.030166327953338623, 0.016312237828969955, 0.03989661857485771, 0.05517992377281189, -0.02946924790740013, 0.03044508770108223, -0.05825761705636978, -0.0516790896654129, 0.021089395508170128, 0.10195453464984894, -0.02852230705320835, -0.02516820840537548, -0.03426244109869003, 0.03907650709152222, -0.02073461003601551, 0.01126816961914301, 0.015358399599790573, 0.005513544660061598, -0.013885646127164364, -0.02352144941687584, -0.016763394698500633, 0.00550190731883049, -0.01011172030121088, -0.02960113435983658, -0.022731756791472435, -0.039584722369909286, 0.002272134879603982, 0.0304171871393919, -0.029159443452954292, -0.019596640020608902, -0.02417410910129547, -0.03197362646460533, 0.0079871267080307, -0.04370901361107826, -0.05641033872961998, 0.029827885329723358, 0.0019493520958349109, 0.0047319065779447556, 0.025292642414569855, 0.058465782552957535, 0.05133533105254173, -0.015505364164710045, 0.005349795334041119, 0.01944667473435402, 0.018034683540463448, 0.043267447501420975, 0.033726755529642105, -0.017262987792491913, -0.02593899704515934, -0.0013740935828536749, 0.0009978971211239696, 0.006018267013132572, -0.023078912869095802, 0.02583952248096466, -0.011249696835875511, -0.06749581545591354, 0.03022012859582901, -0.00588133605197072, 0.00113827851600945, 0.00460095377638936, 0.011937898583710194, -0.011035122908651829, 0.005162327084690332, -0.03816128149628639, 0.019533395767211914, 0.03923001512885094, 0.02658926136791706, -0.0035089715383946896, -0.029788248240947723, -0.027932893484830856, 0.0399218425154686, -0.004027017392218113, 0.02753874659538269, -0.002833660924807191, 0.04242924600839615, 0.029674017801880836, 0.054278552532196045, -0.015828076750040054, -0.04171796515583992, 0.004276159219443798, 0.03733085095882416, 0.017534399405121803, -0.011126454919576645, 0.010125009343028069, -0.0038117209915071726, -0.03000764362514019, -0.03923168405890465, 0.033423639833927155, 0.013372590765357018, 0.011164315044879913, 0.027369482442736626, 0.034149378538131714, -0.011933214962482452, 0.06897222250699997, 0.015651600435376167, 0.06224436312913895, 0.01803196221590042, 0.007763927336782217, -0.007383919321000576, -0.00901730451732874, 0.0011003046529367566, -0.012904343195259571, -0.025113577023148537, 0.04205157235264778, -0.05089950934052467, 0.0092972656711936, -0.0038365358486771584, 0.020811237394809723, 0.042041171342134476, -0.016100721433758736, 0.011206408962607384, 0.01094666775316, 0.04243984445929527, -0.006885466631501913, 0.02667197398841381, -0.040652479976415634, -0.0192607082426548, -0.08146563917398453, -0.02696196362376213, -0.0008630715892650187, -0.017777223140001297, 0.03281913697719574, -0.01028495654463768, 0.02203517034649849, -0.043135061860084534, 0.0042272587306797504, 0.07062394171953201, -0.05227877199649811, -0.01712900958955288, 0.04827478900551796, -0.04594779014587402, -0.026978492736816406, 0.02646997757256031, 0.0114977415651083, 0.00773361511528492, 0.045401692390441895, -0.00437345914542675, -0.011260389350354671, 0.04303130507469177, 0.004840622656047344, 0.04006383195519447, -0.0325167179107666, 0.009527662768959999, 0.06921248883008957, 0.008740265853703022, -0.015829993411898613, 0.03602335974574089, 0.0438479408621788, -0.005656673107296228, 0.03293604403734207, -0.005328239407390356, -0.02147240936756134, 0.011419500224292278, -0.018148645758628845, -0.02755112387239933, -0.0337156243622303, -0.015241389162838459, 0.03346507251262665, -0.00957916583865881, 0.03334358334541321, 0.015650959685444832, -0.027977874502539635, -0.03365512564778328, 0.011886530555784702, 0.04761241003870964, -0.057532913982868195, 0.05174108222126961, -0.05375104770064354, -0.004052850417792797, 0.021189644932746887, 0.06251253932714462, 0.05646371468901634, -0.030681731179356575, -0.024954846128821373, -0.030464764684438705, -0.015439317561686039, 0.01570187509059906, 0.01095878891646862, -0.008325898088514805, 0.008475881069898605, 0.008003625087440014, 0.025071946904063225, -0.0495571531355381, 0.023300187662243843, -0.03270643949508667, -0.005066726356744766, -0.031221456825733185, 0.013922696933150291, 0.033036258071660995, 0.01078823022544384, -0.033909473568201065, -0.020070549100637436, 0.033948950469493866, 0.03646610677242279, 0.02447771467268467, 0.009570790454745293, 0.015224880538880825, 0.037009552121162415, 0.05197737738490105, 0.06262791156768799, -0.061371952295303345, 0.009318005293607712, -0.08797001093626022, -0.013429105281829834, -0.028683185577392578, -0.042851950973272324, -0.027612369507551193, 0.06630535423755646, 0.044062476605176926, -0.0264961626380682, 0.06907874345779419, -0.015246420167386532, 0.0015895451651886106, -0.01730940490961075, 0.05163784325122833, -0.0747959315776825, -0.0034876936115324497, -0.07544433325529099, 0.0522574856877327, -0.009114042855799198, 0.07290808111429214, 0.0030998894944787025, -0.040146417915821075, -0.058702703565359116, -0.0036624467466026545, 0.015610096044838428, -0.008162926882505417, 0.03218008950352669, 0.000251432677032426, -0.012435344979166985, 0.02119474485516548, -0.02440844289958477, 0.07842696458101273, -0.028800876811146736, 0.008271072059869766, 0.0026153018698096275, 0.06283310055732727, 0.06028381362557411, -0.015135367400944233, 0.0009354662615805864, -0.00996711291372776, 0.024204637855291367, 0.035341717302799225, 0.0007174009806476533, -0.06000562384724617, -0.0074699437245726585, -0.04740195721387863, -0.060640450567007065, 0.010892334394156933, -0.011366806924343109, 0.025148699060082436, 0.057081885635852814, -0.032567646354436874, -0.018495308235287666, -0.07049486041069031, -0.09767119586467743, -0.05203046649694443, -0.01577013172209263, 0.032751742750406265, -0.032537441700696945, -0.058304399251937866, -0.020018193870782852, 0.013324893079698086, 0.04471703618764877, 0.026783902198076248, -0.010208375751972198, 0.047430094331502914, 0.06002027168869972, -0.030151408165693283, 0.03602617233991623, -0.007456635124981403, -0.007418196182698011, -0.026888376101851463, -0.027325762435793877, -0.07561364769935608, 0.07645238935947418, 0.009753608144819736, 0.019554851576685905, -0.06651076674461365, 0.026884304359555244, -0.0006312346667982638, -0.07461779564619064, 0.05155465751886368, -0.03399372845888138, -0.02417052909731865, 0.006277285050600767, -0.018118927255272865, 0.028007429093122482, 0.06564350426197052, 0.02758963033556938, -0.04480329528450966, 0.005430963821709156, -0.027012433856725693, 0.07565111666917801, -0.021623751148581505, -0.01495790109038353, 0.03230965510010719, -0.04588274657726288, -0.09865602105855942, -0.027747182175517082, 0.037603333592414856, -0.05012951418757439, -0.0310226920992136, 0.06243164837360382, 0.022919660434126854, 0.03167165070772171, 0.012174583040177822, 0.008787509053945541, 0.0415114127099514, -0.00828121230006218, 0.010147269815206528, -0.001647150027565658, 0.013446141965687275, 0.010597392916679382, -0.03809365630149841, -0.06645715236663818, 0.029184117913246155, -0.009026182815432549, -0.02393125370144844, -0.04879472032189369, 0.042181968688964844, 0.017971698194742203, 0.0014261233154684305, -0.0010356893762946129, -0.054406002163887024, -0.0015566024230793118, -0.07506754249334335, -0.008627107366919518, -0.0468524806201458, 0.02340088039636612, 0.016060464084148407, -0.017199024558067322, -0.04336804151535034, 0.006121092941612005, 0.006193867418915033, -0.035845909267663956, 0.039031486958265305, -0.004216205794364214, 0.021713899448513985, 0.0395544096827507, -0.030542917549610138, 0.033529311418533325, 0.06059950962662697, 0.014250367879867554, -0.009690368548035622, -0.05513543635606766, -0.001322073396295309, -0.004457045346498489, 0.016532255336642265, 0.01420165877789259, -0.0024994006380438805, -0.003862471552565694, -0.008680945262312889, 0.052669573575258255, -0.10596192628145218, 0.03514798730611801, -0.023828448727726936, 0.03785327076911926, -0.026749299839138985, 0.018050873652100563, 0.0650925263762474, -0.006963823456317186, -0.0391804538667202, -0.0094326576218009, -0.05624603480100632, -0.003637416288256645, -0.02805151790380478, 0.011906947940587997, -0.02149895578622818, 0.0015965569764375687, 0.06358681619167328, 0.0114645566791296, -0.00437945406883955, 0.058648042380809784, -0.044975027441978455, 0.07622653245925903, -0.01253264769911766, 0.006864052265882492, 0.011309324763715267, 0.005890566390007734, 0.06349370628595352, -0.02358659729361534, 0.04336920008063316, 0.08773484826087952, 0.003863466903567314, 0.012418702244758606, 0.02301139570772648, -0.038998834788799286, 0.01029997132718563, 0.010471976362168789, -0.06035558506846428, -0.005485028959810734, 0.047778502106666565, 0.02535180002450943, 0.011452317237854004, -0.019964348524808884, -0.038333017379045486, -0.013135979883372784, -0.0268314890563488, 0.006073359865695238, 0.008030204102396965, 0.026177402585744858, 0.018981900066137314, 0.012674523517489433, 0.007110439706593752, 0.08489811420440674, 0.014799685217440128, -0.004928015638142824, 0.004710909444838762, 0.013886157423257828, 0.015400572679936886, -0.06987664103507996, -0.03820361942052841, 0.012036655098199844, 0.00867129024118185, 0.024236934259533882, -0.009739361703395844, -0.061248745769262314, -0.02335801161825657, -0.022683866322040558, -0.0067178718745708466, 0.0685281902551651, -0.03133000433444977, -0.03314370661973953, -0.02311559021472931, 0.0075909849256277084, -0.04502802714705467, -0.029277535155415535, 0.041811760514974594, 0.004742371384054422, 0.043882571160793304, -0.031032538041472435, -0.028599392622709274, -0.061155766248703, 0.050255585461854935, 0.033616360276937485, -0.029274681583046913, 0.04847750812768936, -0.010454395785927773, -0.021071381866931915, 0.02635074034333229, -0.024642979726195335, -0.008644101209938526, 0.02880581095814705, -0.025814665481448174, -0.02564305067062378, 0.007535424083471298, -0.028890876099467278, 0.008540155366063118, 0.03867970034480095, -0.016626007854938507, 0.03753960505127907, -0.04701019451022148, -0.0299184862524271, 0.017904842272400856, 0.04469162970781326]], [[0.0004780209856107831, 0.002340038539841771, 0.01538168080151081, -0.006161003839224577, -0.001649175537750125, 0.03810571879148483, -0.00539447320625186, 0.01496182568371296, 0.00233081029728055, 0.002240089699625969, 0.01752862147986889, -0.007293688133358955, -0.039252519607543945, -0.013900292105972767, -0.017239857465028763, 0.020732838660478592, -0.04844678193330765, 0.03572172671556473, -0.012677673250436783, 0.02185688354074955, -0.016196083277463913, -0.0011237681610509753, -0.02995908074080944, 0.019316863268613815, 0.03743908926844597, 0.014355807565152645, 0.041501857340335846, 0.0037939995527267456, 0.03355887904763222, 0.04993363842368126, 0.061555907130241394, -0.05820607393980026, 0.00209455075673759, 0.03870344161987305, 0.02032945305109024, 0.009582256898283958, -0.03712446987628937, 0.042524922639131546, -0.02066526748239994, -0.032127607613801956, -0.03609910234808922, -0.03874749690294266, -0.012240463867783546, 0.07457179576158524, 0.05611058697104454, 0.003913600463420153, -0.0550788938999176, 0.02204185351729393, 0.014345194213092327, 0.022854700684547424, -0.011861470527946949, 0.08271441608667374, -0.009172451682388783, -0.003796071745455265, -0.0290190652012825, -0.06045028939843178, 0.0010332452366128564, -0.005711049307137728, 0.032608699053525925, 0.019395193085074425, 0.002699576783925295, 0.03071310743689537, 0.0465247742831707, 0.00951584242284298, 0.0015422304859384894, -0.005564191844314337, -0.037919458001852036, -0.06119358539581299, -0.00603256793692708, 0.028263049200177193, -0.023440033197402954, -0.014675436541438103, 0.03550846502184868, -0.0023985172156244516, 0.029391610994935036, 0.07231272011995316, 0.033932652324438095, 0.04213274270296097, -0.04884611815214157, 0.027611825615167618, -0.02506835199892521, 0.02856525219976902, -0.001344764605164528, 0.03170178458094597, 0.027365297079086304, 0.03247562050819397, -0.0030705160461366177, 0.025797605514526367, 0.07727999985218048, 0.014927925541996956, -0.004278411157429218, -0.0014757792232558131, -0.022116951644420624, 0.037309031933546066, -0.026288293302059174, 0.002389423316344619, 0.016719624400138855, 0.01995132677257061, 0.016273723915219307, -0.0023189496714621782, 0.10444369912147522, -0.02691100351512432, 0.000443882163381204, 0.033587485551834106, 0.0145396888256073, 0.017245568335056305, 0.025467470288276672, 0.03830254450440407, 0.06126013025641441, 0.03591557592153549, -0.036354806274175644, -0.10007854551076889, 0.054423291236162186, 0.0678529143333435, -0.027146032080054283, -0.008290919475257397, -0.04601196199655533, -0.012355293147265911, 0.030489608645439148, -0.058705881237983704, 0.022716237232089043, 0.03856489062309265, -0.005688200239092112, 0.012582024559378624, 0.03309102728962898, -0.04913083091378212, 0.008060649037361145, -0.04245005175471306, -0.02793170139193535, -0.042354512959718704, 0.004093517083674669, 0.018305104225873947, -0.026204383000731468, 0.01811116747558117, 0.037482935935258865, 0.0006132735288701952, -0.014630499295890331, -0.016959339380264282, -0.005288939457386732, 0.05802399292588234, -0.008847644552588463, -0.054867736995220184, 0.012950045987963676, 0.006569283548742533, 0.056192975491285324, 0.0021315026096999645, 0.06091536581516266, 0.0023131081834435463, -0.011167666874825954, -0.04638514667749405, -0.07800053805112839, -0.04336412996053696, 0.06772073358297348, -0.033481016755104065, -0.03828544169664383, 0.07208461314439774, 0.01997712068259716, 0.0019821443129330873, 0.029238205403089523, -0.01930134929716587, -0.007401785813271999, 0.007073822431266308, 0.03756644204258919, -0.1260780543088913, -0.027351152151823044, 0.02573912963271141, -0.005777259822934866, 0.01702054776251316, -0.03473672270774841, 0.02286498434841633, 0.011587674729526043, -0.044400740414857864, -0.023724550381302834, -0.03017316944897175, -0.022183610126376152, -0.04581208527088165, 0.02312038652598858, -0.0380864255130291, 0.026401620358228683, -0.007414742838591337, -0.024350706487894058, -0.014485830441117287, -0.08843295276165009, 0.027419378980994225, 0.08389731496572495, 0.05593276396393776, 0.032399535179138184, 0.015419776551425457, 0.030119875445961952, 0.04555801674723625, -0.015253166668117046, -0.003489771857857704, -0.015132459811866283, 0.07906708121299744, -0.04481351375579834, 0.0046966890804469585, 0.031115863472223282, -0.03843780979514122, -0.004463816061615944, -0.02890021540224552, 0.03508320823311806, 0.04770463705062866, 0.010807950980961323, 0.05086367204785347, -0.00040516152512282133, -0.007900727912783623, 0.04030483216047287, 0.0030940063297748566, 0.014424670487642288, 0.03731807321310043, 0.08732758462429047, -0.07014504075050354, -0.0038166316226124763, -0.006430697161704302, -0.04489172250032425, -0.009443663991987705, 0.006829506251960993, -0.022647004574537277, 0.03822723776102066, 0.021682415157556534, 0.007067893166095018, -0.011815623380243778, 0.045006126165390015, -0.04320588335394859, -0.013329378329217434, 0.05052175372838974, -0.029235636815428734, -0.030021822080016136, -0.011161504313349724, -0.03263775631785393, 0.053180210292339325, 0.0199348796159029, -0.04590049386024475, -0.05806905776262283, 0.034965988248586655, 0.0165522750467062, 0.04012760892510414, 0.01299992948770523, -0.0038799229077994823, -0.008717602118849754, 0.022865626960992813, -0.04811857268214226, -0.01810990646481514, 0.030194131657481194, -0.018768612295389175, -0.029459236189723015, 0.03367651626467705, 0.01082582212984562, 0.062270861119031906, -0.03354978933930397, 0.004024064168334007, -0.010707838460803032, 0.0184340700507164, -0.006578937638550997, 0.013822054490447044, 0.032527416944503784, -0.01623421721160412, 0.017084812745451927, -0.03160494193434715, 0.0014142942382022738, 0.017994798719882965, -0.006132667884230614, 0.03584880381822586, 0.05673930048942566, -0.04509943723678589, -0.010784466750919819, -0.012032548896968365, -0.014006046578288078, -0.040234778076410294, -0.03299366682767868, 0.0009733566548675299, 0.062737375497818, -0.03865038976073265, -0.043870724737644196, -0.017139753326773643, 0.01602531224489212, 0.03589656203985214, 0.01557604968547821, 0.004284667782485485, 0.009995391592383385, -0.06914422661066055, -0.028011668473482132, 0.04549185559153557, 0.007884236983954906, -0.012892238795757294, -0.029110370203852654, -0.014018996618688107, 0.07742779701948166, -0.10539788752794266, 0.002771275583654642, -0.014335520565509796, 0.03788243234157562, -0.03352540358901024, 0.041997890919446945, -0.006590704899281263, -0.0009575387230142951, -0.07357847690582275, -0.03361225873231888, -0.02213364839553833, -0.010616989806294441, 0.024409020319581032, -0.04958627000451088, 0.0043592918664216995, 0.032294806092977524, -0.010617468506097794, -0.020510608330368996, -0.011864155530929565, -0.0030168944504112005, 0.03709305450320244, 0.007455941289663315, -0.03172632306814194, -0.018778720870614052, -0.035498544573783875, 0.0394318662583828, 0.06824708729982376, 0.04988957196474075, -0.008305412717163563, -0.0020344341173768044, -0.03153577074408531, -0.04835335537791252, 0.01868279092013836, -0.009321179240942001, 0.0026970496401190758, 0.025251450017094612, 0.012697761878371239, 0.029835965484380722, -0.010564652271568775, -0.018196338787674904, -0.051345255225896835, -0.015123735181987286, -0.017546599730849266, -0.018237192183732986, -0.024785496294498444, -0.0189107283949852, -0.0595846064388752, -0.025167299434542656, 0.007407110184431076, -0.05445694550871849, 0.029113709926605225, 0.036505039781332016, -0.014428474940359592, -0.01667143777012825, -0.057659879326820374, 0.02353750914335251, -0.008470738306641579, -0.04851500689983368, -0.037682048976421356, -0.029422437772154808, 0.050664547830820084, 0.00085833779303357, -0.01602235808968544, 0.023464486002922058, 0.06424692273139954, -0.04285614565014839, 0.022544216364622116, 0.0017023374093696475, -0.013675043359398842, 0.05085545778274536, -0.0060287476517260075, 0.008546222001314163, -0.00739476690068841, 0.023409444838762283, -0.011637457646429539, 0.04701841622591019, -0.04274684935808182, 0.04341079667210579, -0.016871774569153786, -0.02834959700703621, 0.003987570758908987, -0.059941112995147705, -0.0357469767332077, 0.050809599459171295, -0.009135440923273563, -0.014510993845760822, -0.024497589096426964, -0.028637364506721497, -0.010093888267874718, 0.0920565202832222, 0.03540017828345299, -0.06985076516866684, -0.030483698472380638, -0.03002004511654377, 0.05856364220380783, 0.0188134852796793, -0.042467497289180756, 0.004770028404891491, 0.03710682690143585, -0.009026657789945602, 0.03182731568813324, 0.011003646068274975, -0.08437712490558624, 0.01406803261488676, 0.033504337072372437, 0.0057328566908836365, -0.026260945945978165, -0.018835710361599922, -0.022543497383594513, 0.008349189534783363, -0.014953595586121082, 0.07082713395357132, 0.038299571722745895, 0.024851728230714798, -0.008371801115572453, 0.06950122863054276, -0.0004290043725632131, -0.030734097585082054, 0.00908843707293272, 0.043876808136701584, 0.021595267578959465, 0.007568236906081438, 0.01090037077665329, -0.02993633784353733, 0.06449815630912781, -0.0528382807970047, 0.0319245271384716, 0.002116395393386483, -0.007881330326199532, 0.02095210924744606, 0.008252965286374092, 0.009373134933412075, 0.010436847805976868, -0.00549815921112895, 0.05357954651117325, 0.02260427176952362, 0.05467556044459343, 0.01765216514468193, -3.5727713111555204e-05, -0.019230492413043976, -0.06473984569311142, -0.01210749987512827, 0.0025309468619525433, 0.027502691373229027, -0.020406270399689674, 0.014551878906786442, -0.037698473781347275, 0.014334144070744514, -0.03719457983970642, 0.003746000351384282, 0.01736934669315815, -0.0904911607503891, -0.0025003899354487658, 0.025700245052576065, -0.004281140398234129, -0.038079049438238144, 0.03379850462079048, 0.006077632773667574, -0.003177544567734003, 0.05764993652701378, 0.02289462462067604, 0.05266276001930237, 0.016754556447267532, -0.010667049326002598, 0.037513572722673416, -0.023854168131947517, 0.019786827266216278, 5.7432043831795454e-05, 0.03376379609107971, 0.06912120431661606, -0.001460092724300921, 0.050736404955387115, 0.0043205083347857, 0.021143684163689613, -0.05251412093639374, -0.0863780528306961, 0.039068177342414856, -0.0457586869597435, 0.01687658205628395, 0.04126054421067238, -0.039816733449697495, -0.0138718755915761, -0.02015531249344349, 0.014639308676123619, 0.007360289804637432, 0.020585082471370697, -0.039065249264240265, -0.026017621159553528, -0.003682313021272421, -0.05838621407747269, 0.012699919752776623, -0.023491326719522476, 0.04861544072628021, 0.029054004698991776, 0.06974977254867554, -0.00425942987203598, -0.061128877103328705, 0.03644919395446777, -0.05222425237298012, -0.02817394584417343, 0.04561873525381088, -0.03544393554329872, -0.04825807735323906, -0.008284048177301884, -0.02776571363210678, -0.014703294262290001, -0.05188526213169098, -0.010664575733244419, 0.023382995277643204, -0.004885321017354727, 0.008777385577559471, 0.04302920028567314, -0.012778181582689285, 0.013659415766596794, -0.02571420557796955, -0.013985127210617065, 0.0070433481596410275, 0.035302627831697464, 0.020421219989657402, 0.027132760733366013, -0.017044177278876305, -0.004629925824701786, 0.052826058119535446, 0.0408494658768177, -0.00988355465233326, -6.305018905550241e-05, -0.0073195514269173145, -0.020937081426382065, 0.0008574975654482841, 0.02172875963151455, 0.008175421506166458, 0.03993726521730423, 0.02906016819179058, -0.012428832240402699, 0.03070007637143135, 0.027150485664606094, 0.04624391347169876, -0.023744307458400726, -0.002226079348474741, -0.04867391288280487, -0.03874002769589424, -0.06223570182919502, -0.11971193552017212, 0.02869187295436859, 0.1024082824587822, 0.041121069341897964, -0.005632943008095026, 0.031587738543748856, 0.04120994359254837, 0.0386686846613884, -0.043800920248031616, 0.03401504456996918, 0.014602528885006905, 0.025991391390562057, 0.04352060332894325, -0.010091730393469334, 0.03886031731963158, -0.059863682836294174, -0.01787698082625866, 2.9722805265919305e-05, 0.02174278348684311, 0.08862415701150894, 0.0032764864154160023, 0.06010763347148895, -0.011582046747207642, 0.04726630449295044, 0.012262815609574318, -0.016244273632764816, -0.06241760402917862, -0.025652039796113968, -0.03283115476369858, -0.07482627779245377, 0.02502201683819294, -0.0649014338850975, -0.008351380936801434, 0.039326347410678864, -0.039535220712423325, -0.035924091935157776, -0.06935270875692368, -0.06429095566272736, -0.03543389216065407, 0.020912829786539078, 0.034760911017656326, 0.01257521752268076, -0.0544154979288578, -0.021406814455986023, -0.01193898543715477, 0.03338807076215744, -0.006383288186043501, 0.0301805529743433, 0.03276725113391876, 0.028686683624982834, 0.0013566430425271392, 0.007454961538314819, 0.014269451610744, -0.013527007773518562, -0.0021605761721730232, -0.03943992406129837, -0.018076103180646896, 0.059356387704610825, 0.01818692684173584, -0.021699730306863785, -0.09718693047761917, 0.06830790638923645, -0.013380550779402256, -0.05773944780230522, -0.005323328543454409, -0.07626931369304657, 0.02215116284787655, 0.0191681869328022, -0.027953995391726494, 0.06955398619174957, 0.06579432636499405, 0.023204784840345383, -0.00957115925848484, -0.0345226414501667, 0.06223295256495476, 0.06710793077945709, 0.05611580237746239, 0.01914677582681179, 0.0724136084318161, 0.019686438143253326, -0.05500733479857445, -0.014802910387516022, 0.013865640386939049, -0.047124627977609634, -0.0216118935495615, 0.03177110105752945, -0.020150188356637955, 0.013213680125772953, -0.07164905965328217, 0.030995476990938187, 0.03576614335179329, 0.01088075339794159, 0.046702735126018524, -0.031733617186546326, 0.019113175570964813, -0.008532914333045483, -0.024286624044179916, 0.013316015712916851, 0.047551024705171585, 0.0067487782798707485, -0.0009238022612407804, -0.03363766521215439, 0.006759434938430786, 0.013738162815570831, 0.04131946712732315, -0.01982945017516613, -0.0033919860143214464, -0.041365232318639755, -0.04611443355679512, 0.008679271675646305, 0.024405812844634056, 0.037750501185655594, -0.0272651519626379, 0.002720091724768281, -0.051584407687187195, 0.012062904424965382, -0.02004711888730526, -0.007719505112618208, 0.024172933772206306, -0.05207338184118271, 0.015147389844059944, 0.03558705747127533, 0.010280114598572254, 0.04430634528398514, -0.03516155853867531, 0.0020883979741483927, -0.020213797688484192, -0.00342798070050776, -0.012816084548830986, 0.0036091988440603018, 0.007125121541321278, 0.05610441043972969, 0.05343056842684746, 0.022725265473127365, -0.001731937751173973, -0.0007126177661120892, -0.06659489870071411, 0.012297181412577629, 0.030688339844346046, -0.0048216357827186584, -0.027375007048249245, 0.04686357453465462, 0.03475351631641388, 0.019941920414566994, 0.010126212611794472, 0.054199375212192535, -0.03761313110589981, -0.02226940169930458, -0.03835110366344452, -0.01809442788362503, -0.055290140211582184, -0.040603023022413254, 0.07889953255653381, 0.012842104770243168, 0.016739681363105774, 0.025612490251660347, -0.05174317583441734, 0.01947570964694023, -0.011909501627087593, -0.036009810864925385, -0.01334524154663086, 0.01056268997490406, 0.06905412673950195, -0.09961498528718948, 0.02024919167160988, 0.030596494674682617, 0.02198200114071369, 0.034510284662246704, -0.003942017909139395, -0.05712592974305153, -0.04024448245763779, -0.022632522508502007, -0.04591387137770653, 0.006199255120009184, -0.02110127918422222, 0.011029969900846481, 0.06119386851787567, 0.040034856647253036, -0.016978280618786812, -0.04063594341278076, -0.018150324001908302, 0.018604984506964684, -0.042808953672647476, 0.017962083220481873, 0.0011197079438716173, -0.018554894253611565, -0.03493215888738632, 0.12296651303768158, -0.061915889382362366, 0.03749631345272064, 0.026845207437872887, -0.005801960360258818, 0.02962910197675228, -0.061553943902254105, -0.02217957004904747, -0.02410157211124897, 0.00997015181928873, 0.003351668594405055, 0.005673450883477926, -0.0678517147898674, 0.08087820559740067, -0.0292859748005867, 0.03564295545220375, -0.015094178728759289, -0.024240203201770782, 0.03552856296300888, 0.002167457016184926, -0.010234040208160877, -0.009174106642603874, -0.007312039379030466, 0.03008543886244297, -0.005639200564473867, -0.004664883483201265, -0.04349817708134651, 0.032988205552101135, -0.010254205204546452, 0.02282155305147171, 0.07672473043203354, -0.018143417313694954, 0.049349814653396606, 0.001052933861501515, -0.002046875888481736, 0.026793302968144417, 0.008312941528856754, 0.0031038629822432995, -0.02428685687482357, -0.027132805436849594, -0.06206298619508743, 0.009455001913011074, -0.018348712474107742, -0.014632517471909523, 0.017060309648513794, -0.03272508829832077, 0.023589488118886948, -0.006465901155024767, -0.06384565681219101, -0.0027605018112808466, 0.09126566350460052]], [[0.022541183978319168, -0.014535650610923767, 0.021333826705813408, 0.01998039148747921, -0.004557974636554718, 0.02753480151295662, -0.01367840077728033, 0.09068456292152405, -0.003813172224909067, 0.013999785296618938, -0.05680108070373535, -0.01170765794813633, -0.05782156065106392, -0.03598210960626602, 0.01894872821867466, 0.055142518132925034, -0.047547802329063416, -0.028015095740556717, -0.05775512754917145, 0.03583140671253204, -0.04227437824010849, -0.0247444286942482, 0.01849680207669735, 0.043606244027614594, 0.014946154318749905, 0.03344732150435448, 0.0076391189359128475, -0.043509047478437424, 0.04106608405709267, -0.005234361160546541, -0.014082225039601326, 0.012275513261556625, -0.07199092209339142, 0.022046973928809166, 0.012647773139178753, -0.009054912254214287, -0.023065024986863136, 0.009035009890794754, -0.01130704302340746, -0.0068087889812886715, -0.02804506942629814, -0.05224171280860901, -0.05371755361557007, -0.005166876595467329, 0.02732669748365879, -0.048610296100378036, -0.10738083720207214, 0.04279566928744316, -0.03371445834636688, -0.012177770026028156, 0.005072653293609619, 0.04038076847791672, 0.08653175085783005, 0.05678078904747963, -0.008502155542373657, 0.02677633985877037, -0.024465147405862808, 0.026763375848531723, 0.023825187236070633, 0.029433447867631912, -0.013501601293683052, 0.003565313294529915, -0.0011626117629930377, -0.004324716050177813, -0.001796862343326211, 0.020638426765799522, -0.01959644816815853, -0.04796047508716583, -0.02788621373474598, 0.004905907902866602, -0.014806740917265415, -0.03368790075182915, 0.004104865249246359, 0.08804041892290115, 0.03134273365139961, 0.029039910063147545, 0.01571631245315075, 0.02115917019546032, -0.08143270760774612, 0.01099419966340065, 0.08791498839855194, 0.07082802802324295, -0.02176719717681408, -0.0012141512706875801, -0.029483594000339508, 0.027405809611082077, 0.02359783835709095, 0.05638328939676285, 0.05187395215034485, -0.05613412335515022, -0.007958068512380123, 0.006422205362468958, -0.020135778933763504, 0.0250240508466959, -0.011139659211039543, 0.08379491418600082, 0.015884283930063248, 0.005295282229781151, 0.021447209641337395, -0.0491546206176281, 0.11193259060382843, -4.06562139687594e-05, -0.026894351467490196, 0.024064837023615837, 0.020264405757188797, 0.012515990063548088, -0.005192997865378857, -0.0006384097505360842, 0.10680446028709412, -0.06738783419132233, -0.04761863499879837, -0.033676303923130035, 0.04610174521803856, -0.006278027314692736, -0.029531043022871017, -0.01495897676795721, -0.012874367646872997, 0.017132656648755074, -0.02034994401037693, 0.006725565530359745, -0.0053847357630729675, -0.023310771211981773, -0.01614782027900219, 0.013744670897722244, 0.013321534730494022, 0.009273605421185493, 0.02604183927178383, 0.037474580109119415, -0.045540038496255875, -0.06378145515918732, -0.006338430102914572, -0.01284300908446312, 0.018608316779136658, 0.002632072428241372, -0.0027515313122421503, 0.01888367161154747, 0.03007270209491253, 0.027886152267456055, -0.03670872375369072, 0.016161251813173294, -0.0023263217881321907, 0.029389379546046257, -0.04893651604652405, -0.0360647551715374, 0.02384348399937153, 0.02170199528336525, 0.029338261112570763, -0.00786694698035717, 0.014447305351495743, -0.060527022927999496, -0.03646356984972954, 0.0022087583784013987, 0.020723538473248482, -0.07323233783245087, -0.021316582337021828, 0.059299618005752563, -0.022728916257619858, -0.03850726783275604, -0.0427912175655365, -0.061646874994039536, 0.009650018997490406, -0.026110665872693062, 0.00309759215451777, -0.07811588793992996, 0.0023347469978034496, 0.011917279101908207, 0.017711887136101723, 0.02029220387339592, -0.01521487720310688, -0.0052765971049666405, -0.03915540501475334, 0.02592012844979763, 0.05752205103635788, 0.01719881407916546, -0.04167666658759117, -0.024737244471907616, -0.0005247339140623808, 0.005154830403625965, 0.017987240105867386, -0.018768908455967903, -0.003428495954722166, -0.057778384536504745, -0.002323881955817342, 0.00125633564312011, 0.053271353244781494, -0.004978766664862633, -0.0072563220746815205, -0.0156850628554821, 0.02875399775803089, 0.06482449918985367, -0.034954700618982315, -0.04181336611509323, -0.028017455711960793, 0.048639871180057526, 0.00813212152570486, -0.028801629319787025, 0.05032060295343399, -0.10691406577825546, 0.016875986009836197, -0.03343331813812256, 0.0291848536580801, 0.002802505623549223, -0.0023781077470630407, 0.025957141071558, 0.036068543791770935, 0.03404173254966736, 0.02861151471734047, 0.02010396681725979, 0.03564192354679108, 0.02568681165575981, 0.05030447244644165, -0.026578890159726143, 0.0346023291349411, 0.0398092195391655, -0.04949177801609039, 0.002368220128118992, -0.019594695419073105, -0.015470643527805805, -0.026646248996257782, 0.07152938842773438, -0.003763659857213497, -0.011078829877078533, 0.04121718928217888, -0.029067186638712883, 0.02405882067978382, -0.000789402227383107, -0.016168922185897827, -0.002360672689974308, 0.06212104111909866, -0.07608096301555634, 0.02784455195069313, 0.07721268385648727, -0.01402687281370163, -0.049906935542821884, 0.006265420466661453, 0.016624392941594124, -0.010325271636247635, 0.03608729690313339, -0.006153471767902374, 0.005242520477622747, 0.012098997831344604, -0.030105076730251312, -0.001882093958556652, -0.01255485974252224, 0.004847743082791567, -0.02923724800348282, 0.030691860243678093, 0.01221596822142601, 0.03525387868285179, -0.07097797840833664, 0.016083963215351105, 0.010244513861835003, 0.03710517659783363, -0.006474511232227087, 0.013823959976434708, -0.032805558294057846, -0.017412910237908363, 0.008455369621515274, -0.05893606320023537, -0.007781169377267361, 0.03008047677576542, 0.020425032824277878, 0.037885308265686035, -0.001936111832037568, -0.08106569200754166, -0.01938948966562748, -0.0035663978196680546, -0.0007961368537507951, -0.009853078052401543, 0.04565015807747841, -0.0016373137477785349, 0.05080750957131386, -0.08955066651105881, -0.03606743738055229, 0.05785292759537697, 0.015465245582163334, 0.04033380001783371, -0.010389738716185093, 0.013135656714439392, -0.01018640398979187, -0.050273261964321136, -0.04101582616567612, 0.012153137475252151, 0.0031619330402463675, -0.031836509704589844, -0.006960824131965637, 0.06822618842124939, 0.08384069055318832, -0.04055335000157356, -0.022722430527210236, -0.04519447311758995, 0.006549843121320009, 0.014366799965500832, -0.04494844004511833, -0.00534756388515234, 0.03394324705004692, -0.03249681368470192, 0.040457919239997864, -0.038163185119628906, 0.017015084624290466, -0.053197626024484634, -0.06237049400806427, 0.04959894344210625, -0.039926301687955856, 0.012138264253735542, 0.0397598072886467, 0.015769867226481438, 0.07452395558357239, 0.012716440483927727, 0.00893338117748499, 2.3424061510013416e-05, 0.0219600647687912, -0.014536852017045021, 0.0007217334932647645, 0.02756348066031933, 0.029793964698910713, -0.040961481630802155, 0.09128674864768982, -0.03202861174941063, -0.05317511782050133, 0.036986127495765686, 0.05088415369391441, -0.0565384104847908, -0.013272406533360481, -0.037745848298072815, 0.01232838723808527, -0.0122744832187891, 0.0061644865199923515, 0.00018508225912228227, 0.009945047087967396, -0.04876101389527321, 0.0031144304666668177, -0.01949552446603775, 0.055461350828409195, -0.008790294639766216, -0.043339550495147705, 0.010046521201729774, -0.0123941944912076, -0.014598705805838108, 0.03861111029982567, 0.01203552633523941, -0.015547708608210087, -0.028650306165218353, -0.014650372788310051, 0.015777455642819405, -0.055500540882349014, -0.04503706842660904, 0.02659887634217739, 0.06875845789909363, -0.013071826659142971, -0.015677910298109055, 0.010618609376251698, 0.02492590993642807, 0.017632167786359787, -0.031683966517448425, -0.012099098414182663, 0.010970963165163994, 0.050932057201862335, -0.009594475850462914, 0.015159488655626774, 0.030183926224708557, -0.03906457871198654, -0.004293343983590603, 0.06496886909008026, -0.05194771662354469, 0.02654157392680645, -0.06288290023803711, -0.0782206729054451, 0.01990734599530697, -0.09666840732097626, 0.0037924875505268574, 0.023039013147354126, -0.03187759593129158, -0.006727284751832485, 0.0030401619151234627, -0.017278596758842468, 0.0012044007889926434, 0.023884400725364685, 0.04261697456240654, -0.02156657911837101, 0.018428202718496323, -0.013586202636361122, 0.04515460878610611, -0.013768414966762066, 0.024593360722064972, 0.024327728897333145, 0.04408339783549309, 0.006818708498030901, 0.06343923509120941, 0.003167441114783287, 0.013298073783516884, 0.014101127162575722, 0.014057003892958164, 0.018894482403993607, -0.062347300350666046, -0.008253242820501328, 0.013389666564762592, -0.006167449522763491, -0.024111678823828697, 0.07536186277866364, 0.006025300826877356, -0.015828216448426247, 0.017243623733520508, 0.051321886479854584, 0.020059218630194664, 0.042615972459316254, 0.023544393479824066, 0.022835232317447662, -0.015500098466873169, -0.06051665544509888, 0.0141591876745224, -0.0008110546041280031, 0.0038582398556172848, -0.004865330643951893, -0.014603785239160061, 0.03713631257414818, -0.0008017339860089123, 0.028390830382704735, 0.018001990392804146, -0.0012089756783097982, 0.048815783113241196, 0.00012038140994263813, 0.04775500297546387, 0.049135517328977585, -0.07923384010791779, -0.024848438799381256, 0.0025690991897135973, -0.034773774445056915, -0.028061607852578163, -0.016287943348288536, 0.037306174635887146, 0.03354872018098831, -0.01690293475985527, 0.03711016848683357, 0.002700482727959752, -0.03274600952863693, -0.03274017944931984, 0.022085556760430336, 0.0429370142519474, 0.004380916710942984, -0.04446842893958092, 0.03258220851421356, -0.0142628513276577, -0.05096348002552986, 0.04444197937846184, 0.011324125342071056, 0.010876273736357689, 0.02333010733127594, -0.04045885428786278, -0.011680494993925095, 0.027830857783555984, 0.02786639891564846, 0.006112356204539537, 0.017061857506632805, -0.015344256535172462, 0.020755844190716743, 0.04013751074671745, -0.04249749332666397, 0.03156612440943718, 0.06265634298324585, 0.0481315441429615, 0.0005974771338514984, -0.05095268413424492, -0.03534337505698204, -0.017535652965307236, -0.006425815634429455, -0.017938049510121346, 0.0036574634723365307, -0.016414133831858635, 0.03353909030556679, -0.037674419581890106, 0.032278306782245636, 0.0005560357240028679, 0.008029821328818798, 0.018742822110652924, -0.030935918912291527, 0.05199451744556427, -0.056773699820041656, 0.0163961760699749, -0.03651566803455353, 0.07012645155191422, 0.04398578405380249, 0.028040623292326927, 0.015718644484877586, -0.08313458412885666, -0.024162717163562775, 0.002814958104863763, 0.054199572652578354, -0.06187842786312103, 0.011871530674397945, -0.039408959448337555, 0.019988130778074265, -0.019769666716456413, 0.005821747239679098, -0.01582251489162445, 0.0032665657345205545, 0.013231247663497925, 0.015624399296939373, -0.018413040786981583, -0.02627984993159771, 0.01631207764148712, 0.007247702684253454, -0.06577154248952866, -0.05654790252447128, 0.027884967625141144, 0.03713560849428177, 0.0045847236178815365, 0.006848494056612253, 0.004233081825077534, 0.03148368000984192, 0.049018003046512604, 0.05264024809002876, -0.009664741344749928, -0.03272887319326401, -0.0061261532828211784, 0.045422397553920746, -0.03802234306931496, -0.00186599709559232, -0.03990670293569565, 0.004146995022892952, 0.06298299878835678, 0.001437381491996348, 0.10338681936264038, 0.040742721408605576, 0.024813640862703323, -0.011710125021636486, 0.019152402877807617, -0.11578438431024551, 0.00786149874329567, -0.011471860110759735, 0.003264135215431452, -0.013301960192620754, 0.05238952860236168, -0.021083282306790352, -0.0036388614680618048, -0.02968291938304901, 0.020862072706222534, -0.0037426867056638002, -0.009613829664885998, 0.030558545142412186, -0.005824004299938679, 0.0213696900755167, 0.016197489574551582, 0.03151259571313858, 0.01950305700302124, -0.004033015575259924, -0.012107155285775661, 0.04774444177746773, 0.02129739336669445, 0.03477814048528671, -0.010822833515703678, 0.0454418919980526, -0.06943368166685104, 0.0585310123860836, 0.04333069548010826, 0.008495685644447803, -0.019054049625992775, -0.05351826548576355, -0.0071246083825826645, -0.08194492012262344, 0.02581024542450905, -0.05764460936188698, 0.0369785837829113, 0.00400726730003953, -0.03165789693593979, -0.004218163434416056, -0.028951043263077736, -0.06051638349890709, 0.015410301275551319, -0.0033668384421616793, 0.007139986380934715, -0.011539396829903126, -0.048200786113739014, -0.00667987298220396, 0.013842983171343803, 0.09020829945802689, -0.013626445084810257, 0.015932146459817886, 0.030778268352150917, -0.013259921222925186, 0.0007882704376243055, 0.006635232362896204, 0.022807203233242035, 0.011390390805900097, -0.004006807692348957, -0.013353421352803707, 0.004782646428793669, 0.05361682176589966, -0.011795843951404095, -0.03240583464503288, -0.08838073164224625, 0.0663585215806961, -0.07088231295347214, -0.06676484644412994, -0.060569021850824356, -0.04671277850866318, -0.032750360667705536, -0.020813582465052605, 0.01635858044028282, 0.05848010256886482, 0.011240938678383827, 0.030083445832133293, 0.01878175139427185, 0.0020527308806777, 0.0215458981692791, 0.11240021139383316, 0.04176251217722893, 0.0029346500523388386, 0.009983573108911514, -0.02235851250588894, -0.033029329031705856, -0.009995552711188793, -0.005420312751084566, -0.022071992978453636, -0.026759576052427292, 0.04226711019873619, 0.011195664294064045, 0.03892333805561066, -0.05155453830957413, 0.002767745638266206, 0.026580343022942543, 0.017792288213968277, -0.006149668712168932, 0.03067249059677124, -0.00807107426226139, -0.02970985509455204, -0.00014460665988735855, -0.06947144865989685, 0.04123743250966072, -0.02014034055173397, -0.04139931499958038, -0.04821839928627014, 0.03999561443924904, -0.008849403820931911, -0.011396090500056744, -0.022594638168811798, -0.03744220733642578, -0.035571057349443436, -0.05532008036971092, -0.015487847849726677, 0.06350523233413696, 0.025269120931625366, 0.07994896173477173, -0.00616943696513772, -0.07134418934583664, 0.01120601687580347, 0.0004036705067846924, -0.02858564630150795, 0.039110295474529266, 0.010880672372877598, 0.011522999033331871, -0.01824161969125271, -0.07479836046695709, 0.014343279413878918, -0.005692597478628159, 0.01245111133903265, -0.01010148972272873, -0.04272022470831871, 0.001310935360379517, -0.017032183706760406, 0.03015436790883541, 0.06109524518251419, -0.005338848102837801, 0.001922380761243403, 0.020586345344781876, 0.08365163207054138, -0.08247996121644974, 0.049734313040971756, 0.04558273032307625, 0.007742002140730619, -0.024034548550844193, 0.012520155869424343, 0.03665446862578392, -0.017775073647499084, -0.02376912534236908, 0.02734464220702648, -0.042116571217775345, 0.007710062898695469, 0.046082619577646255, 0.036854322999715805, -0.05960695445537567, 0.009122337214648724, 0.04906139895319939, 0.007366541773080826, -0.005730044562369585, 0.04456406086683273, -0.053326308727264404, -0.026354270055890083, -0.010489625856280327, 0.029721006751060486, 0.038247715681791306, -0.02673991210758686, 0.031099384650588036, -0.021114874631166458, 0.010716967284679413, 0.06331228464841843, 0.009646613150835037, 0.016694040969014168, 0.02440282702445984, -0.03749075159430504, -0.03572024405002594, 0.019123513251543045, -0.020600294694304466, 0.007831096649169922, 0.013263463973999023, 0.0467941090464592, 0.010057169944047928, -0.04340679571032524, -0.04132122918963432, -0.0004879906482528895, -0.0207336638122797, 0.005677027627825737, -0.07668685913085938, 0.03623892739415169, -0.0773511454463005, 0.026838721707463264, -0.05403671786189079, 0.09178608655929565, 0.005992370191961527, -0.011988258920609951, 0.00996373314410448, -0.019535819068551064, -0.025282058864831924, -0.0437307134270668, -0.02332783304154873, 0.038421910256147385, -0.009318920783698559, 0.03002331778407097, -0.004979824181646109, -0.06061311811208725, 0.048233918845653534, -0.0005887034349143505, -0.06232048198580742, 0.007798801176249981, -0.019034314900636673, -0.007384374737739563, -0.01564849354326725, -0.015320556238293648, -0.08282027393579483, 0.029510408639907837, 0.009403036907315254, 0.0030270498245954514, 0.024579355493187904, -0.03171089291572571, 0.0030401984695345163, -0.04427278786897659, -0.002173564862459898, 0.03757045045495033, 0.01336915697902441, 0.049727797508239746, -0.013293924741446972, -0.03381749987602234, -0.00326048512943089, -0.0816066786646843, 0.05804990231990814, 0.023046601563692093, 0.020974861457943916, 0.011205663904547691, -0.002792095299810171, 0.04643188416957855, -0.015602375380694866, 0.023150986060500145, -0.06148429214954376, 0.01373806782066822, 0.04640106484293938, -0.024838199838995934, -0.001987223979085684, 0.020355122163891792]]]
-
 EXPECTED_SOURCE_CODE_EMBEDDING = [[[-0.013051304034888744, -0.011689127422869205, 0.0061772894114255905, 0.012626823969185352, 0.03666426241397858, 0.05752057582139969, 0.0015775369247421622, 0.03863620385527611, -0.03725901618599892, -0.009996162727475166, -0.03405364975333214, 0.01985335163772106, -0.009716263972222805, 0.058098193258047104, -0.019942276179790497, 0.013873593881726265, -0.010579287074506283, 0.012430536560714245, -0.0010071314172819257, 0.03298487141728401, 0.054360754787921906, -0.024492910131812096, -0.00929951947182417, 0.0592273585498333, -0.009820294566452503, 0.05729855224490166, -0.017947955057024956, 0.018152818083763123, 0.017316622659564018, -0.05199151858687401, -0.02253761701285839, 0.0001585073914611712, 0.03824048116803169, -0.019120892509818077, -0.01818966120481491, 0.03935665637254715, 0.025735244154930115, 0.0013178348308429122, -0.058524806052446365, -0.014805826358497143, 0.04293809458613396, 0.040441010147333145, 0.025621788576245308, 0.025847353041172028, 0.006349767092615366, -0.07779081910848618, -0.013287472538650036, 0.0107762161642313, -0.0309052225202322, 0.003139687003567815, 0.03729727491736412, 0.0033765994012355804, 0.024471331387758255, 0.059731241315603256, -0.01912834122776985, -0.054985933005809784, -0.004198855720460415, -0.004200202878564596, 0.019865436479449272, -0.042876340448856354, 0.015359020791947842, -0.012140379287302494, 0.01464638952165842, -0.022491831332445145, 0.0016002419870346785, -0.012566019780933857, -0.006652586627751589, 0.024227596819400787, 0.0030799484811723232, 0.004198167007416487, 0.04034937918186188, -0.02767118625342846, 0.005342334043234587, -0.01254421379417181, 0.004161798860877752, 0.03716409578919411, -0.010136869736015797, 0.026543324813246727, -0.054103802889585495, -0.008940611034631729, -0.07142001390457153, -0.0159500353038311, 0.004995092749595642, 0.017188426107168198, -0.04082930460572243, -0.012569901533424854, 0.03149604797363281, -0.02550097554922104, 0.03810068964958191, 0.01833018846809864, 0.016259614378213882, 0.020593145862221718, 0.032743655145168304, 0.04873644933104515, 0.000842963985633105, 0.07129716128110886, 0.0396294891834259, -0.015168461948633194, -0.03964649513363838, 0.008074220269918442, -0.023852061480283737, -0.0005245468928478658, -0.06342575699090958, -0.003544396022334695, -0.033189740031957626, 0.007760968990623951, -0.004665771499276161, 0.00025082522188313305, 0.08668525516986847, 0.011595824733376503, -0.03777555748820305, -0.03839228302240372, 0.034242384135723114, 0.01679300330579281, -0.06113901734352112, -0.011905340477824211, -0.009778210893273354, -0.005372675601392984, 0.018051382154226303, -0.008761419914662838, 0.016822248697280884, -0.026008235290646553, 0.006581620778888464, 0.012265799567103386, -0.015219129621982574, 0.046093862503767014, 0.007005272898823023, -0.01955472119152546, 0.010135800577700138, 0.015789270401000977, 0.026777593418955803, -0.03510648012161255, 0.030985094606876373, -0.02228793129324913, -0.07079692929983139, 0.016081994399428368, 0.0466131716966629, -0.02347896620631218, 0.037634167820215225, -0.03802374005317688, 0.009688935242593288, -0.008007929660379887, 0.04189077764749527, 0.040908362716436386, -0.04440712928771973, -0.0050613656640052795, 0.06135998293757439, 0.021855486556887627, 0.008272950537502766, 0.018232114613056183, 0.004535760264843702, -0.040309708565473557, 0.011954708956182003, -0.05750231817364693, -0.0019712583161890507, -0.016458112746477127, 0.04405771195888519, -0.027293728664517403, 0.007186658214777708, -0.004830038174986839, -0.034693870693445206, 0.003696908475831151, -0.051004260778427124, -0.08079839497804642, -0.015210013836622238, -0.0058448039926588535, -0.016362760215997696, -0.021201882511377335, 0.05099248141050339, 0.0045377593487501144, 0.02356468141078949, -0.04515140876173973, -0.05151199549436569, 0.07431479543447495, -0.03762312978506088, -0.01263558678328991, -0.0054962364956736565, -0.08417350053787231, 0.06752995401620865, -0.043252237141132355, -0.015658805146813393, 0.004602557979524136, -0.021874485537409782, 0.028978543356060982, 0.05973144993185997, -0.03007497638463974, -0.03715231269598007, 0.07196608930826187, -0.02978544868528843, 0.033651843667030334, 0.019650928676128387, -0.025619877502322197, -0.04725185036659241, 0.010890772566199303, -0.042280279099941254, 0.05767965689301491, 0.014935513958334923, -0.004419033415615559, 0.03769710659980774, -0.00018125992210116237, -0.003866637358441949, 0.036318521946668625, -0.010814324952661991, -0.013677232898771763, 0.044544801115989685, 0.030927347019314766, 0.10901423543691635, 0.0114258648827672, 0.008670762181282043, 0.008768631145358086, 0.07216917723417282, -0.06630601733922958, 0.03236708045005798, 0.007560442201793194, -0.041887346655130386, -0.019067438319325447, -0.007946088910102844, -0.009451265446841717, 0.017069052904844284, -0.0014506698353216052, 0.0215605478733778, 0.009290109388530254, -0.010451593436300755, -0.03590673208236694, -0.0412200428545475, -0.0020664422772824764, 0.026136167347431183, -0.028757713735103607, 0.050784625113010406, -0.09214776009321213, 0.060772933065891266, 0.05303633585572243, -0.0048251282423734665, -0.002864206675440073, -0.0057006338611245155, 0.0011273493291810155, 0.05762528255581856, 0.017873957753181458, 0.023740647360682487, 0.03313805162906647, 0.03365234285593033, 0.018173499032855034, -0.012207811698317528, -0.017148643732070923, -0.027850868180394173, -0.08653862774372101, 0.06483326852321625, 0.03713015466928482, 0.0900985524058342, -0.06750607490539551, -0.050161730498075485, -0.05496590584516525, -0.0332893468439579, -0.07378924638032913, -0.05794113501906395, 0.0007383649935945868, -0.07590189576148987, 0.00904989242553711, -0.07248809188604355, -0.03950851783156395, 0.0029824834782630205, -0.03202812373638153, 0.042350705713033676, 0.027266664430499077, -0.00825805775821209, 0.029044510796666145, 0.0012637927429750562, 0.017394402995705605, 0.04415641352534294, -0.026821507140994072, -0.03424592688679695, -0.010459201410412788, -0.08844626694917679, -0.036991894245147705, -0.05821205675601959, -0.020135430619120598, 0.07409483194351196, -0.034684278070926666, 0.016231723129749298, -0.011427325196564198, 0.00504199368879199, -0.004863511770963669, 0.008090125396847725, -0.0066204979084432125, 0.005198997911065817, -0.018513113260269165, 0.016963498666882515, 0.0473385713994503, -0.017430301755666733, 0.003703097580000758, -0.008633111603558064, 0.02088530734181404, 0.04715811833739281, -0.035657018423080444, 0.0020414008758962154, -0.04948620870709419, 0.004730193875730038, -0.08590442687273026, 0.00409493176266551, -0.022818870842456818, 0.0012052649399265647, -0.0002684070204850286, 0.02644159644842148, 0.015892794355750084, 0.0157309677451849, 0.0028614967595785856, 0.013764796778559685, 0.019580675289034843, 0.03279130533337593, 0.02046925760805607, 0.03652501478791237, 0.026351742446422577, 0.017062032595276833, -0.0024512868840247393, -0.016340328380465508, 0.02709968201816082, -0.04848724603652954, -0.0024309514556080103, -0.0033508935011923313, -0.04675784334540367, 0.018996717408299446, 0.06253496557474136, -0.05017639324069023, -0.028449729084968567, 0.015167194418609142, 0.020315729081630707, 0.03015058860182762, -0.015009029768407345, 0.03451021388173103, -0.031974758952856064, -0.04735058173537254, 0.032103803008794785, -0.028756100684404373, -0.009661528281867504, 0.018705418333411217, 0.02572050131857395, -0.016562385484576225, -0.025310510769486427, -0.045018065720796585, 0.07747547328472137, -0.04766268655657768, -0.028487706556916237, -0.04156040772795677, 0.0319136306643486, 0.051102131605148315, -0.025414694100618362, -0.005178619641810656, 0.034076374024152756, 0.01365358754992485, -0.03328518196940422, 0.000909967755433172, -0.01681385561823845, 0.0038273739628493786, -0.003476550802588463, -0.00685668271034956, 0.022977983579039574, -0.036483705043792725, 0.04988740757107735, -0.0007284693419933319, -0.021310841664671898, -0.049399614334106445, -0.004924762528389692, 0.00877802912145853, 0.0955028235912323, -0.017765339463949203, 0.030568238347768784, 0.003871016902849078, -0.03085997886955738, 0.046251118183135986, -0.05580931529402733, -0.0014638245338574052, 0.057290028780698776, 0.01812077686190605, -0.06990323215723038, -0.03954273834824562, -0.026095420122146606, -0.03390904888510704, 0.042344022542238235, 0.005033852066844702, -0.00208447128534317, 0.05382784456014633, -0.051984287798404694, 0.0441637821495533, -0.07095381617546082, -0.0076928818598389626, 0.039380140602588654, 0.06445686519145966, 0.001274264301173389, 0.039372336119413376, 0.023736294358968735, -0.04850463569164276, 0.03390292078256607, 0.007522500120103359, -0.004525638185441494, 0.015125693753361702, -0.020702533423900604, -0.012270613573491573, -0.02414861135184765, 0.035907160490751266, 0.014037749730050564, -0.01651720702648163, -0.003083867486566305, 0.0024303297977894545, 0.017893236130475998, -0.028801800683140755, 0.07877548784017563, 0.022312523797154427, 0.014530490152537823, 0.014480830170214176, 0.07192866504192352, 0.034400928765535355, 0.04074256494641304, -0.01281071174889803, 0.036391522735357285, -0.09788823127746582, 0.04703669995069504, 0.03194604441523552, 0.019674139097332954, -0.025774406269192696, 0.00933015439659357, 0.015043867751955986, 0.06823433935642242, 0.04513378068804741, 0.038207344710826874, -0.03802376240491867, -0.007131265942007303, 0.0031374727841466665, -0.008548540994524956, -0.07138101011514664, -0.03392791748046875, -0.014280746690928936, 0.01230586040765047, -0.024242667481303215, -0.05223488807678223, 0.003962994087487459, -0.025352900847792625, -0.05004741623997688, 0.021904049441218376, -0.01115341205149889, -0.016441144049167633, -0.04036850109696388, -0.00527613889425993, -0.0472530759871006, 0.002472205553203821, -0.048548437654972076, -0.008678913116455078, -0.03422780707478523, 0.010742343962192535, 0.038751911371946335, -0.028613252565264702, 0.012506246566772461, -0.030362045392394066, -0.02754410170018673, 0.018429184332489967, 0.034306373447179794, -0.003964684903621674, 0.024576228111982346, -0.028827475383877754, 0.026240559294819832, 0.013620004989206791, 0.0020237828139215708, -0.03800326585769653, 0.011240096762776375, -0.013830768875777721, -0.006187107414007187, -0.02414216287434101, 0.009945118799805641, 0.06326183676719666, -0.053118254989385605, 0.050729840993881226, -0.05505680665373802, 0.10690378397703171, -0.06032109260559082, -0.005868874955922365, -0.0007857393939048052, 0.003859065007418394, 0.029574228450655937, -0.08408887684345245, -0.02912437915802002, -0.0006913819233886898, -0.016001256182789803, -0.012705079279839993, 0.1034940555691719, 0.06292002648115158, 0.012051649391651154, 0.0034288454335182905, 0.01141892746090889, 0.0152932433411479, -0.022146841511130333, 0.03609273210167885, 0.02188069187104702, -0.03150516748428345, 0.021766500547528267, 0.03557770699262619, 0.03774629160761833, 0.012030727230012417, -0.025547189638018608, -0.017519231885671616, 0.0025351233780384064, 0.01391551736742258, 0.011117934249341488, -0.02716507576406002, -0.0371352955698967, -0.03518036752939224, 0.007117487955838442, 0.06183638796210289, -0.029227031394839287, -0.0011803803499788046, -0.014542236924171448, -0.00014409080904442817, 0.032907500863075256, 0.0016206084983423352, -0.03692452237010002, -0.008425734005868435, -0.01097832527011633, 0.006296063307672739, -0.06270907074213028, -0.04896632581949234, -0.00849383044987917, -0.02495805360376835, 0.029120489954948425, -0.008762175217270851, 0.0318232886493206, 0.07440081238746643, 0.06078105419874191, 0.03435327857732773, 0.005174530204385519, -0.05612916499376297, -0.0763808935880661, -0.07723671197891235, -0.03018672950565815, 0.07988081872463226, 0.0550541914999485, -0.040324680507183075, -0.04683999717235565, 0.03607304394245148, -0.03521318361163139, 0.024083951488137245, 0.007082310505211353, 0.027137992903590202, 0.06455764919519424, 0.04654219001531601, 0.034952789545059204, -0.0026567259337753057, 0.020042048767209053, 0.014445168897509575, -0.017764851450920105, 0.04890916123986244, 0.004399528726935387, 0.023691508919000626, 0.013291295617818832, 0.07977255433797836, 0.03523825481534004, -0.040963008999824524, -0.05111192166805267, 0.0016384024638682604, -0.036837927997112274, -0.009757811203598976, 0.007887971587479115, -0.05723843351006508, -0.009604426100850105, -0.04913696274161339, 0.07692203670740128, 0.01498355157673359, 0.02105642668902874, 0.07505487650632858, -0.059644028544425964, -0.013596558943390846, -0.021509787067770958, -0.0002267462550662458, 0.03871177136898041, 0.05171257629990578, -0.04749882593750954, 0.0196915902197361, 0.05985799804329872, 0.012927287258207798, -0.005818462464958429, 0.05278846621513367, 0.004654995631426573, -0.007064175792038441, -0.06262043118476868, 0.034967534244060516, -0.026934975758194923, -0.042134299874305725, -0.026429036632180214, 0.007911932654678822, -1.5254921891028062e-05, 0.009944749064743519, -0.0054531097412109375, 0.016782578080892563, -0.04962955787777901, 0.017333880066871643, 0.0399051234126091, -0.007620404474437237, -0.03879571706056595, -0.06913743168115616, 0.04215263947844505, -0.018903138116002083, -0.023440269753336906, 0.012832440435886383, -0.02782014012336731, 0.052646245807409286, 0.03564396873116493, 0.06310641765594482, 0.0415896512567997, -0.005415163468569517, 0.027082866057753563, 0.009299403056502342, 0.06407351791858673, 0.0066577233374118805, -0.019719727337360382, 0.01121288537979126, 0.020159458741545677, -0.05302248150110245, 0.01948903314769268, 0.0736313983798027, -0.030158070847392082, -0.05495317280292511, -0.02394312620162964, -0.009914662688970566, 0.039460886269807816, 0.0003992479760199785, -0.01549030002206564, -0.008851312100887299, 0.06590235233306885, 0.038605690002441406, -0.031626082956790924, -0.013218682259321213, 0.0530000701546669, 0.008573225699365139, 0.05570465326309204, 0.016290893778204918, 0.05861463025212288, 0.04314344748854637, 0.06269516795873642, -0.03302126005291939, -0.06827136874198914, -0.041004396975040436, -0.03802391141653061, -0.008551148697733879, 0.012812739238142967, -0.013022837229073048, -0.03503322973847389, 0.05049632117152214, -0.07447061687707901, 0.04890673980116844, -0.05261698365211487, 0.02528267912566662, 0.037456415593624115, -0.010425832122564316, 0.019900400191545486, 0.014831925742328167, 0.058523308485746384, 0.03517689183354378, -0.020448574796319008, -0.028403541073203087, -0.05959759280085564, -0.02919483557343483, 0.01763736642897129, -0.02132450044155121, -0.04107750952243805, -0.0071775480173528194, -0.020780691877007484, 0.02031451091170311, -0.004182604607194662, 0.051944371312856674, -0.01457061804831028, 0.027667971327900887, 0.05202688276767731, -0.03916092962026596, -0.018387112766504288, 0.022388016805052757, 0.03531308099627495, 0.03872895613312721, -0.05576300248503685, -0.03787967190146446, -0.048848237842321396, -0.015445721335709095, 0.02485143020749092, 0.019190482795238495, -0.0445023849606514, 0.04284070432186127, -0.010928901843726635, 0.007661652285605669, -0.011654711328446865, 0.01056650560349226, 0.004646293818950653, 0.0008796222973614931, 0.02486155927181244, 0.03022106923162937, 0.0353042297065258, -0.004376336466521025, -0.00016710416821297258, -0.044919732958078384, 0.027060121297836304, -0.00029831138090230525, -0.022858036682009697, 0.057583872228860855, -0.019536621868610382, -0.04920261725783348, 0.005032634828239679, -0.007613407447934151, -0.014604457654058933, 0.03056352213025093, 0.040978047996759415, -0.009985797107219696, -0.02518821321427822, -0.01935925893485546, -0.004644701257348061, -0.054433632642030716, -0.046721622347831726, -0.017339712008833885, -0.003869705367833376, 0.04816225543618202, -0.048703283071517944, 0.02621428854763508, -0.00694960867986083, 0.117829330265522, -0.008435019291937351, 0.016901640221476555, -0.04455304145812988, -0.03600754961371422, 0.0454791821539402, -0.015971677377820015, -0.02218417264521122, -0.004562762565910816, 0.033850256353616714, 0.007782079745084047, -0.023167559877038002, -0.03101775050163269, 0.016464561223983765, 0.05664539337158203, -0.026898084208369255, 0.035293012857437134, -0.049966633319854736, -0.01999065652489662, -0.005049592815339565, 0.031059306114912033, -0.09254643321037292, -0.07558170706033707, -0.01296288426965475, 0.01766977645456791, 0.07023356109857559, -0.040057048201560974, 0.016502125188708305, -0.034887004643678665, 0.06617118418216705, 0.042334385216236115, -0.040726810693740845, 0.009116985835134983, 0.0012191651621833444, -0.05160481482744217, 0.03220776468515396, -0.029799124225974083, -0.034629937261343, -0.03534003719687462, 0.03062775358557701, 0.042931802570819855, -0.03951575979590416, 0.011322996579110622, 0.006103962659835815, 0.011366164311766624, 0.016211602836847305, -0.05970223248004913, 0.03636988252401352, -0.02851315401494503, -0.024946095421910286, 0.013584715314209461]]]
 
 TEST_EXECUTION_JSON_STRING = """
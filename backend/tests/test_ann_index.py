@@ -0,0 +1,134 @@
+import numpy as np
+import pytest
+import torch
+
+from experimental_unixcoder.ann_index import (
+    IVFIndex,
+    assign_lists,
+    fit_ann_index,
+    pack_ann_index,
+    unpack_ann_index
+)
+from experimental_unixcoder.ranking import RankingMatrix
+
+
+def clustered_files(n_files=60, chunks=8, clusters=12, dim=32, seed=0):
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(clusters, dim))
+    files = []
+    for i in range(n_files):
+        center = centers[i % clusters]
+        files.append((f"file_{i}.java", (center + 0.1 * rng.normal(size=(chunks, dim))).astype(np.float32)))
+    return files, centers
+
+
+def test_no_index_below_min_chunks_or_when_disabled():
+    files, _ = clustered_files()
+    embeddings = [e for _, e in files]
+
+    assert fit_ann_index(embeddings, method="none", min_chunks=0) is None
+    assert fit_ann_index(embeddings, method="ivf", min_chunks=10 ** 6) is None
+    with pytest.raises(ValueError):
+        fit_ann_index(embeddings, method="hnsw")
+
+
+def test_fit_and_assign_lists():
+    files, _ = clustered_files()
+    centroids = fit_ann_index([e for _, e in files], method="ivf", min_chunks=0)
+
+    assert centroids.shape == (round((len(files) * 8) ** 0.5), 32)
+    np.testing.assert_allclose(np.linalg.norm(centroids, axis=1), 1.0, rtol=1e-5)
+
+    lists = assign_lists(files[0][1], centroids)
+    assert len(lists) == 8
+    assert all(0 <= i < len(centroids) for i in lists)
+    assert assign_lists(np.empty((0, 32), dtype=np.float32), centroids) == []
+    assert assign_lists(files[0][1], None) is None
+
+
+def test_pack_round_trip():
+    files, _ = clustered_files()
+    centroids = fit_ann_index([e for _, e in files], method="ivf", min_chunks=0)
+
+    document = pack_ann_index(centroids, "ivf")
+
+    assert document["method"] == "ivf"
+    assert document["lists"] == len(centroids)
+    np.testing.assert_array_equal(unpack_ann_index(document), centroids)
+    assert pack_ann_index(None) is None
+    assert unpack_ann_index(None) is None
+
+
+def build_matrices(files, probes):
+    centroids = fit_ann_index([e for _, e in files], method="ivf", min_chunks=0)
+    exact = RankingMatrix.from_embeddings(files, "fp32")
+    ivf = RankingMatrix.from_embeddings(files, "fp32", centroids=centroids,
+                                        ann_lists=[assign_lists(e, centroids) for _, e in files])
+    ivf.index.probes = probes
+    return exact, ivf
+
+
+def test_all_probes_match_exact_scoring():
+    files, _ = clustered_files()
+    exact, ivf = build_matrices(files, probes=10 ** 6)
+    query = files[3][1][:2]
+
+    assert ivf.rank(query) == exact.rank(query)
+
+
+def test_recall_on_clustered_data():
+    files, centers = clustered_files()
+    exact, ivf = build_matrices(files, probes=4)
+    rng = np.random.default_rng(1)
+
+    recalls = []
+    for center in centers:
+        query = (center + 0.1 * rng.normal(size=(2, 32))).astype(np.float32)
+        exact_top = {file_id for file_id, _ in exact.rank(query, top_k=5)}
+        ivf_top = {file_id for file_id, _ in ivf.rank(query, top_k=5)}
+        recalls.append(len(exact_top & ivf_top) / 5)
+
+    assert np.mean(recalls) >= 0.9
+    assert len(ivf.index.candidate_rows(torch.nn.functional.normalize(torch.from_numpy(query), dim=1))) < len(ivf.matrix)
+
+
+def test_missing_lists_fall_back_to_exact_scoring():
+    files, _ = clustered_files()
+    centroids = fit_ann_index([e for _, e in files], method="ivf", min_chunks=0)
+    ann_lists = [assign_lists(e, centroids) for _, e in files]
+    ann_lists[5] = None
+
+    ranking_matrix = RankingMatrix.from_embeddings(files, "fp32", centroids=centroids, ann_lists=ann_lists)
+
+    assert ranking_matrix.index is None
+
+
+def test_subset_keeps_index_rows():
+    files, _ = clustered_files()
+    _, ivf = build_matrices(files, probes=10 ** 6)
+    corpus = [file_id for file_id, _ in files[::3]]
+
+    subset = ivf.subset(corpus)
+
+    assert isinstance(subset.index, IVFIndex)
+    assert len(subset.index.row_lists) == len(subset.matrix)
+    assert [file_id for file_id, _ in subset.rank(files[0][1])] == \
+        [file_id for file_id, _ in RankingMatrix.from_embeddings(files[::3], "fp32").rank(files[0][1])]
+
+
+def test_patch_keeps_row_lists():
+    files, _ = clustered_files()
+    centroids = fit_ann_index([e for _, e in files], method="ivf", min_chunks=0)
+    ranking_matrix = RankingMatrix.from_embeddings(files, "fp32", centroids=centroids,
+                                                   ann_lists=[assign_lists(e, centroids) for _, e in files])
+    changed = [("file_3.java", files[10][1]), ("new.java", files[20][1][:3])]
+
+    patched = ranking_matrix.patch(changed, ["file_5.java"], ann_lists=[assign_lists(e, centroids) for _, e in changed])
+    rebuilt = [(file_id, dict(changed).get(file_id, e)) for file_id, e in files if file_id != "file_5.java"]
+    rebuilt.append(changed[1])
+    expected = RankingMatrix.from_embeddings(rebuilt, "fp32", centroids=centroids,
+                                             ann_lists=[assign_lists(e, centroids) for _, e in rebuilt])
+
+    assert torch.equal(patched.index.row_lists, expected.index.row_lists)
+    assert patched.rank(files[10][1]) == expected.rank(files[10][1])
+    assert ranking_matrix.patch(changed, ann_lists=[None, None]).index is None
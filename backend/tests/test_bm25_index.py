@@ -0,0 +1,109 @@
+import math
+import numpy as np
+import torch
+
+from experimental_unixcoder.bm25_index import BM25Index, fuse_scores, lexical_candidates, term_counts
+from experimental_unixcoder.ranking import RankingMatrix
+from experimental_unixcoder.ranking_snapshot import load_ranking_snapshot, save_ranking_snapshot
+
+TEXTS = [
+    "login button crash login",
+    "payment screen timeout",
+    "settings screen color theme",
+    "login screen password reset",
+    None,
+]
+
+
+def make_files(dim=16, seed=0):
+    rng = np.random.default_rng(seed)
+    files = [(f"src/File{i}.java", rng.normal(size=(2, dim)).astype(np.float32)) for i in range(len(TEXTS))]
+    return files, [term_counts(text) for text in TEXTS]
+
+
+def test_term_counts_drops_invalid_mongo_keys():
+    assert term_counts("login crash login a.b $set") == {"login": 2, "crash": 1}
+    assert term_counts(None) is None
+
+
+def test_scores_rank_matching_files_first():
+    index = BM25Index.from_term_counts([term_counts(text) for text in TEXTS])
+    scores = index.scores({"login": 1})
+
+    assert scores[0] > scores[3] > 0
+    assert scores[1] == scores[2] == scores[4] == 0
+    assert torch.equal(index.scores({"unknown": 1}), torch.zeros(len(TEXTS)))
+
+    # One query term in one file matches the Okapi BM25 formula
+    idf = math.log(1 + (4 - 2 + 0.5) / (2 + 0.5))
+    norm = 1.2 * (1 - 0.75 + 0.75 * 4 / (15 / 4))
+    assert math.isclose(scores[3].item(), idf * 2.2 / (1 + norm), rel_tol=1e-5)
+
+
+def test_subset_keeps_scores_of_kept_files():
+    files, file_terms = make_files()
+    ranking_matrix = RankingMatrix.from_embeddings(files, "fp32", file_terms=file_terms)
+    subset = ranking_matrix.subset(["src/File3.java", "src/File0.java"])
+
+    query = {"login": 1, "screen": 1}
+    assert torch.allclose(subset.bm25.scores(query), ranking_matrix.bm25.scores(query)[[0, 3]])
+
+
+def test_candidates_restrict_dense_scores():
+    files, file_terms = make_files()
+    ranking_matrix = RankingMatrix.from_embeddings(files, "fp32", file_terms=file_terms)
+    query = files[1][1]
+    query_terms = {"login": 1, "password": 1}
+
+    exact = ranking_matrix.scores_many([query], [query_terms], candidates=0, weight=0)[0]
+    restricted = ranking_matrix.scores_many([query], [query_terms], candidates=2, weight=0)[0]
+
+    assert torch.equal(restricted[[0, 3]], exact[[0, 3]])
+    assert torch.isinf(restricted[[1, 2, 4]]).all()
+    assert lexical_candidates(torch.ones(1, 5), candidates=5) is None
+
+
+def test_fusion_and_lexical_only_queries():
+    files, file_terms = make_files()
+    ranking_matrix = RankingMatrix.from_embeddings(files, "fp32", file_terms=file_terms)
+    query_terms = [{"payment": 1}, {"settings": 1}]
+
+    scores = ranking_matrix.scores_many([files[0][1], None], query_terms, candidates=0, weight=1)
+    assert scores[0].argmax().item() == 1
+    assert scores[0][4] == 0
+    assert scores[1].argmax().item() == 2
+    assert ranking_matrix.rank(None, top_k=1, query_terms={"theme": 1})[0][0] == "src/File2.java"
+
+    dense = torch.tensor([[0.5, float('-inf')]])
+    assert torch.equal(fuse_scores(dense, torch.tensor([[2.0, 1.0]]), weight=0), dense)
+    assert fuse_scores(dense, torch.tensor([[2.0, 1.0]]), weight=0.5).tolist() == [[0.75, float('-inf')]]
+
+
+def test_snapshot_keeps_bm25_index(tmp_path):
+    files, file_terms = make_files()
+    ranking_matrix = RankingMatrix.from_embeddings(files, "fp32", file_terms=file_terms)
+    path = str(tmp_path / "abc")
+
+    save_ranking_snapshot(ranking_matrix, path, "abc")
+    loaded = load_ranking_snapshot(path, "fp32")
+
+    assert loaded.bm25.vocabulary == ranking_matrix.bm25.vocabulary
+    query_terms = {"screen": 2, "reset": 1}
+    assert loaded.rank(files[0][1], query_terms=query_terms) == ranking_matrix.rank(files[0][1], query_terms=query_terms)
+    assert loaded.rank(None, query_terms=query_terms) == ranking_matrix.rank(None, query_terms=query_terms)
+
+
+def test_patch_matches_rebuilt_index():
+    files, file_terms = make_files()
+    changed = [("src/File1.java", files[1][1]), ("src/New.java", files[0][1])]
+    changed_terms = [term_counts("payment login refund"), term_counts("brand new screen")]
+
+    patched = RankingMatrix.from_embeddings(files, "fp32", file_terms=file_terms).patch(
+        changed, ["src/File2.java"], file_terms=changed_terms)
+    expected = RankingMatrix.from_embeddings(
+        [files[0], changed[0], files[3], files[4], changed[1]], "fp32",
+        file_terms=[file_terms[0], changed_terms[0], file_terms[3], file_terms[4], changed_terms[1]])
+
+    for query_terms in [{"login": 1}, {"screen": 2, "brand": 1}, {"theme": 1}]:
+        assert torch.allclose(patched.bm25.scores(query_terms), expected.bm25.scores(query_terms))
+    assert patched.bm25.avg_length == expected.bm25.avg_length
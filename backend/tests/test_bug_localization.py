@@ -0,0 +1,107 @@
+import threading
+import numpy as np
+import pytest
+import torch
+from experimental_unixcoder.bug_localization import BugLocalization
+from experimental_unixcoder.encoder_backends import create_backend
+
+sample_texts = [
+    "public class SampleClass public static void main string args int new number system out println hello world",
+    "open entry creation dialog enter test secret field press save crash null pointer exception " * 20,
+    "",
+    "short",
+]
+
+@pytest.fixture(scope="module")
+def bug_localizer():
+    return BugLocalization()
+
+def test_encode_texts_matches_single_chunk_encoding(bug_localizer):
+    batched = bug_localizer.encode_texts(sample_texts, batch_size=8)
+    single = bug_localizer.encode_texts(sample_texts, batch_size=1)
+
+    assert len(batched) == len(sample_texts)
+    for batched_embeddings, single_embeddings in zip(batched, single):
+        assert batched_embeddings.dtype == np.float32
+        assert batched_embeddings.shape == single_embeddings.shape
+        similarities = torch.nn.functional.cosine_similarity(
+            torch.from_numpy(batched_embeddings), torch.from_numpy(single_embeddings), dim=1
+        )
+        assert (similarities > 0.9999).all(), f"Cosine similarity is too low: {similarities.min()}"
+
+def test_encode_texts_empty_text(bug_localizer):
+    assert bug_localizer.encode_texts([""])[0].shape == (0, 768)
+
+def test_tokenize_windows_covers_whole_text(bug_localizer):
+    text = sample_texts[1] * 10
+    tokens = bug_localizer.model.tokenizer.tokenize(text)
+    windows = bug_localizer.model.tokenize_windows([text], max_length=512)[0]
+
+    # Every window fits the model limit and together they keep every token exactly once
+    assert all(len(window) <= 512 for window in windows)
+    assert sum(len(window) - 4 for window in windows) == len(tokens)
+    assert len(windows) == -(-len(tokens) // 508)
+
+def test_tokenize_matches_slow_tokenizer(bug_localizer):
+    model = bug_localizer.model
+    texts = sample_texts + ["fill <mask0> here", "unicode caf\u00e9  tabs\tand\nnewlines"]
+    expected = []
+    for text in texts:
+        tokens = model.tokenizer.tokenize(text)[:512 - 4]
+        tokens = [model.tokenizer.cls_token, "<encoder-only>", model.tokenizer.sep_token] + tokens + [model.tokenizer.sep_token]
+        expected.append(model.tokenizer.convert_tokens_to_ids(tokens))
+
+    assert model.tokenize(texts, mode="<encoder-only>") == expected
+
+def test_encoder_mask_matches_dense_mask(bug_localizer):
+    model = bug_localizer.model
+    token_batch = model.tokenize(sample_texts, mode="<encoder-only>", max_length=64, padding=True)
+    source_ids = torch.tensor(token_batch).to(bug_localizer.device)
+    mask = source_ids.ne(model.config.pad_token_id)
+
+    with torch.no_grad():
+        _, sentence_embeddings = model(source_ids)
+        dense = model.model(source_ids, attention_mask=mask.unsqueeze(1) * mask.unsqueeze(2))[0]
+    expected = (dense * mask.unsqueeze(-1)).sum(1) / mask.sum(-1).unsqueeze(-1)
+
+    # Even the empty text keeps its special tokens, so no row averages over zero tokens
+    assert not hasattr(model, "lm_head")
+    assert torch.allclose(sentence_embeddings, expected, atol=1e-5)
+
+@pytest.mark.parametrize("backend_name", ["compile", "export"])
+def test_backends_match_eager(bug_localizer, backend_name, tmp_path):
+    token_batch = bug_localizer.model.tokenize(sample_texts, mode="<encoder-only>")
+    eager = create_backend("eager", bug_localizer.model, bug_localizer.device)
+    backend = create_backend(backend_name, bug_localizer.model, bug_localizer.device, batch_size=8)
+    backend.export_dir = str(tmp_path)
+
+    expected = eager.encode_ids(token_batch)
+    result = backend.encode_ids(token_batch)
+
+    assert result.shape == expected.shape
+    assert torch.allclose(result, expected, atol=1e-5)
+
+def test_concurrent_encodes_do_not_overlap(bug_localizer):
+    encode_ids = bug_localizer.backend.encode_ids
+    running = []
+    overlapped = []
+
+    def exclusive_encode_ids(token_batch):
+        overlapped.append(bool(running))
+        running.append(True)
+        try:
+            return encode_ids(token_batch)
+        finally:
+            running.pop()
+
+    bug_localizer.backend.encode_ids = exclusive_encode_ids
+    try:
+        threads = [threading.Thread(target=bug_localizer._encode_uncached, args=([text * 3 for text in sample_texts],))
+                   for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        bug_localizer.backend.encode_ids = encode_ids
+    assert overlapped and not any(overlapped)
@@ -0,0 +1,67 @@
+import mongomock
+import pytest
+import numpy as np
+from unittest.mock import MagicMock, patch
+
+import services.db_service as db_service
+from experimental_unixcoder.ranking import RankingMatrix
+
+
+@pytest.fixture
+def mock_db():
+    database = mongomock.MongoClient().test_db
+    db = MagicMock()
+    db.get_repo_collection.return_value = database.repos
+    db.get_embeddings_collection.return_value = database.embeddings
+    db.get_files_collection.return_value = database.files
+    database.repos.insert_one({'repo_name': 'r', 'owner': 'o', 'commit_sha': 'old', 'stored_at': '1'})
+    with patch.object(db_service, "db", db), \
+            patch.object(db_service, "insert_to_code_db"), \
+            patch.object(db_service, "store_ranking_snapshot"):
+        yield database
+
+
+def repo_document():
+    return {'repo_name': 'r', 'owner': 'o', 'commit_sha': 'new', 'stored_at': '2', 'projection': None}
+
+
+def test_repo_document_is_stored_after_every_file(mock_db):
+    def code_files():
+        # Files are encoded while they are stored, so the new commit SHA must not be visible yet
+        assert db_service.retrieve_sha_from_db('o', 'r') is None
+        yield {'route': 'A.java', 'embedding': b'a'}
+        yield {'route': 'B.java', 'embedding': b'b'}
+
+    db_service.send_initialized_data_to_db(repo_document(), code_files(), [])
+
+    repo = mock_db.repos.find_one({'repo_name': 'r', 'owner': 'o'})
+    assert repo['commit_sha'] == 'new' and repo['stored_at'] == '2'
+    assert mock_db.repos.count_documents({}) == 1
+    assert sorted(doc['route'] for doc in mock_db.embeddings.find({'repo_id': repo['_id']})) == ['A.java', 'B.java']
+
+
+def test_failed_initialization_leaves_no_commit_sha(mock_db):
+    def code_files():
+        yield {'route': 'A.java', 'embedding': b'a'}
+        raise RuntimeError("out of memory")
+
+    with pytest.raises(RuntimeError):
+        db_service.send_initialized_data_to_db(repo_document(), code_files(), [])
+
+    assert db_service.retrieve_sha_from_db('o', 'r') is None
+
+
+def test_caches_are_invalidated_after_every_file(mock_db):
+    ranking_matrix = RankingMatrix.from_embeddings([("A.java", np.ones((1, 4), dtype=np.float32))], "fp32")
+
+    def code_files():
+        yield {'route': 'A.java', 'embedding': b'a'}
+        # A report ranked while the files are stored caches a matrix of a mix of embeddings
+        db_service.ranking_cache.put(('o', 'r', 'new', '1', 'fp32'), ranking_matrix)
+        yield {'route': 'B.java', 'embedding': b'b'}
+
+    db_service.send_initialized_data_to_db(repo_document(), code_files(), [])
+
+    assert db_service.ranking_cache.get(('o', 'r', 'new', '1', 'fp32')) is None
+    # Entries cached by other processes are keyed on the old generation
+    assert db_service.retrieve_repo_generation('o', 'r') == '2'
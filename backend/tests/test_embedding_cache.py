@@ -0,0 +1,36 @@
+import numpy as np
+
+from experimental_unixcoder.embedding_cache import EmbeddingCache
+
+def make_embeddings(value, chunks=2, dim=768):
+    return np.full((chunks, dim), value, dtype=np.float32)
+
+def test_embedding_cache_round_trip(tmp_path):
+    cache = EmbeddingCache(str(tmp_path / "cache.sqlite3"), 1, "model|fp32")
+    embeddings = make_embeddings(0.25)
+
+    assert cache.get_many(["public class Foo"]) == [None]
+    cache.put_many(["public class Foo"], [embeddings])
+
+    results = cache.get_many(["public class Foo", "public class Bar"])
+    assert np.array_equal(results[0], embeddings) and results[1] is None
+    assert (cache.hits, cache.misses) == (1, 2)
+
+def test_embedding_cache_persists_and_separates_fingerprints(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    EmbeddingCache(path, 1, "model|fp32").put_many(["text"], [make_embeddings(0.5)])
+
+    assert np.array_equal(EmbeddingCache(path, 1, "model|fp32").get_many(["text"])[0], make_embeddings(0.5))
+    assert EmbeddingCache(path, 1, "model|int8").get_many(["text"]) == [None]
+
+def test_embedding_cache_evicts_least_recently_used(tmp_path):
+    # Each entry is 768 float32s (3 KB), so 0.01 MB holds three entries
+    cache = EmbeddingCache(str(tmp_path / "cache.sqlite3"), 0.01, "model|fp32")
+    for text in ["a", "b", "c"]:
+        cache.put_many([text], [make_embeddings(0.1, chunks=1)])
+    cache.get_many(["a"])
+    cache.put_many(["d"], [make_embeddings(0.2, chunks=1)])
+
+    results = cache.get_many(["a", "b", "c", "d"])
+    assert results[0] is not None and results[3] is not None
+    assert results[1] is None
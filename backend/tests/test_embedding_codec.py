@@ -0,0 +1,33 @@
+import pytest
+import torch
+
+from experimental_unixcoder.embedding_codec import pack_embeddings, to_embedding_matrix, unpack_embeddings
+
+EMBEDDINGS = torch.nn.functional.normalize(torch.randn(3, 768, generator=torch.Generator().manual_seed(0)), dim=1)
+EMBEDDINGS_AS_LISTS = [EMBEDDINGS[i:i + 1].tolist() for i in range(3)]
+
+def test_pack_embeddings_fp32_round_trip():
+    document = pack_embeddings(EMBEDDINGS.numpy(), "fp32")
+
+    assert document["shape"] == [3, 768]
+    assert len(document["data"]) == 3 * 768 * 4
+    assert torch.equal(unpack_embeddings(document), EMBEDDINGS)
+
+@pytest.mark.parametrize("precision, dtype, tolerance", [("fp16", torch.float16, 1e-3), ("bf16", torch.bfloat16, 1e-2)])
+def test_pack_embeddings_reduced_precision(precision, dtype, tolerance):
+    document = pack_embeddings(EMBEDDINGS.numpy(), precision)
+    matrix = unpack_embeddings(document)
+
+    assert len(document["data"]) == 3 * 768 * 2
+    assert matrix.dtype == dtype
+    assert torch.allclose(matrix.float(), EMBEDDINGS, atol=tolerance)
+
+def test_unpack_embeddings_reads_legacy_lists():
+    matrix = unpack_embeddings(EMBEDDINGS_AS_LISTS)
+    assert matrix.dtype == torch.float32
+    assert torch.equal(matrix, EMBEDDINGS)
+
+def test_missing_embeddings():
+    assert pack_embeddings(None) is None
+    assert to_embedding_matrix(None).numel() == 0
+    assert unpack_embeddings(pack_embeddings(EMBEDDINGS.numpy()[:0], "fp16")).numel() == 0
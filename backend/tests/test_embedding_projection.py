@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+from experimental_unixcoder.embedding_projection import fit_projection, pack_projection, project_embeddings, \
+    unpack_projection
+
+def make_repo_embeddings(rank=16, files=20, chunks=5, hidden=768):
+    # Embeddings that lie in a rank-dimensional subspace, like the clustered chunks of one repo
+    generator = np.random.default_rng(0)
+    basis = generator.standard_normal((rank, hidden))
+    embeddings = []
+    for _ in range(files):
+        matrix = (generator.standard_normal((chunks, rank)) @ basis).astype(np.float32)
+        embeddings.append(matrix / np.linalg.norm(matrix, axis=1, keepdims=True))
+    return embeddings
+
+def test_pca_projection_preserves_similarities():
+    embeddings = make_repo_embeddings()
+    projection = fit_projection(embeddings, "pca", 32)
+
+    assert projection.shape == (768, 32)
+    query, file = embeddings[0], embeddings[1]
+    projected_query, projected_file = project_embeddings(query, projection), project_embeddings(file, projection)
+    assert projected_file.shape == (5, 32)
+    assert np.allclose(projected_query @ projected_file.T, query @ file.T, atol=1e-4)
+
+def test_random_projection_is_seeded():
+    embeddings = make_repo_embeddings()
+    assert np.array_equal(fit_projection(embeddings, "random", 64), fit_projection(embeddings[:2], "random", 64))
+
+def test_no_projection():
+    embeddings = make_repo_embeddings()
+    assert fit_projection(embeddings, "none", 32) is None
+    assert project_embeddings(embeddings[0], None) is embeddings[0]
+    with pytest.raises(ValueError):
+        fit_projection(embeddings, "svd", 32)
+
+def test_projection_round_trip_and_empty_files():
+    projection = fit_projection(make_repo_embeddings(), "pca", 32)
+
+    assert np.array_equal(unpack_projection(pack_projection(projection, "pca")), projection)
+    assert unpack_projection(pack_projection(None)) is None
+    assert project_embeddings(np.empty((0, 768), dtype=np.float32), projection).shape == (0, 32)
+    assert project_embeddings(None, projection) is None
@@ -0,0 +1,67 @@
+import threading
+import torch
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from experimental_unixcoder.encoder_backends import ExportedBackend
+
+
+class TinyEncoder(torch.nn.Module):
+    def __init__(self):
+        super().__init__()
+        self.config = SimpleNamespace(pad_token_id=1)
+        self.embeddings = torch.nn.Embedding(8, 4)
+
+    def forward(self, source_ids):
+        token_embeddings = self.embeddings(source_ids)
+        return token_embeddings, token_embeddings.mean(1)
+
+
+def test_other_fingerprint_exports_graph_again(tmp_path):
+    model = TinyEncoder()
+    token_batch = [[0, 2, 3], [0, 4]]
+
+    def encode(fingerprint):
+        backend = ExportedBackend(model, torch.device("cpu"), batch_size=2, export_dir=str(tmp_path),
+                                  fingerprint=fingerprint)
+        return backend.encode_ids(token_batch)
+
+    with patch("torch.export.export", wraps=torch.export.export) as mock_export:
+        expected = encode("unixcoder|fp32")
+        assert torch.allclose(encode("unixcoder|fp32"), expected)
+        assert mock_export.call_count == 1
+
+        encode("unixcoder|int8")
+        assert mock_export.call_count == 2
+    assert len(list(tmp_path.glob("*.pt2"))) == 2
+
+
+def test_changed_weights_export_graph_again(tmp_path):
+    model = TinyEncoder()
+    backend = ExportedBackend(model, torch.device("cpu"), batch_size=2, export_dir=str(tmp_path))
+    backend.graph(64)
+
+    with torch.no_grad():
+        model.embeddings.weight.add_(1)
+    with patch("torch.export.export", wraps=torch.export.export) as mock_export:
+        ExportedBackend(model, torch.device("cpu"), batch_size=2, export_dir=str(tmp_path)).graph(64)
+    assert mock_export.call_count == 1
+    assert len(list(tmp_path.glob("*.pt2"))) == 2
+
+
+def test_concurrent_encodes_export_graph_once(tmp_path):
+    backend = ExportedBackend(TinyEncoder(), torch.device("cpu"), batch_size=2, export_dir=str(tmp_path))
+    barrier = threading.Barrier(4)
+
+    def encode():
+        barrier.wait()
+        backend.encode_ids([[0, 2, 3]])
+
+    with patch("torch.export.export", wraps=torch.export.export) as mock_export:
+        threads = [threading.Thread(target=encode) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    assert mock_export.call_count == 1
+    assert [path.name.endswith(".pt2") for path in tmp_path.iterdir()] == [True]
@@ -0,0 +1,37 @@
+import multiprocessing
+from unittest.mock import patch
+
+from utils.encoder_pool import map_in_pool, threads_per_worker
+
+def test_map_in_pool_in_process():
+    with patch("utils.encoder_pool.multiprocessing.get_context") as mock_get_context:
+        result = list(map_in_pool(abs, [-3, 1, -2], workers=1))
+
+    assert result == [3, 1, 2]
+    mock_get_context.assert_not_called()
+
+def test_map_in_pool_preserves_task_order():
+    tasks = [-i for i in range(20)]
+    result = list(map_in_pool(abs, tasks, workers=2, threads=1))
+    assert result == list(range(20))
+
+def test_map_in_pool_stops_workers_when_abandoned():
+    results = map_in_pool(abs, [-i for i in range(20)], workers=2, threads=1)
+    assert next(results) == 0
+    assert multiprocessing.active_children()
+
+    results.close()
+    assert not multiprocessing.active_children()
+
+def test_map_in_pool_falls_back_when_pool_fails():
+    with patch("utils.encoder_pool.multiprocessing.get_context") as mock_get_context:
+        mock_get_context.return_value.Pool.side_effect = OSError("no processes")
+        result = list(map_in_pool(abs, [-1, -2], workers=4))
+
+    assert result == [1, 2]
+
+def test_threads_per_worker():
+    assert threads_per_worker(4, threads=3) == 3
+    with patch("utils.encoder_pool.os.cpu_count", return_value=32):
+        assert threads_per_worker(4, threads=0) == 8
+        assert threads_per_worker(64, threads=0) == 1
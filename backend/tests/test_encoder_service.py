@@ -0,0 +1,80 @@
+import threading
+import numpy as np
+import pytest
+from unittest.mock import MagicMock
+
+from experimental_unixcoder.encoder_service import EncoderService
+
+class FakeBugLocalizer:
+    """Encodes each text as a single chunk holding its length, recording every batch."""
+    def __init__(self):
+        self.batches = []
+
+    def encode_texts(self, texts):
+        self.batches.append(list(texts))
+        return [np.full((1, 4), len(text), dtype=np.float32) for text in texts]
+
+def test_encoder_service_batches_concurrent_requests():
+    bug_localizer = FakeBugLocalizer()
+    service = EncoderService(bug_localizer, window_ms=200, max_texts=8)
+
+    results = {}
+    barrier = threading.Barrier(8)
+    def encode(text):
+        barrier.wait()
+        results[text] = service.encode_text(text)
+
+    texts = ["x" * i for i in range(1, 9)]
+    threads = [threading.Thread(target=encode, args=(text,)) for text in texts]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Every caller receives the embeddings of its own text
+    assert all(results[text][0, 0] == len(text) for text in texts)
+    # The concurrent requests share forward passes
+    assert len(bug_localizer.batches) < len(texts)
+    assert service.texts == len(texts)
+
+def test_encoder_service_limits_batch_size():
+    bug_localizer = FakeBugLocalizer()
+    service = EncoderService(bug_localizer, window_ms=200, max_texts=2)
+
+    futures = [service.submit(str(i)) for i in range(5)]
+    assert [future.result()[0, 0] for future in futures] == [1] * 5
+    assert all(len(batch) <= 2 for batch in bug_localizer.batches)
+
+def test_encoder_service_without_window_encodes_in_caller():
+    bug_localizer = FakeBugLocalizer()
+    service = EncoderService(bug_localizer, window_ms=0)
+
+    assert service.encode_text("abc")[0, 0] == 3
+    assert bug_localizer.batches == [["abc"]]
+
+def test_encoder_service_propagates_errors():
+    bug_localizer = MagicMock()
+    bug_localizer.encode_texts.side_effect = RuntimeError("out of memory")
+    service = EncoderService(bug_localizer, window_ms=1)
+
+    with pytest.raises(RuntimeError, match="out of memory"):
+        service.encode_text("text")
+
+def test_encoder_service_survives_failed_batches():
+    class FailingBugLocalizer(FakeBugLocalizer):
+        def encode_texts(self, texts):
+            self.batches.append(list(texts))
+            if len(self.batches) == 1:
+                raise RuntimeError("out of memory")
+            if len(self.batches) == 2:
+                return None  # Fails while splitting the results back to the callers
+            return super().encode_texts(texts)
+
+    service = EncoderService(FailingBugLocalizer(), window_ms=1)
+
+    with pytest.raises(RuntimeError, match="out of memory"):
+        service.submit("first").result(timeout=5)
+    with pytest.raises(TypeError):
+        service.submit("second").result(timeout=5)
+    # The worker thread keeps answering after failed batches
+    assert service.submit("third").result(timeout=5)[0, 0] == 5
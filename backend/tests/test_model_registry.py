@@ -0,0 +1,65 @@
+import threading
+import torch
+import pytest
+from unittest.mock import MagicMock, patch
+
+import experimental_unixcoder.model_registry as model_registry
+
+@pytest.fixture
+def fresh_registry(monkeypatch):
+    """Resets the shared model so each test starts from an unloaded registry."""
+    monkeypatch.setattr(model_registry, "_bug_localizers", {})
+    monkeypatch.setattr(model_registry, "_load_stats", {})
+    monkeypatch.setattr(model_registry, "_encoder_services", {})
+
+def test_get_bug_localizer_loads_once_across_threads(fresh_registry):
+    mock_localizer = MagicMock()
+    mock_localizer.model = torch.nn.Linear(4, 4)
+    mock_localizer.device = torch.device("cpu")
+
+    with patch.object(model_registry, "BugLocalization", return_value=mock_localizer) as mock_class:
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(model_registry.get_bug_localizer()))
+                   for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    mock_class.assert_called_once()
+    assert all(result is mock_localizer for result in results)
+
+def test_get_load_stats(fresh_registry):
+    assert model_registry.get_load_stats() == {}
+
+    mock_localizer = MagicMock()
+    mock_localizer.model = torch.nn.Linear(4, 4)
+    mock_localizer.device = torch.device("cpu")
+    with patch.object(model_registry, "BugLocalization", return_value=mock_localizer):
+        model_registry.get_bug_localizer()
+
+    stats = model_registry.get_load_stats()
+    assert stats['load_seconds'] >= 0
+    assert stats['model_mb'] == pytest.approx((16 + 4) * 4 / (1024 * 1024))
+    assert stats['device'] == "cpu"
+
+def test_get_bug_localizer_per_inference_mode(fresh_registry):
+    with patch.object(model_registry, "BugLocalization", side_effect=lambda **kwargs: MagicMock(
+            model=torch.nn.Linear(4, 4), device=torch.device("cpu"), **kwargs)) as mock_class:
+        fp32_localizer = model_registry.get_bug_localizer("fp32")
+        int8_localizer = model_registry.get_bug_localizer("int8")
+
+        assert model_registry.get_bug_localizer("fp32") is fp32_localizer
+        assert model_registry.get_bug_localizer("int8") is int8_localizer
+
+    assert fp32_localizer is not int8_localizer
+    assert mock_class.call_count == 2
+    assert model_registry.get_load_stats("int8")['device'] == "cpu"
+
+def test_get_encoder_service_wraps_shared_localizer(fresh_registry):
+    mock_localizer = MagicMock(model=torch.nn.Linear(4, 4), device=torch.device("cpu"))
+    with patch.object(model_registry, "BugLocalization", return_value=mock_localizer):
+        encoder_service = model_registry.get_encoder_service()
+
+        assert model_registry.get_encoder_service() is encoder_service
+        assert encoder_service.bug_localizer is model_registry.get_bug_localizer()
@@ -0,0 +1,62 @@
+import os
+import pytest
+import torch
+from transformers import RobertaConfig, RobertaModel
+
+from experimental_unixcoder.model_store import SNAPSHOT_FILES, check_snapshot, load_roberta, prefetch_model, \
+    snapshot_path
+
+MODEL_NAME = "test/tiny-roberta"
+
+def make_snapshot(model_dir):
+    # A tiny random RoBERTa stands in for UniXcoder; the tokenizer files only need to exist
+    config = RobertaConfig(vocab_size=64, hidden_size=16, num_hidden_layers=2, num_attention_heads=2,
+                           intermediate_size=32, max_position_embeddings=40, pad_token_id=1)
+    torch.manual_seed(0)
+    model = RobertaModel(config, add_pooling_layer=False).eval()
+    path = snapshot_path(MODEL_NAME, str(model_dir))
+    model.save_pretrained(path, safe_serialization=True)
+    for file in ["vocab.json", "merges.txt", "tokenizer.json"]:
+        open(os.path.join(path, file), "w").close()
+    return path, config, model
+
+def test_snapshot_path_only_with_model_dir(tmp_path):
+    assert snapshot_path(MODEL_NAME, "") is None
+    assert snapshot_path(MODEL_NAME, str(tmp_path)) == os.path.join(str(tmp_path), "test--tiny-roberta")
+
+def test_check_snapshot_names_missing_files(tmp_path):
+    with pytest.raises(FileNotFoundError, match="model.safetensors"):
+        check_snapshot(str(tmp_path))
+
+    path, _, _ = make_snapshot(tmp_path)
+    check_snapshot(path)
+    assert all(os.path.isfile(os.path.join(path, file)) for file in SNAPSHOT_FILES)
+
+def test_load_roberta_memory_maps_snapshot(tmp_path):
+    path, config, expected_model = make_snapshot(tmp_path)
+    model = load_roberta(MODEL_NAME, config, str(tmp_path))
+
+    # Every parameter is a view into the single mapping of the safetensors file
+    file_size = os.path.getsize(os.path.join(path, "model.safetensors"))
+    assert all(param.untyped_storage().nbytes() == file_size for param in model.parameters())
+    assert not model.training
+
+    source_ids = torch.tensor([[0, 5, 6, 7, 2, 1, 1]])
+    mask = source_ids.ne(1).unsqueeze(1)
+    with torch.no_grad():
+        assert torch.equal(model(source_ids, attention_mask=mask)[0],
+                           expected_model(source_ids, attention_mask=mask)[0])
+
+def test_load_roberta_fails_fast_without_snapshot(tmp_path):
+    config = RobertaConfig(vocab_size=64, hidden_size=16, num_hidden_layers=1, num_attention_heads=2)
+    with pytest.raises(FileNotFoundError, match="prefetch_model.py"):
+        load_roberta(MODEL_NAME, config, str(tmp_path))
+
+def test_prefetch_model_requires_model_dir():
+    with pytest.raises(ValueError):
+        prefetch_model(MODEL_NAME, "")
+
+def test_prefetch_model_keeps_complete_snapshot(tmp_path):
+    path, _, _ = make_snapshot(tmp_path)
+    # A complete snapshot is returned as is, without contacting the hub
+    assert prefetch_model(MODEL_NAME, str(tmp_path)) == path
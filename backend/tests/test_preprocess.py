@@ -1,5 +1,8 @@
 import pytest
-from utils.preprocess import Preprocessor
+from unittest.mock import patch
+import utils.preprocess as preprocess
+from build_lemma_table import build_lemma_table, count_tokens
+from utils.preprocess import Preprocessor, load_lemma_table, load_stop_words, unseen_spans
 from nltk.corpus import wordnet as wn
 
 def test_camel_case_split():
@@ -46,3 +49,79 @@ def test_lemmatize_tokens():
     tokens = ["running", "dogs", "beautifully", "was"]
     lemmatized = Preprocessor.lemmatize_tokens(tokens)
     assert lemmatized == ["run", "dog", "beautifully", "be"]
+
+
+def test_lemmatize_tokens_tags_each_document_once():
+    # The document is tagged in one pos_tag call and repeated (token, tag) pairs are lemmatized once
+    preprocess.lemmatize.cache_clear()
+    tokens = ["running", "jumping", "running"]
+    with patch.object(preprocess, "load_lemma_table", return_value={}), \
+            patch.object(preprocess, "pos_tag_sents",
+                         side_effect=lambda spans: [[(token, "VBG") for token in span] for span in spans]) as mock_tag, \
+            patch.object(preprocess.lemmatizer, "lemmatize", side_effect=lambda token, tag: token[:-3]) as mock_lemmatize:
+        assert Preprocessor.lemmatize_tokens(tokens) == ["runn", "jump", "runn"]
+        assert Preprocessor.lemmatize_tokens([]) == []
+
+    mock_tag.assert_called_once_with([tokens])
+    assert mock_lemmatize.call_count == 2
+    preprocess.lemmatize.cache_clear()
+
+
+def test_load_stop_words_once(tmp_path):
+    stop_words_path = tmp_path / "stop_words.txt"
+    stop_words_path.write_text("public\nstatic\n")
+
+    assert load_stop_words(stop_words_path) == {"public", "static"}
+    stop_words_path.write_text("changed\n")
+    assert load_stop_words(stop_words_path) == {"public", "static"}
+    with pytest.raises(FileNotFoundError):
+        load_stop_words(tmp_path / "missing.txt")
+
+
+def test_lemma_table_skips_nltk_for_known_tokens():
+    # Unseen tokens are lemmatized by NLTK with the tags of their context, and the lookups are counted
+    preprocess.lemma_table_stats.update(hits=0, misses=0)
+    tokens = ["view", "dogs", "buttons", "view", "view", "view", "buttons", "cats"]
+    with patch.object(preprocess, "load_lemma_table", return_value={"view": "view", "buttons": "button"}), \
+            patch.object(preprocess, "pos_tag_sents",
+                         side_effect=lambda spans: [[(token, "NNS") for token in span] for span in spans]) as mock_tag, \
+            patch.object(preprocess, "lemmatize", side_effect=lambda token, tag: token.rstrip("s")):
+        assert Preprocessor.lemmatize_tokens(tokens) == \
+            ["view", "dog", "button", "view", "view", "view", "button", "cat"]
+        assert Preprocessor.lemmatize_tokens(["view", "buttons"]) == ["view", "button"]
+        assert preprocess.get_lemma_table_stats()["hit_rate"] == 8 / 10
+
+    mock_tag.assert_called_once_with([["view", "dogs", "buttons", "view"], ["view", "buttons", "cats"]])
+    preprocess.lemma_table_stats.update(hits=0, misses=0)
+
+
+def test_load_lemma_table(tmp_path):
+    lemma_table_path = tmp_path / "lemmas.tsv"
+    lemma_table_path.write_text("# token\tlemma\nbuttons\tbutton\n\nview\tview\n")
+
+    assert load_lemma_table(lemma_table_path) == {"buttons": "button", "view": "view"}
+    assert load_lemma_table(tmp_path / "missing.tsv") == {}
+
+
+def test_unseen_spans():
+    lemmas = ["a", None, "b", "c", "d", "e", None, None, "f"]
+    assert unseen_spans(lemmas, 1) == [(0, 3), (5, 9)]
+    assert unseen_spans(lemmas, 2) == [(0, 9)]
+    assert unseen_spans(lemmas, 0) == [(1, 2), (6, 8)]
+    assert unseen_spans(lemmas, -1) == [(0, 9)]
+    assert unseen_spans(["a", "b"], 2) == []
+
+
+def test_build_lemma_table_keeps_tokens_with_one_lemma():
+    tags = {"get": "VB", "buttons": "NNS", "button": "NN", "views": "NNS"}
+    with patch("build_lemma_table.pos_tag", side_effect=lambda tokens: [(token, tags[token]) for token in tokens]):
+        counts = count_tokens(["public void getButtons() { buttonViews = views; }", "views buttons"], {"public", "void"})
+    assert counts == {("get", "v"): 1, ("buttons", "n"): 2, ("button", "n"): 1, ("views", "n"): 3}
+
+    # views was also tagged as a verb once, under which it keeps its form
+    counts[("views", "v")] = 1
+    lemmas = {("buttons", "n"): "button", ("views", "n"): "view"}
+    with patch("build_lemma_table.lemmatize", side_effect=lambda token, tag: lemmas.get((token, tag), token)):
+        assert build_lemma_table(counts, min_count=1, max_entries=10) == {"buttons": "button", "get": "get", "button": "button"}
+        assert build_lemma_table(counts, min_count=2, max_entries=10) == {"buttons": "button"}
+        assert len(build_lemma_table(counts, min_count=1, max_entries=2)) == 2
@@ -1,8 +1,9 @@
 import pytest
 import torch
 import torch.nn.functional as F
+from pathlib import Path
+from utils.preprocess import Preprocessor
 from utils.preprocess_bug_report import preprocess_bug_report
-from tests.constants import EXPECTED_BUG_REPORT_EMBEDDING
 
 
 # Sample bug report content for testing
@@ -64,20 +65,23 @@ def test_preprocess_bug_report(setup_bug_report_file):
     bug_report_path = setup_bug_report_file
     result = preprocess_bug_report(bug_report_path, [])
 
-    result_tensor = torch.tensor(result)
-    expected_tensor = torch.tensor(EXPECTED_BUG_REPORT_EMBEDDING)
+    # The preprocessed report fits in a single 512-token window
+    assert len(result) == 1, "Expected the bug report to be encoded as a single window"
 
-    # Convert query embeddings and file embeddings from lists back to tensors
-    for result_embedding, expected_embedding in zip(result, EXPECTED_BUG_REPORT_EMBEDDING):
-        result_tensor = torch.tensor(result_embedding)
-        expected_tensor = torch.tensor(expected_embedding)
+    # The window embedding matches encoding the whole preprocessed report at once
+    preprocessor = Preprocessor()
+    stop_words_path = Path(__file__).parent / "../data/stop_words/java-keywords-bugs.txt"
+    preprocessed_text = preprocessor.normalize_text(sample_bug_report_content, stop_words_path, verbose=False)
+    bug_localizer = preprocessor.bug_localizer
+    tokens_ids = bug_localizer.model.tokenize([preprocessed_text], max_length=512, mode="<encoder-only>")
+    with torch.no_grad():
+        _, expected_embedding = bug_localizer.model(torch.tensor(tokens_ids).to(bug_localizer.device))
 
-        # Compute similarity
-        similarity = torch.nn.functional.cosine_similarity(
-            result_tensor, expected_tensor, dim=1
-        ).item()
-        
-        assert similarity > 0.995, f"Cosine similarity is too low: {similarity}"
+    similarity = torch.nn.functional.cosine_similarity(
+        torch.from_numpy(result), expected_embedding.cpu(), dim=1
+    ).item()
+
+    assert similarity > 0.995, f"Cosine similarity is too low: {similarity}"
 
 def test_bug_report_file_not_found(tmp_path):
     # Provide a nonexistent path for bug report file
@@ -0,0 +1,95 @@
+import numpy as np
+import pytest
+import torch
+from unittest.mock import patch
+
+import experimental_unixcoder.ranking as ranking
+from experimental_unixcoder.embedding_codec import pack_embeddings, to_embedding_matrix
+from experimental_unixcoder.ranking import RankingMatrix
+
+rng = np.random.default_rng(0)
+QUERY = rng.standard_normal((3, 768)).astype(np.float32)
+DB_EMBEDDINGS = [(f"File{i}.java", rng.standard_normal((i % 4 + 1, 768)).astype(np.float32)) for i in range(40)]
+
+def loop_ranking(query_embeddings, db_embeddings, precision):
+    # The per-file ranking the stacked matrix replaces
+    query_matrix = torch.nn.functional.normalize(to_embedding_matrix(query_embeddings, precision), dim=1)
+    similarities = []
+    for file_id, file_embeddings in db_embeddings:
+        file_matrix = to_embedding_matrix(file_embeddings, precision)
+        score = float('-inf')
+        if query_matrix.numel() and file_matrix.numel():
+            score = (query_matrix @ torch.nn.functional.normalize(file_matrix, dim=1).T).max().float().item()
+        similarities.append((file_id, score))
+    return sorted(similarities, key=lambda x: x[1], reverse=True)
+
+@pytest.mark.parametrize("precision, tolerance", [("fp32", 1e-6), ("fp16", 1e-4), ("bf16", 1e-4)])
+def test_rank_matches_per_file_loop(precision, tolerance):
+    db_embeddings = [(file_id, pack_embeddings(embeddings, precision)) for file_id, embeddings in DB_EMBEDDINGS]
+    expected = loop_ranking(QUERY, db_embeddings, precision)
+    result = RankingMatrix.from_embeddings(db_embeddings, precision).rank(QUERY)
+
+    assert [file_id for file_id, _ in result] == [file_id for file_id, _ in expected]
+    assert np.allclose([score for _, score in result], [score for _, score in expected], atol=tolerance)
+
+def test_rank_top_k_is_prefix_of_full_ranking():
+    ranking_matrix = RankingMatrix.from_embeddings(DB_EMBEDDINGS, "fp32")
+
+    assert ranking_matrix.rank(QUERY, top_k=10) == ranking_matrix.rank(QUERY)[:10]
+    assert ranking_matrix.rank(QUERY, top_k=100) == ranking_matrix.rank(QUERY)
+
+def test_rank_ties_keep_file_order():
+    embeddings = DB_EMBEDDINGS[0][1]
+    ranking = RankingMatrix.from_embeddings([("B.java", embeddings), ("A.java", embeddings)], "fp32").rank(QUERY)
+
+    assert [file_id for file_id, _ in ranking] == ["B.java", "A.java"]
+
+def test_files_without_embeddings_rank_last():
+    db_embeddings = [("Empty.java", None), ("Blank.java", np.empty((0, 768), dtype=np.float32))] + DB_EMBEDDINGS[:2]
+    ranking = RankingMatrix.from_embeddings(db_embeddings, "fp32").rank(QUERY)
+
+    assert [file_id for file_id, _ in ranking[-2:]] == ["Empty.java", "Blank.java"]
+    assert all(score == float('-inf') for _, score in ranking[-2:])
+    assert all(score == float('-inf') for _, score in RankingMatrix.from_embeddings([("Empty.java", None)]).rank(QUERY))
+
+def test_subset_ranks_like_the_corpus_alone():
+    corpus = ["File3.java", "File7.java", "File12.java", "Missing.java"]
+    ranking_matrix = RankingMatrix.from_embeddings(DB_EMBEDDINGS, "fp32")
+    corpus_embeddings = [(file_id, embeddings) for file_id, embeddings in DB_EMBEDDINGS if file_id in corpus]
+
+    subset = ranking_matrix.subset(corpus)
+
+    assert subset.file_ids == ["File3.java", "File7.java", "File12.java"]
+    assert subset.rank(QUERY) == RankingMatrix.from_embeddings(corpus_embeddings, "fp32").rank(QUERY)
+
+def test_rank_many_matches_rank():
+    queries = [rng.standard_normal((i % 4 + 1, 768)).astype(np.float32) for i in range(7)]
+    queries.append(np.empty((0, 768), dtype=np.float32))
+    ranking_matrix = RankingMatrix.from_embeddings(DB_EMBEDDINGS + [("Empty.java", np.empty((0, 768)))], "fp32")
+
+    with patch.object(ranking, "QUERY_BLOCK_CHUNKS", 5):
+        rankings = ranking_matrix.rank_many(queries, top_k=4)
+
+    assert len(rankings) == len(queries)
+    for query, ranked in zip(queries, rankings):
+        expected = ranking_matrix.rank(query, top_k=4)
+        assert [file_id for file_id, _ in ranked] == [file_id for file_id, _ in expected]
+        np.testing.assert_allclose([score for _, score in ranked], [score for _, score in expected], rtol=1e-5)
+
+def test_patch_matches_rebuilt_matrix():
+    changed = [("File3.java", rng.standard_normal((2, 768)).astype(np.float32)),
+               ("File9.java", None),
+               ("New.java", rng.standard_normal((3, 768)).astype(np.float32))]
+    removed = ["File5.java", "File20.java"]
+    rebuilt = dict(DB_EMBEDDINGS)
+    rebuilt.update(changed)
+    for file_id in removed:
+        del rebuilt[file_id]
+
+    patched = RankingMatrix.from_embeddings(DB_EMBEDDINGS, "fp32").patch(changed, removed)
+    expected = RankingMatrix.from_embeddings(list(rebuilt.items()), "fp32")
+
+    assert patched.file_ids == expected.file_ids
+    assert torch.equal(patched.file_index, expected.file_index)
+    assert torch.allclose(patched.matrix, expected.matrix)
+    assert patched.rank(QUERY) == expected.rank(QUERY)
@@ -0,0 +1,67 @@
+import numpy as np
+
+from experimental_unixcoder.ranking import RankingMatrix
+from experimental_unixcoder.ranking_cache import RankingCache
+
+def make_matrix(chunks=1):
+    # One 768-dim fp32 chunk takes 3 KB plus 8 bytes of row to file mapping
+    return RankingMatrix.from_embeddings([("File.java", np.ones((chunks, 768), dtype=np.float32))], "fp32")
+
+def key(repo_name, commit_sha="sha1"):
+    return ("owner", repo_name, commit_sha, "fp32")
+
+def test_ranking_cache_hit_and_miss():
+    cache = RankingCache(1)
+    ranking_matrix = make_matrix()
+
+    assert cache.get(key("repo")) is None
+    cache.put(key("repo"), ranking_matrix)
+
+    assert cache.get(key("repo")) is ranking_matrix
+    assert cache.get(key("repo", "sha2")) is None
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 2
+
+def test_ranking_cache_evicts_least_recently_used():
+    # 0.01 MB holds three single-chunk matrices
+    cache = RankingCache(0.01)
+    for repo_name in ["a", "b", "c"]:
+        cache.put(key(repo_name), make_matrix())
+    cache.get(key("a"))
+    cache.put(key("d"), make_matrix())
+
+    assert cache.get(key("b")) is None
+    assert all(cache.get(key(repo_name)) is not None for repo_name in ["a", "c", "d"])
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["entries"] == 3
+
+def test_ranking_cache_skips_matrices_over_the_cap():
+    cache = RankingCache(0.01)
+    cache.put(key("big"), make_matrix(chunks=10))
+
+    assert cache.get(key("big")) is None
+    assert cache.stats()["size_mb"] == 0
+
+def test_ranking_cache_invalidates_every_commit_of_a_repo():
+    cache = RankingCache(1)
+    cache.put(key("repo", "sha1"), make_matrix())
+    cache.put(key("repo", "sha2"), make_matrix())
+    cache.put(key("other"), make_matrix())
+
+    cache.invalidate("owner", "repo")
+
+    assert cache.get(key("repo", "sha1")) is None and cache.get(key("repo", "sha2")) is None
+    assert cache.get(key("other")) is not None
+    assert cache.stats()["entries"] == 1
+
+def test_ranking_cache_advances_a_repo_to_a_new_commit():
+    cache = RankingCache(1)
+    cache.put(key("repo", "sha1"), make_matrix())
+    cache.put(("owner", "repo", "sha1", "fp16"), make_matrix())
+    cache.put(key("other"), make_matrix())
+    patched = make_matrix()
+
+    cache.advance(key("repo", "sha2"), patched)
+
+    assert cache.get(key("repo", "sha2")) is patched
+    assert cache.get(key("repo", "sha1")) is None and cache.get(("owner", "repo", "sha1", "fp16")) is None
+    assert cache.stats()["entries"] == 2
@@ -0,0 +1,109 @@
+import os
+import numpy as np
+
+from experimental_unixcoder.ann_index import assign_lists, fit_ann_index
+from experimental_unixcoder.ranking import RankingMatrix
+from experimental_unixcoder.ranking_snapshot import (
+    load_ranking_snapshot,
+    ranking_snapshot_path,
+    save_ranking_snapshot
+)
+
+
+def make_files(n_files=20, dim=16, seed=0):
+    rng = np.random.default_rng(seed)
+    files = [(f"src/File{i}.java", rng.normal(size=(1 + i % 4, dim)).astype(np.float32)) for i in range(n_files)]
+    files.append(("src/Empty.java", np.empty((0, dim), dtype=np.float32)))
+    return files
+
+
+def test_snapshot_path_disabled_without_dir():
+    assert ranking_snapshot_path("owner", "repo", "abc", "") is None
+    assert ranking_snapshot_path("owner", "repo", "abc", "snapshots") == os.path.join("snapshots", "owner", "repo", "abc")
+
+
+def test_snapshot_round_trip_ranks_identically(tmp_path):
+    files = make_files()
+    ranking_matrix = RankingMatrix.from_embeddings(files, "fp16")
+    path = ranking_snapshot_path("owner", "repo", "abc", str(tmp_path))
+
+    save_ranking_snapshot(ranking_matrix, path, "abc")
+    loaded = load_ranking_snapshot(path, "fp16")
+
+    assert loaded.file_ids == ranking_matrix.file_ids
+    assert loaded.matrix.dtype == ranking_matrix.matrix.dtype
+    assert loaded.index is None
+    query = files[2][1]
+    assert loaded.rank(query) == ranking_matrix.rank(query)
+    assert loaded.subset(["src/File1.java", "src/File3.java"]).rank(query) == \
+        ranking_matrix.subset(["src/File1.java", "src/File3.java"]).rank(query)
+
+
+def test_snapshot_keeps_ann_index(tmp_path):
+    files = make_files()
+    centroids = fit_ann_index([e for _, e in files], method="ivf", min_chunks=0)
+    ranking_matrix = RankingMatrix.from_embeddings(files, "fp32", centroids=centroids,
+                                                   ann_lists=[assign_lists(e, centroids) for _, e in files])
+    path = ranking_snapshot_path("owner", "repo", "abc", str(tmp_path))
+
+    save_ranking_snapshot(ranking_matrix, path, "abc")
+    loaded = load_ranking_snapshot(path, "fp32")
+
+    assert loaded.index is not None
+    assert loaded.index.row_lists.tolist() == ranking_matrix.index.row_lists.tolist()
+    assert loaded.rank(files[5][1]) == ranking_matrix.rank(files[5][1])
+
+
+def test_missing_or_other_precision_snapshot_is_not_loaded(tmp_path):
+    path = ranking_snapshot_path("owner", "repo", "abc", str(tmp_path))
+    assert load_ranking_snapshot(path, "fp32") is None
+    assert load_ranking_snapshot(None, "fp32") is None
+
+    save_ranking_snapshot(RankingMatrix.from_embeddings(make_files(), "fp32"), path, "abc")
+
+    assert load_ranking_snapshot(path, "fp16") is None
+
+
+def test_snapshot_of_other_generation_is_not_loaded(tmp_path):
+    # A repository initialized again at the same commit must not be ranked with the old snapshot
+    path = ranking_snapshot_path("owner", "repo", "abc", str(tmp_path))
+    save_ranking_snapshot(RankingMatrix.from_embeddings(make_files(), "fp32"), path, "abc", "2026-01-01T00:00:00Z")
+
+    assert load_ranking_snapshot(path, "fp32", "2026-02-01T00:00:00Z") is None
+    assert load_ranking_snapshot(path, "fp32", "2026-01-01T00:00:00Z") is not None
+
+
+def test_new_snapshot_replaces_older_commits(tmp_path):
+    ranking_matrix = RankingMatrix.from_embeddings(make_files(), "fp32")
+    old_path = ranking_snapshot_path("owner", "repo", "abc", str(tmp_path))
+    new_path = ranking_snapshot_path("owner", "repo", "def", str(tmp_path))
+
+    save_ranking_snapshot(ranking_matrix, old_path, "abc")
+    save_ranking_snapshot(ranking_matrix, new_path, "def")
+
+    assert os.listdir(os.path.dirname(new_path)) == ["def"]
+    assert load_ranking_snapshot(old_path, "fp32") is None
+    assert load_ranking_snapshot(new_path, "fp32") is not None
+
+
+def test_snapshot_at_same_commit_is_replaced(tmp_path):
+    path = ranking_snapshot_path("owner", "repo", "abc", str(tmp_path))
+    save_ranking_snapshot(RankingMatrix.from_embeddings(make_files(n_files=2, dim=8), "fp32"), path, "abc")
+
+    files = make_files(n_files=5, dim=16, seed=1)
+    save_ranking_snapshot(RankingMatrix.from_embeddings(files, "fp32"), path, "abc")
+    loaded = load_ranking_snapshot(path, "fp32")
+
+    assert loaded.file_ids == [route for route, _ in files]
+    assert loaded.matrix.shape[1] == 16
+    assert os.listdir(os.path.dirname(path)) == ["abc"]
+
+
+def test_new_snapshot_keeps_other_workers_staging_directories(tmp_path):
+    path = ranking_snapshot_path("owner", "repo", "abc", str(tmp_path))
+    os.makedirs(f"{path}.partial-1")
+    os.makedirs(f"{path}.stale-2")
+
+    save_ranking_snapshot(RankingMatrix.from_embeddings(make_files(), "fp32"), path, "abc")
+
+    assert sorted(os.listdir(os.path.dirname(path))) == ["abc", "abc.partial-1", "abc.stale-2"]
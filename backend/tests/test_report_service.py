@@ -6,6 +6,12 @@ from unittest.mock import MagicMock, patch
 from stat import S_IWUSR, S_IREAD
 from werkzeug.exceptions import HTTPException
 
+import numpy as np
+from flask import Flask, jsonify
+
+import services.report_service as report_service
+from experimental_unixcoder.ranking import RankingMatrix
+from experimental_unixcoder.result_cache import ResultCache
 from services.report_service import reorder_rankings
 from utils.file_utils import change_repository_file_permissions, post_process_cleanup, write_file_for_report_processing
 from utils.git_utils import create_changed_files_dict, extract_and_validate_repo_info, extract_files
@@ -339,4 +345,167 @@ def test_extract_and_validate_repo_info_empty_data():
         
         # Extract the raised exception to verify details
         assert exc_info.value.code == 400
-        assert exc_info.value.description == "Missing required repository information: repo_url, owner, repo_name, default_branch, latest_commit_sha"
\ No newline at end of file
+        assert exc_info.value.description == "Missing required repository information: repo_url, owner, repo_name, default_branch, latest_commit_sha"
+
+def test_process_report_batch_ranks_every_report():
+    rng = np.random.default_rng(0)
+    db_embeddings = [(f"repos/o/r/File{i}.java", rng.standard_normal((2, 16)).astype(np.float32)) for i in range(8)]
+    repo_matrix = RankingMatrix.from_embeddings(db_embeddings, "fp32")
+    queries = [db_embeddings[3][1][:1], db_embeddings[5][1][:1]]
+    data = {
+        'repository': {'repo_url': 'https://github.com/o/r.git', 'owner': 'o', 'repo_name': 'r',
+                       'default_branch': 'main', 'latest_commit_sha': 'abc123'},
+        'reports': [{'id': 1, 'issue': 'first'}, {'id': 2, 'issue': 'second', 'trace': 'trace'}],
+        'top_k': 3
+    }
+    corpus = ["repos/o/r/File5.java", "repos/o/r/File6.java"]
+
+    with Flask(__name__).app_context(), \
+            patch.object(report_service, "ProbotMessenger"), \
+            patch.object(report_service, "extract_sc_terms", side_effect=lambda trace: ["sc"] if trace else []), \
+            patch.object(report_service, "extract_gs_terms", side_effect=lambda trace: ["gs"] if trace else []), \
+            patch.object(report_service, "preprocess_bug_reports",
+                         return_value=(["first", "second"], queries)) as mock_preprocess, \
+            patch.object(report_service, "update_outdated_embeddings", return_value=None), \
+            patch.object(report_service, "fetch_repo_projection", return_value=None), \
+            patch.object(report_service, "retrieve_repo_file_contents", return_value=[]), \
+            patch.object(report_service, "build_corpus", return_value=corpus), \
+            patch.object(report_service, "get_boosted_files", return_value=["repos/o/r/File6.java"]), \
+            patch.object(report_service, "fetch_ranking_matrix", return_value=repo_matrix), \
+            patch.object(report_service, "get_bug_localizer") as mock_localizer:
+        mock_localizer.return_value.rank_files_many.side_effect = \
+            lambda queries, matrix, top_k=None, query_terms=None: matrix.rank_many(queries, top_k, query_terms)
+        response, status = report_service.process_report_batch(data)
+
+    results = response.get_json()["results"]
+    assert status == 200
+    mock_preprocess.assert_called_once_with(["first", "second"], [[], ["sc"]], verbose=False, return_normalized=True)
+    assert [result["id"] for result in results] == [1, 2]
+    assert [result["gui_data"] for result in results] == [False, True]
+    assert len(results[0]["ranked_files"]) == 3
+    assert results[0]["ranked_files"][0][0] == "repos/o/r/File3.java"
+    assert [item[0] for item in results[1]["ranked_files"]] == ["repos/o/r/File6.java", "repos/o/r/File5.java"]
+
+def test_process_report_batch_missing_reports():
+    with pytest.raises(HTTPException) as exc_info:
+        report_service.process_report_batch({'repository': {'owner': 'o'}, 'reports': []})
+
+    assert exc_info.value.code == 400
+
+
+@pytest.mark.parametrize("reports, top_k", [
+    (["first"], 3),
+    ([{'issue': 'first'}], "3"),
+    ([{'issue': 'first'}], -1),
+    ([{'issue': 'first'}], 10 ** 9),
+])
+def test_process_report_batch_invalid_reports_or_top_k(reports, top_k):
+    with pytest.raises(HTTPException) as exc_info:
+        report_service.process_report_batch({'repository': {'owner': 'o'}, 'reports': reports, 'top_k': top_k})
+
+    assert exc_info.value.code == 400
+
+
+def test_process_report_batch_ranks_gui_reports_against_their_corpus():
+    rng = np.random.default_rng(0)
+    db_embeddings = [(f"repos/o/r/File{i}.java", rng.standard_normal((2, 16)).astype(np.float32)) for i in range(8)]
+    repo_matrix = RankingMatrix.from_embeddings(db_embeddings, "fp32")
+    data = {
+        'repository': {'repo_url': 'https://github.com/o/r.git', 'owner': 'o', 'repo_name': 'r',
+                       'default_branch': 'main', 'latest_commit_sha': 'abc123'},
+        'reports': [{'issue': 'first', 'trace': 'trace'}, {'issue': 'second'}, {'issue': 'third', 'trace': 'trace'}],
+    }
+    corpus = ["repos/o/r/File5.java", "repos/o/r/File6.java"]
+
+    with Flask(__name__).app_context(), \
+            patch.object(report_service, "ProbotMessenger"), \
+            patch.object(report_service, "extract_sc_terms", side_effect=lambda trace: ["sc"] if trace else []), \
+            patch.object(report_service, "extract_gs_terms", side_effect=lambda trace: ["gs"] if trace else []), \
+            patch.object(report_service, "preprocess_bug_reports",
+                         return_value=(["first", "second", "third"], [e[:1] for _, e in db_embeddings[:3]])), \
+            patch.object(report_service, "update_outdated_embeddings", return_value=None), \
+            patch.object(report_service, "fetch_repo_projection", return_value=None), \
+            patch.object(report_service, "retrieve_repo_file_contents", return_value=[]), \
+            patch.object(report_service, "build_corpus", return_value=corpus), \
+            patch.object(report_service, "get_boosted_files", return_value=[]), \
+            patch.object(report_service, "fetch_ranking_matrix", return_value=repo_matrix), \
+            patch.object(report_service, "get_bug_localizer") as mock_localizer:
+        mock_localizer.return_value.rank_files_many.side_effect = \
+            lambda queries, matrix, top_k=None, query_terms=None: matrix.rank_many(queries, top_k, query_terms)
+        response, status = report_service.process_report_batch(data)
+
+    # The GUI reports are scored together against the corpus' matrix, the other one against the repository
+    calls = mock_localizer.return_value.rank_files_many.call_args_list
+    assert status == 200
+    assert sorted(len(call.args[0]) for call in calls) == [1, 2]
+    assert sorted(call.args[1].file_ids for call in calls) == sorted([corpus, repo_matrix.file_ids])
+    results = response.get_json()["results"]
+    assert {item[0] for item in results[0]["ranked_files"]} == set(corpus)
+    assert len(results[1]["ranked_files"]) == 8
+
+
+def test_process_report_reuses_cached_ranking():
+    rng = np.random.default_rng(0)
+    db_embeddings = [(f"repos/o/r/File{i}.java", rng.standard_normal((2, 16)).astype(np.float32)) for i in range(4)]
+    repo_matrix = RankingMatrix.from_embeddings(db_embeddings, "fp32")
+    data = {
+        'repository': {'repo_url': 'https://github.com/o/r.git', 'owner': 'o', 'repo_name': 'r',
+                       'default_branch': 'main', 'latest_commit_sha': 'abc123'},
+        'issue': 'login crash'
+    }
+
+    with Flask(__name__).app_context(), \
+            patch.object(report_service, "ProbotMessenger"), \
+            patch.object(report_service, "result_cache", ResultCache()), \
+            patch.object(report_service, "retrieve_repo_generation", return_value="1"), \
+            patch.object(report_service, "write_file_for_report_processing", return_value="report.txt"), \
+            patch.object(report_service, "preprocess_bug_report", return_value=("login crash", None)), \
+            patch.object(report_service, "get_encoder_service") as mock_encoder, \
+            patch.object(report_service, "update_outdated_embeddings", return_value=None), \
+            patch.object(report_service, "fetch_repo_projection", return_value=None), \
+            patch.object(report_service, "fetch_ranking_matrix", return_value=repo_matrix) as mock_fetch, \
+            patch.object(report_service, "get_bug_localizer") as mock_localizer:
+        mock_encoder.return_value.encode_text.return_value = db_embeddings[2][1]
+        mock_localizer.return_value.rank_files.side_effect = \
+            lambda query, matrix, top_k=None, query_terms=None: matrix.rank(query, top_k, query_terms)
+        first, _ = report_service.process_report(data)
+        second, status = report_service.process_report(data)
+
+    assert status == 200
+    assert first.get_json()["ranked_files"][0][0] == "repos/o/r/File2.java"
+    assert second.get_json()["ranked_files"] == first.get_json()["ranked_files"]
+    mock_encoder.return_value.encode_text.assert_called_once_with("login crash")
+    mock_fetch.assert_called_once()
+
+
+@pytest.mark.parametrize("trace, gui_data", [(None, False), ({"trace": "x"}, True)])
+def test_process_report_returns_failed_matrix_fetch(trace, gui_data):
+    data = {
+        'repository': {'repo_url': 'https://github.com/o/r.git', 'owner': 'o', 'repo_name': 'r',
+                       'default_branch': 'main', 'latest_commit_sha': 'abc123'},
+        'issue': 'login crash',
+        'trace': trace
+    }
+
+    with Flask(__name__).app_context():
+        error_response = (jsonify({"message": "Failed to find repo."}), 405)
+        with patch.object(report_service, "ProbotMessenger"), \
+                patch.object(report_service, "result_cache", ResultCache()), \
+                patch.object(report_service, "retrieve_repo_generation", return_value="1"), \
+                patch.object(report_service, "extract_sc_terms", return_value=["sc"] if gui_data else []), \
+                patch.object(report_service, "extract_gs_terms", return_value=["gs"] if gui_data else []), \
+                patch.object(report_service, "write_file_for_report_processing", return_value="report.txt"), \
+                patch.object(report_service, "preprocess_bug_report", return_value=("login crash", None)), \
+                patch.object(report_service, "get_encoder_service") as mock_encoder, \
+                patch.object(report_service, "update_outdated_embeddings", return_value=None), \
+                patch.object(report_service, "fetch_repo_projection", return_value=None), \
+                patch.object(report_service, "retrieve_repo_file_contents", return_value=[]), \
+                patch.object(report_service, "build_corpus", return_value=[]), \
+                patch.object(report_service, "get_boosted_files", return_value=[]), \
+                patch.object(report_service, "fetch_ranking_matrix", return_value=error_response), \
+                patch.object(report_service, "get_bug_localizer") as mock_localizer:
+            mock_encoder.return_value.encode_text.return_value = np.ones((1, 4), dtype=np.float32)
+            response = report_service.process_report(data)
+
+    assert response == error_response
+    mock_localizer.return_value.rank_files.assert_not_called()
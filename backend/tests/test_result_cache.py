@@ -0,0 +1,56 @@
+import numpy as np
+
+from experimental_unixcoder.result_cache import ResultCache, result_key
+
+def key(report="login crash", commit_sha="sha1", sc_terms=None, repo_name="repo", generation="1"):
+    return result_key("owner", repo_name, commit_sha, report, sc_terms or ["LoginActivity"], ["login"], generation)
+
+def test_result_key_hashes_report_and_terms():
+    assert key() == key()
+    assert key()[:4] == ("owner", "repo", "sha1", "1")
+    assert key("login crash twice") != key()
+    assert key(sc_terms=["Other"]) != key()
+    assert result_key("o", "r", "s", "text", ["b", "a"], []) == result_key("o", "r", "s", "text", ["a", "b"], [])
+
+def test_result_cache_exact_hit_and_miss():
+    cache = ResultCache(2)
+    ranked_files = [("File.java", 0.9)]
+
+    assert cache.get(key()) is None
+    cache.put(key(), ranked_files)
+
+    assert cache.get(key()) == ranked_files
+    assert cache.get(key(commit_sha="sha2")) is None
+    assert cache.get(key(generation="2")) is None
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 3
+
+def test_result_cache_matches_near_duplicates():
+    cache = ResultCache(4, similarity=0.98)
+    rng = np.random.default_rng(0)
+    embeddings = rng.standard_normal((3, 16)).astype(np.float32)
+    cache.put(key(), [("File.java", 0.9)], embeddings)
+
+    near = embeddings + 0.01 * rng.standard_normal(embeddings.shape).astype(np.float32)
+    assert cache.get_similar(key("login crash again"), near) == [("File.java", 0.9)]
+    assert cache.get_similar(key("other"), rng.standard_normal((3, 16)).astype(np.float32)) is None
+    # Near duplicates must share the repository, commit, generation and terms
+    assert cache.get_similar(key("login crash again", commit_sha="sha2"), near) is None
+    assert cache.get_similar(key("login crash again", generation="2"), near) is None
+    assert cache.get_similar(key("login crash again", sc_terms=["Other"]), near) is None
+    # Misses are only counted by the exact lookup, once per report
+    assert cache.stats()["near_hits"] == 1 and cache.stats()["misses"] == 0
+
+def test_result_cache_evicts_and_invalidates():
+    cache = ResultCache(2, similarity=0)
+    cache.put(key("a"), [])
+    cache.put(key("b"), [])
+    cache.get(key("a"))
+    cache.put(key("c"), [])
+
+    assert cache.get(key("b")) is None
+    assert cache.get_similar(key("b"), np.ones((1, 4))) is None
+
+    cache.put(key("d", repo_name="other"), [])
+    cache.invalidate("owner", "repo")
+    assert cache.stats()["entries"] == 1
+    assert cache.get(key("d", repo_name="other")) == []
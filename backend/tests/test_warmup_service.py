@@ -0,0 +1,53 @@
+import threading
+import pytest
+from unittest.mock import MagicMock, patch
+
+import services.warmup_service as warmup_service
+
+@pytest.fixture
+def cold_process(monkeypatch):
+    """Resets the warm-up state so each test starts from a cold process."""
+    monkeypatch.setattr(warmup_service, "_ready", threading.Event())
+    monkeypatch.setattr(warmup_service, "_status", {"state": "pending", "steps": {}, "error": None})
+    monkeypatch.setattr(warmup_service, "_thread", None)
+
+def test_disabled_warm_up_is_ready_immediately(cold_process):
+    warmup_service.start_warm_up(0)
+
+    assert warmup_service.is_ready()
+    assert warmup_service.get_warm_up_status()["state"] == "ready"
+
+def test_warm_up_runs_every_step_before_ready(cold_process):
+    mock_localizer = MagicMock()
+    mock_database = MagicMock()
+    with patch.object(warmup_service, "get_encoder_service") as mock_service, \
+            patch.object(warmup_service, "get_bug_localizer", return_value=mock_localizer), \
+            patch.object(warmup_service.Preprocessor, "lemmatize_tokens") as mock_lemmatize, \
+            patch.object(warmup_service, "Database", return_value=mock_database):
+        assert not warmup_service.is_ready()
+        warmup_service.start_warm_up(1)
+        warmup_service._thread.join(timeout=5)
+
+    mock_service.assert_called_once()
+    mock_localizer.backend.encode_texts.assert_called_once_with([warmup_service.WARM_UP_TEXT])
+    mock_lemmatize.assert_called_once()
+    mock_database.ping.assert_called_once()
+
+    status = warmup_service.get_warm_up_status()
+    assert warmup_service.is_ready()
+    assert status["state"] == "ready"
+    assert list(status["steps"]) == ["model", "encode", "nltk", "database"]
+
+def test_failed_warm_up_stays_unready(cold_process):
+    mock_database = MagicMock()
+    mock_database.ping.side_effect = ConnectionError("no route to host")
+    with patch.object(warmup_service, "get_encoder_service"), \
+            patch.object(warmup_service, "get_bug_localizer"), \
+            patch.object(warmup_service.Preprocessor, "lemmatize_tokens"), \
+            patch.object(warmup_service, "Database", return_value=mock_database):
+        warmup_service.warm_up()
+
+    status = warmup_service.get_warm_up_status()
+    assert not warmup_service.is_ready()
+    assert status["state"] == "failed"
+    assert status["error"] == "database: no route to host"
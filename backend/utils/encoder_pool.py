@@ -0,0 +1,76 @@
+import logging
+import multiprocessing
+import os
+import torch
+
+logger = logging.getLogger(__name__)
+
+# Number of encoder processes; 1 encodes in the calling process
+ENCODER_WORKERS = int(os.environ.get("ENCODER_WORKERS") or 1)
+# Intra-op threads per encoder process; 0 splits the cores evenly between the workers
+ENCODER_THREADS = int(os.environ.get("ENCODER_THREADS") or 0)
+
+
+def threads_per_worker(workers, threads=ENCODER_THREADS):
+    """
+    Gets the number of torch threads each worker should use, so that workers x threads
+    matches the number of cores unless a thread count is configured explicitly.
+
+    Args:
+        workers (int): Number of worker processes
+        threads (int): Configured threads per worker, or 0 to split the cores evenly
+
+    Returns:
+        int: Threads per worker
+    """
+    if threads > 0:
+        return threads
+    return max(1, (os.cpu_count() or 1) // max(1, workers))
+
+
+def _initialize_worker(threads):
+    torch.set_num_threads(threads)
+
+
+def map_in_pool(func, tasks, workers=ENCODER_WORKERS, threads=ENCODER_THREADS):
+    """
+    Runs func on every task in a pool of worker processes. Results are returned in task
+    order as soon as they are ready, so callers can store early results while later tasks
+    are still being encoded. The workers are stopped once the results are consumed, or when
+    the caller stops iterating early or raises. Falls back to running in the calling process
+    when only one worker is configured or the pool cannot be started.
+
+    Args:
+        func (callable): A picklable, module-level function taking one task
+        tasks (list): The tasks to run
+        workers (int): Number of worker processes
+        threads (int): Torch threads per worker, or 0 to split the cores evenly
+
+    Returns:
+        iterator: func(task) for each task, in order
+    """
+    if workers <= 1 or len(tasks) <= 1:
+        return map(func, tasks)
+
+    # Spawned workers do not inherit torch thread pools or CUDA state from the parent
+    context = multiprocessing.get_context("spawn")
+    worker_threads = threads_per_worker(workers, threads)
+    try:
+        pool = context.Pool(workers, initializer=_initialize_worker, initargs=(worker_threads,))
+    except OSError as e:
+        logger.warning(f"Could not start encoder pool, encoding in process instead: {e}")
+        return map(func, tasks)
+
+    logger.info(f"Encoding {len(tasks)} tasks with {workers} workers x {worker_threads} threads.")
+    results = pool.imap(func, tasks)
+    pool.close()  # Workers exit once every task has been processed
+    return _iter_results(pool, results)
+
+
+def _iter_results(pool, results):
+    try:
+        yield from results
+    finally:
+        # Also runs when the generator is closed early, so abandoned workers do not leak
+        pool.terminate()
+        pool.join()
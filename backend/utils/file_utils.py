@@ -26,14 +26,25 @@ def clean_embedding_paths_for_db(preprocessed_files, repo_dir):
     # This converts it into an easily printable form and removes the repo_dir prefix
     clean_files = []
     for file in preprocessed_files:
-        clean_file = {
-            'path': str(file[0]).replace(repo_dir + '/', ''),
-            'name': file[1],
-            'embedding_text': file[2]
-        }
-        clean_files.append(clean_file)
+        clean_files.append(clean_embedding_path_for_db(file, repo_dir))
     return clean_files
 
+def clean_embedding_path_for_db(preprocessed_file, repo_dir):
+    """
+    Cleans up the file path of a single preprocessed file by removing the repo_dir prefix.
+
+    :param preprocessed_file: A preprocessed file tuple of (file_path, file_name, embeddings), with the
+                              term counts of the file as a fourth element if they were counted.
+    :param repo_dir: The directory of the repository.
+    :return: A dictionary with the path, name, embedding_text and terms (or None) of the file.
+    """
+    return {
+        'path': str(preprocessed_file[0]).replace(repo_dir + '/', ''),
+        'name': preprocessed_file[1],
+        'embedding_text': preprocessed_file[2],
+        'terms': preprocessed_file[3] if len(preprocessed_file) > 3 else None
+    }
+
 def write_file_for_report_processing(repo_name, issue_content):
     """
     Writes the issue content to a report file in the specified repository's report directory.
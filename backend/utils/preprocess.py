@@ -1,13 +1,161 @@
+import logging
+import os
 import re
+from functools import lru_cache
+from pathlib import Path
 from nltk.stem import WordNetLemmatizer
 from nltk.tokenize import wordpunct_tokenize
-from nltk.corpus import wordnet as wn
-from nltk import pos_tag
-from experimental_unixcoder.bug_localization import BugLocalization
+from nltk import pos_tag, pos_tag_sents
+from experimental_unixcoder.bug_localization import INFERENCE_MODE
+from experimental_unixcoder.model_registry import get_bug_localizer, get_encoder_service
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of (token, POS tag) pairs whose lemma is memoized per process
+LEMMA_CACHE_SIZE = int(os.environ.get("LEMMA_CACHE_SIZE") or 100000)
+# Precomputed token -> lemma table built by build_lemma_table.py; tokens it does not hold fall back to NLTK
+LEMMA_TABLE_PATH = os.environ.get("LEMMA_TABLE_PATH") or \
+    str(Path(__file__).parent / "../data/lemmas/java-identifiers.tsv")
+# Tokens of context POS-tagged on each side of the tokens missing from the lemma table; the perceptron
+# tagger's features look two tokens to either side. Negative values tag the whole document
+LEMMA_TAG_CONTEXT = int(os.environ.get("LEMMA_TAG_CONTEXT") or 2)
+
+# Compiled once per process instead of on every call
+CAMEL_CASE_PATTERN = re.compile('.+?(?:(?<=[a-z])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])|$)')
+SPECIAL_CHARACTERS_PATTERN = re.compile(r"[^A-Za-z\s]+")
+
+# WordNet's POS constants (wn.ADJ, wn.NOUN, wn.VERB, wn.ADV), which would load WordNet on first access
+ADJ, NOUN, VERB, ADV = 'a', 'n', 'v', 'r'
+
+lemmatizer = WordNetLemmatizer()
+lemma_table_stats = {"hits": 0, "misses": 0}
+
+
+@lru_cache(maxsize=None)
+def load_stop_words(stop_words_path):
+    """
+    Reads a stop words file once per process.
+
+    Args:
+        stop_words_path (string): path to a stop words file
+
+    Returns:
+        frozenset: the stop words
+
+    Raises:
+        FileNotFoundError: if the stop words file does not exist
+    """
+    with open(stop_words_path) as f:
+        return frozenset(f.read().splitlines())
+
+
+@lru_cache(maxsize=None)
+def load_lemma_table(lemma_table_path=LEMMA_TABLE_PATH):
+    """
+    Reads a lemma table once per process. Each line holds a token and its lemma separated by a
+    tab; lines starting with # are comments.
+
+    Args:
+        lemma_table_path (string): path to the lemma table
+
+    Returns:
+        dict: token to lemma, empty if the table was not found
+    """
+    try:
+        with open(lemma_table_path) as f:
+            return dict(line.rstrip("\n").split("\t") for line in f if line.strip() and not line.startswith("#"))
+    except FileNotFoundError:
+        logger.warning(f"No lemma table at '{lemma_table_path}', lemmatizing every token with NLTK.")
+        return {}
+
+
+def get_lemma_table_stats():
+    """
+    Gets the lemma table counters of this process.
+
+    Returns:
+        dict: table hits, misses (tokens lemmatized by NLTK), the hit rate and the table's size
+    """
+    lookups = lemma_table_stats["hits"] + lemma_table_stats["misses"]
+    return {
+        "hits": lemma_table_stats["hits"],
+        "misses": lemma_table_stats["misses"],
+        "hit_rate": lemma_table_stats["hits"] / lookups if lookups else 0.0,
+        "entries": len(load_lemma_table()),
+    }
+
+
+@lru_cache(maxsize=LEMMA_CACHE_SIZE)
+def lemmatize(token, wordnet_tag):
+    """
+    Lemmatizes a token with its WordNet POS tag. The lemmas of the most recently used
+    LEMMA_CACHE_SIZE (token, tag) pairs are memoized, since identifiers repeat across files.
+
+    Args:
+        token (string): token to be lemmatized
+        wordnet_tag (string): WordNet tag constant (i.e. wn.NOUN -> 'n')
+
+    Returns:
+        string: the lemma
+    """
+    return lemmatizer.lemmatize(token, wordnet_tag)
+
+
+def to_wordnet_tag(tag):
+    """
+    Maps a Penn Treebank POS tag as returned by pos_tag to its WordNet tag constant
+
+    Args:
+        tag (string): Penn Treebank tag (i.e. 'VBG')
+
+    Returns:
+        WordNet tag constant (i.e. wn.VERB -> 'v'), wn.NOUN if there is no match
+    """
+
+    if tag.startswith('JJ'):
+        return ADJ
+    elif tag.startswith('NN'):
+        return NOUN
+    elif tag.startswith('VB'):
+        return VERB
+    elif tag.startswith('RB'):
+        return ADV
+    # If no matches, default to noun
+    else:
+        return NOUN
+
+
+def unseen_spans(lemmas, context=LEMMA_TAG_CONTEXT):
+    """
+    Finds the spans of a document to POS-tag for the tokens missing from the lemma table: each
+    missing token with context tokens on either side, merging spans that overlap or touch
+
+    Args:
+        lemmas (list): the table lemma of each token, None for the missing ones
+        context (int): tokens of context on each side, negative for the whole document
+
+    Returns:
+        list of (start, end) tuples: the spans, in order
+    """
+
+    spans = []
+    for i, lemma in enumerate(lemmas):
+        if lemma is not None:
+            continue
+        start, end = (0, len(lemmas)) if context < 0 else (max(0, i - context), min(len(lemmas), i + context + 1))
+        if spans and start <= spans[-1][1]:
+            spans[-1] = (spans[-1][0], max(spans[-1][1], end))
+        else:
+            spans.append((start, end))
+    return spans
+
 
 class Preprocessor:
-    def __init__(self):
-        self.bug_localizer = BugLocalization()
+    def __init__(self, inference_mode=INFERENCE_MODE):
+        # Share one UniXcoder instance per process instead of loading it for every Preprocessor
+        self.bug_localizer = get_bug_localizer(inference_mode)
+        # Single texts from concurrent requests are encoded together in micro-batches
+        self.encoder_service = get_encoder_service(inference_mode)
 
     def camel_case_split(identifier):
         """
@@ -20,7 +168,7 @@ class Preprocessor:
             list: split tokens
         """
 
-        matches = re.finditer('.+?(?:(?<=[a-z])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])|$)', identifier)
+        matches = CAMEL_CASE_PATTERN.finditer(identifier)
         return [m.group(0) for m in matches]
     
     def tokenize_text(text):
@@ -60,7 +208,7 @@ class Preprocessor:
         text = text.replace("\n", " ")
 
         # Replace special characters and numbers with a ' '
-        text = re.sub("[^A-Za-z\s]+", " ", text)
+        text = SPECIAL_CHARACTERS_PATTERN.sub(" ", text)
         return text
     
     def get_pos_tag(token):
@@ -76,38 +224,44 @@ class Preprocessor:
         
         # Get the POS tag from the pos_tag function
         # pos_tag returns a tuple so we index [0][1] to return the tag of a single token
-        tag = pos_tag([token])[0][1]
-
-        if tag.startswith('JJ'):
-            return wn.ADJ
-        elif tag.startswith('NN'):
-            return wn.NOUN
-        elif tag.startswith('VB'):
-            return wn.VERB
-        elif tag.startswith('RB'):
-            return wn.ADV
-        # If no matches, default to noun
-        else:
-            return wn.NOUN
+        return to_wordnet_tag(pos_tag([token])[0][1])
         
-    def lemmatize_tokens(tokens):
+    def lemmatize_tokens(tokens, context=LEMMA_TAG_CONTEXT):
         '''
-        Lemmatizes a list of tokens with their POS tag
+        Lemmatizes a list of tokens. Tokens in the lemma table are looked up; the others are tagged
+        together with context tokens on either side, all spans of a document in one pos_tag_sents
+        call, and lemmatized with their POS tag
 
         Args:
             tokens (list of strings): tokens to be lemmatized
+            context (int): tokens of context tagged on each side of unseen tokens, negative for the whole list
         
         Returns:
             tokens (list of strings): lemmatized tokens
         '''
-        lemmatizer = WordNetLemmatizer()
+        if not tokens:
+            return []
 
-        # Call the get_pos_tag function to assign the correct POS tag to each token in tokens
-        return [lemmatizer.lemmatize(token, Preprocessor.get_pos_tag(token)) for token in tokens]        
+        lemma_table = load_lemma_table()
+        lemmas = [lemma_table.get(token) for token in tokens]
+        unseen = sum(lemma is None for lemma in lemmas)
+        lemma_table_stats["hits"] += len(tokens) - unseen
+        lemma_table_stats["misses"] += unseen
+        if not unseen:
+            return lemmas
+
+        # Only the neighbourhoods of unseen tokens are tagged, so they mostly get the tags the whole
+        # document would give them; then look up the memoized lemma of each unseen (token, tag) pair
+        spans = unseen_spans(lemmas, context)
+        for (start, _), tagged in zip(spans, pos_tag_sents([tokens[start:end] for start, end in spans])):
+            for i, (token, tag) in enumerate(tagged, start):
+                if lemmas[i] is None:
+                    lemmas[i] = lemmatize(token, to_wordnet_tag(tag))
+        return lemmas
     
-    def preprocess_text(self, text, stop_words_path, verbose=True):
+    def normalize_text(self, text, stop_words_path, verbose=True):
         """
-        Preprocesses input text by
+        Normalizes input text by
             - Removing Numbers
             - Removing special characters
             - Removing punctuation
@@ -116,11 +270,11 @@ class Preprocessor:
             - Removing inputted stop words
 
         Args:
-            text (string): text to be preprocessed
+            text (string): text to be normalized
             stop_words (string): path to a stop words file
 
         Returns:
-            string: preprocessed text
+            string: normalized text, or None if the stop words file was not found
         """
 
         # Remove all special chars and punctuation from the text
@@ -130,9 +284,8 @@ class Preprocessor:
         tokens = Preprocessor.tokenize_text(text)
 
         try:
-            # Read stop words from the input
-            with open(stop_words_path) as f:
-                stop_words = set(f.read().splitlines())
+            # Read stop words from the input, once per process and file
+            stop_words = load_stop_words(stop_words_path)
         except FileNotFoundError:
             print(f"Error: The stop words at '{stop_words_path}' were not found.")
             return
@@ -150,12 +303,56 @@ class Preprocessor:
         tokens = [token for token in tokens if len(token) > 2]
 
         # Join the tokens into a single string and remove cases
-        preprocessed_text = " ".join(tokens)
+        normalized_text = " ".join(tokens)
 
         if verbose:
-            print(preprocessed_text)
+            print(normalized_text)
+
+        return normalized_text
+
+    def preprocess_text(self, text, stop_words_path, verbose=True, return_normalized=False):
+        """
+        Normalizes input text (see normalize_text) and calculates its embeddings. The text is
+        encoded through the shared encoder service, together with texts from concurrent requests.
+
+        Args:
+            text (string): text to be preprocessed
+            stop_words (string): path to a stop words file
+            return_normalized (bool): whether to also return the normalized text, e.g. for BM25
+
+        Returns:
+            numpy.ndarray: [chunks, hidden] float32 embeddings of the preprocessed text, or a
+                           tuple of the normalized text and the embeddings if return_normalized
+        """
+
+        normalized_text = self.normalize_text(text, stop_words_path, verbose=verbose)
+        if normalized_text is None:
+            return
 
         # Calculate embeddings for preprocessed text
-        preprocessed_text = self.bug_localizer.encode_text(preprocessed_text,verbose=verbose)
+        preprocessed_text = self.encoder_service.encode_text(normalized_text)
+
+        return (normalized_text, preprocessed_text) if return_normalized else preprocessed_text
+
+    def preprocess_texts(self, texts, stop_words_path, verbose=True, return_normalized=False):
+        """
+        Normalizes many input texts and calculates their embeddings in shared batches,
+        so that short texts do not each pay for their own forward passes. The forward passes
+        take turns with those of the encoder service under the bug localizer's encode lock.
+
+        Args:
+            texts (list of strings): texts to be preprocessed
+            stop_words (string): path to a stop words file
+            return_normalized (bool): whether to also return the normalized texts, e.g. for BM25
+
+        Returns:
+            list: one [chunks, hidden] float32 embeddings array per input text, or a tuple of the
+                  normalized texts and that list if return_normalized
+        """
+
+        normalized_texts = [self.normalize_text(text, stop_words_path, verbose=verbose) for text in texts]
+        if any(text is None for text in normalized_texts):
+            return
 
-        return preprocessed_text
\ No newline at end of file
+        embeddings = self.bug_localizer.encode_texts(normalized_texts, verbose=verbose)
+        return (normalized_texts, embeddings) if return_normalized else embeddings
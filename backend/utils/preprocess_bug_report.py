@@ -1,19 +1,25 @@
 import re
 from utils.preprocess import Preprocessor
+from experimental_unixcoder.bug_localization import INFERENCE_MODE
 from pathlib import Path
 
 # Main driver method for preprocessing bug reports
-def preprocess_bug_report(bug_report_path: str, sc_terms: list[str], verbose=True):
+def preprocess_bug_report(bug_report_path: str, sc_terms: list[str], verbose=True, inference_mode=INFERENCE_MODE,
+                          return_normalized=False, encode=True):
     """
     Preprocesses bug reports and applies query reformulation (MVP)
 
     Args:
         bug_report_path (str): The path to the bug report
+        inference_mode (str): The UniXcoder inference mode, "fp32" or "int8"
+        return_normalized (bool): Whether to also return the normalized bug report, e.g. for BM25
+        encode (bool): Whether to encode the bug report; if not, its embeddings are None
 
     Returns:
-        String: The preprocessed bug report
+        String: The preprocessed bug report, or a tuple of the normalized bug report and the
+                preprocessed bug report if return_normalized
     """
-    preprocessor = Preprocessor()
+    preprocessor = Preprocessor(inference_mode)
     stop_words_path = Path(__file__).parent / "../data/stop_words/java-keywords-bugs.txt"
 
     # Put bug report content into a string
@@ -24,6 +30,45 @@ def preprocess_bug_report(bug_report_path: str, sc_terms: list[str], verbose=Tru
         print(f"Error: The bug report at '{bug_report_path}' was not found.")
         return 
 
+    # Run bug report through preprocessor
+    bug_report_string = reformulate_bug_report(bug_report_string, sc_terms)
+    if not encode:
+        normalized_bug_report = preprocessor.normalize_text(bug_report_string, stop_words_path, verbose=verbose)
+        return (normalized_bug_report, None) if return_normalized else None
+    preprocessed_bug_report = preprocessor.preprocess_text(bug_report_string, stop_words_path, verbose=verbose,
+                                                           return_normalized=return_normalized)
+
+    # Return preprocessed bug report as a string
+    return preprocessed_bug_report
+
+
+def preprocess_bug_reports(bug_reports: list[str], sc_terms: list[list[str]], verbose=True,
+                           inference_mode=INFERENCE_MODE, return_normalized=False):
+    """
+    Preprocesses many bug reports, e.g. the open issues of a repository, and encodes them
+    together in shared batches instead of one encoder call per report.
+
+    Args:
+        bug_reports (list[str]): The bug report texts
+        sc_terms (list[list[str]]): The SC terms each bug report is expanded with
+        inference_mode (str): The UniXcoder inference mode, "fp32" or "int8"
+        return_normalized (bool): Whether to also return the normalized bug reports, e.g. for BM25
+
+    Returns:
+        list: One [chunks, hidden] embeddings array per bug report, or a tuple of the normalized
+              bug reports and that list if return_normalized
+    """
+    preprocessor = Preprocessor(inference_mode)
+    stop_words_path = Path(__file__).parent / "../data/stop_words/java-keywords-bugs.txt"
+
+    texts = [reformulate_bug_report(bug_report, terms) for bug_report, terms in zip(bug_reports, sc_terms)]
+    return preprocessor.preprocess_texts(texts, stop_words_path, verbose=verbose, return_normalized=return_normalized)
+
+
+def reformulate_bug_report(bug_report_string: str, sc_terms: list[str]):
+    """
+    Removes JSON attachment links from a bug report and expands it with SC terms.
+    """
     # Remove JSON attachment link if exists in the bug report
     json_url_pattern = r'\[[^\]]*\]\(https?:\/\/github\.com\/\S*?\.json\S*\)'
     bug_report_string = re.sub(json_url_pattern, '', bug_report_string, flags=re.IGNORECASE)
@@ -32,8 +77,4 @@ def preprocess_bug_report(bug_report_path: str, sc_terms: list[str], verbose=Tru
     for sc_term in sc_terms:
         bug_report_string += " " + sc_term
 
-    # Run bug report through preprocessor
-    preprocessed_bug_report = preprocessor.preprocess_text(bug_report_string, stop_words_path,verbose=verbose)
-
-    # Return preprocessed bug report as a string
-    return preprocessed_bug_report
\ No newline at end of file
+    return bug_report_string
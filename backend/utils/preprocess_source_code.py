@@ -1,37 +1,103 @@
+from functools import partial
+from itertools import chain
 from pathlib import Path
 from utils.preprocess import Preprocessor
+from utils.encoder_pool import ENCODER_THREADS, ENCODER_WORKERS, map_in_pool
+from experimental_unixcoder.bm25_index import term_counts
+from experimental_unixcoder.bug_localization import INFERENCE_MODE
 
-def preprocess_source_code(root, verbose=True):
+FILES_PER_TASK = 32  # Files preprocessed together; their chunks share encoder batches
+
+def preprocess_source_code(root, verbose=True, inference_mode=INFERENCE_MODE, workers=ENCODER_WORKERS,
+                           with_terms=False):
     """
     Preprocesses all source code files in a source code repository. Assumes all files contained
     in the root directory have had non-.java files filtered out.
 
     Args:
         root (string): path to the root directory of the source code repository
+        inference_mode (string): the UniXcoder inference mode, "fp32" or "int8"
+        workers (int): number of encoder processes, 1 encodes in this process
+        with_terms (bool): whether to add the term counts of each file's normalized text
 
     Returns:
         tuple (list): list of tuples mapping file name to preprocessed contents
     """
 
-    preprocessor = Preprocessor()
+    return list(iter_preprocess_source_code(root, verbose=verbose, inference_mode=inference_mode, workers=workers,
+                                            with_terms=with_terms))
 
-    preprocessed_files = []
+def iter_preprocess_source_code(root, verbose=True, inference_mode=INFERENCE_MODE, workers=ENCODER_WORKERS,
+                                threads=ENCODER_THREADS, with_terms=False):
+    """
+    Preprocesses all source code files in a source code repository, splitting the files across
+    a pool of encoder processes. Files are yielded in traversal order as soon as they are ready.
 
-    stop_words_path = Path(__file__).parent / "../data/stop_words/java-keywords-bugs.txt"
+    Args:
+        root (string): path to the root directory of the source code repository
+        inference_mode (string): the UniXcoder inference mode, "fp32" or "int8"
+        workers (int): number of encoder processes, 1 encodes in this process
+        threads (int): torch threads per encoder process, 0 splits the cores evenly
+        with_terms (bool): whether to add the term counts of each file's normalized text
+
+    Returns:
+        iterator: tuples of (file_path, file_name, preprocessed contents), with the term counts
+                  as a fourth element if with_terms
+    """
 
     repo = Path(root)
 
     # Traverse the root directory
-    for file_path in repo.rglob("*"):
-        if file_path.is_file():
-            # Read and preprocess source code file and append it to the output list
-            try: 
-                with open(file_path, "r", encoding="utf-8") as f:
-                    file_content = f.read()
-                    preprocessed_file_content = preprocessor.preprocess_text(file_content, stop_words_path, verbose=verbose)
-                    preprocessed_files.append((file_path, file_path.name, preprocessed_file_content))
-            except FileNotFoundError:
-                print(f"Error: The source code file at '{file_path}' was not found.")
-                return
-
-    return preprocessed_files
\ No newline at end of file
+    file_paths = [file_path for file_path in repo.rglob("*") if file_path.is_file()]
+    tasks = [file_paths[i:i + FILES_PER_TASK] for i in range(0, len(file_paths), FILES_PER_TASK)]
+
+    preprocess = partial(preprocess_source_files, verbose=verbose, inference_mode=inference_mode, with_terms=with_terms)
+    return chain.from_iterable(map_in_pool(preprocess, tasks, workers=workers, threads=threads))
+
+def preprocess_source_files(file_paths, verbose=True, inference_mode=INFERENCE_MODE, with_terms=False):
+    """
+    Reads and preprocesses a group of source code files in the current process, batching the
+    chunks of all files through the encoder together.
+
+    Args:
+        file_paths (list): paths of the source code files
+        inference_mode (string): the UniXcoder inference mode, "fp32" or "int8"
+        with_terms (bool): whether to add the term counts of each file's normalized text
+
+    Returns:
+        tuple (list): list of tuples mapping file name to preprocessed contents
+    """
+
+    preprocessor = Preprocessor(inference_mode)
+
+    preprocessed_files = []
+
+    stop_words_path = Path(__file__).parent / "../data/stop_words/java-keywords-bugs.txt"
+
+    read_paths = []
+    file_contents = []
+
+    for file_path in file_paths:
+        # Read source code file; all files are encoded together afterwards
+        try:
+            with open(file_path, "r", encoding="utf-8") as f:
+                file_contents.append(f.read())
+                read_paths.append(file_path)
+        except FileNotFoundError:
+            print(f"Error: The source code file at '{file_path}' was not found.")
+
+    # Preprocess every file, batching the chunks of all files through the encoder
+    preprocessed = preprocessor.preprocess_texts(file_contents, stop_words_path, verbose=verbose,
+                                                 return_normalized=True)
+    normalized_contents, preprocessed_contents = preprocessed if preprocessed is not None else \
+        ([None] * len(read_paths), [None] * len(read_paths))
+
+    for file_path, normalized_content, preprocessed_file_content in \
+            zip(read_paths, normalized_contents, preprocessed_contents):
+        if with_terms:
+            preprocessed_files.append((file_path, file_path.name, preprocessed_file_content,
+                                       term_counts(normalized_content)))
+        else:
+            preprocessed_files.append((file_path, file_path.name, preprocessed_file_content))
+
+    return preprocessed_files